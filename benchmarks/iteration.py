@@ -0,0 +1,45 @@
+"""Measures the time per element, in nanoseconds, of a `for` loop over the containers, compared with a loop over a
+Python list of the same items.
+
+Run from the repository root with: python -m benchmarks.iteration
+"""
+import time
+from src.data_structures import Array, Vector, Set, Map
+from src.data_structures.map import _MapEntry
+
+NUM_ITEMS = 200_000
+REPEATS = 5
+
+
+def per_element(container) -> float:
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in container:
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best / NUM_ITEMS * 1e9
+
+
+def main() -> None:
+    items = list(range(NUM_ITEMS))
+    array = Array.from_iterable(items)
+    typed_array = Array.from_iterable(items, dtype='i8')
+    vector = Vector()
+    for item in items:
+        vector.append(item)
+    # Set.add() and Map.add() search the whole container, so they are filled directly
+    set_ = Set()
+    set_._list.extend(items)
+    map_ = Map()
+    for item in items:
+        map_._entry_list.append(_MapEntry(item, item))
+    containers = [('list', items), ('Array', array), ('Array i8', typed_array), ('Vector', vector), ('Set', set_),
+                  ('Map', map_)]
+    print(f"{'container':>10} {'ns/item':>8}")
+    for name, container in containers:
+        print(f"{name:>10} {per_element(container):8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Compares the matrix product kernels on random square matrices and prints the running times, in seconds, to find the
+crossover points between the naive triple loop, the blocked kernel and the Strassen recursion.
+
+Run from the repository root with: python -m benchmarks.matrix_product
+"""
+import random
+import time
+from src.data_structures import Matrix
+from src.data_structures.matrix_product import blocked_product, strassen_product
+
+
+def naive_product(a: Matrix, b: Matrix) -> Matrix:
+    result = Matrix(a.num_rows, b.num_cols)
+    for i in range(a.num_rows):
+        for k in range(b.num_cols):
+            r_ik = 0
+            for j in range(a.num_cols):
+                r_ik += a[i, j] * b[j, k]
+            result[i, k] = r_ik
+    return result
+
+
+def timeit(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'size':>6} {'naive':>10} {'blocked':>10} {'strassen':>10}")
+    for size in [32, 64, 128, 256, 512]:
+        a = [random.random() for _ in range(size * size)]
+        b = [random.random() for _ in range(size * size)]
+        if size <= 128:
+            ma, mb = Matrix._from_flat(size, size, a), Matrix._from_flat(size, size, b)
+            naive = f"{timeit(naive_product, ma, mb):10.4f}"
+        else:
+            naive = f"{'-':>10}"
+        blocked = timeit(blocked_product, a, b, size, size, size)
+        # a single level of recursion: the halves are computed by the blocked kernel
+        strassen = timeit(strassen_product, a, b, size, size, size, size)
+        print(f"{size:>6} {naive} {blocked:10.4f} {strassen:10.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,3 @@
-from searching import linear_search, sorted_linear_search, binary_search
-from sorting import bubble_sort, selection_sort
+from .searching import linear_search, sorted_linear_search, binary_search
+from .sorting import bubble_sort, selection_sort, intro_sort, merge_sort, counting_sort, lsd_radix_sort, \
+    msd_radix_sort, bucket_sort, sort
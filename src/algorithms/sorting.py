@@ -1,6 +1,20 @@
-from typing import MutableSequence, TypeVar
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from heapq import heapify, heappop
+from itertools import accumulate, chain
+from math import isfinite
+from typing import MutableSequence, TypeVar, Optional, Callable, Any
+from ..data_structures import Array
 T = TypeVar('T')
 
+try:
+    import numpy
+except ImportError:  # NumPy is optional, without it every sort runs in pure Python
+    numpy = None
+
+# typed arrays are sorted by NumPy when it is installed, unless this flag is turned off
+use_numpy: bool = True
+
 
 def bubble_sort(collection: MutableSequence[T]) -> None:
     """Iterates over the elements of the given collection multiple times, each time the largest element is swapped to
@@ -53,3 +67,612 @@ def selection_sort(collection: MutableSequence[T]) -> None:
         tmp = collection[i]
         collection[i] = collection[min_ndx]
         collection[min_ndx] = tmp
+
+
+# ranges with at most this many elements are sorted by insertion sort, in both intro_sort() and merge_sort()
+_INSERTION_THRESHOLD = 32
+
+# merge_sort() switches to galloping when one run wins this many comparisons in a row
+_MIN_GALLOP = 7
+
+# sort() distributes the keys only when there are at least this many of them
+_MIN_DISTRIBUTION = 256
+
+
+def _load(collection: MutableSequence[T], key: Optional[Callable[[T], Any]], reverse: bool) -> tuple[list, list]:
+    """Helper function that reads the collection into a list, once, and prepares the values to sort.
+
+    With a `key`, the values are the pairs (key, position): the position breaks the ties, so the items are never
+    compared and the pairs can be sorted by any algorithm. With `reverse`, the items are reversed first: sorting them
+    in ascending order with a stable algorithm and reversing the result gives the descending order with the equal
+    items in their original order.
+
+    Returns:
+        The list of items and the list of values to sort in ascending order.
+    """
+    items = list(collection)
+    if reverse:
+        items.reverse()
+    if key is None:
+        return items, items
+    return items, [(key(item), i) for i, item in enumerate(items)]
+
+
+def _write(collection: MutableSequence[T], items: list) -> None:
+    """Helper function that writes the items into the collection, with a single slice assignment if possible."""
+    if isinstance(collection, (list, Array)):
+        collection[:] = items
+    else:
+        for i, item in enumerate(items):
+            collection[i] = item
+
+
+def _store(collection: MutableSequence[T], items: list, values: list, key: Optional[Callable[[T], Any]],
+           reverse: bool) -> None:
+    """Helper function that writes back into the collection the items in the order of the sorted values."""
+    if key is not None:
+        items = [items[i] for _, i in values]
+    if reverse:
+        items.reverse()
+    _write(collection, items)
+
+
+def _insertion_sort(values: list, lo: int, hi: int, start: int) -> None:
+    """Helper function that sorts values[lo:hi], whose prefix values[lo:start] is already sorted, with a binary
+    insertion sort: the position of each value is found with a binary search, and the larger values are shifted with
+    a single slice assignment. Equal values keep their order.
+    """
+    for i in range(max(start, lo + 1), hi):
+        value = values[i]
+        position = bisect_right(values, value, lo, i)
+        if position < i:
+            values[position + 1:i + 1] = values[position:i]
+            values[position] = value
+
+
+def _heap_sort(values: list, lo: int, hi: int) -> None:
+    """Helper function that sorts values[lo:hi] in O(n log n) time in the worst case."""
+    heap = values[lo:hi]
+    heapify(heap)
+    values[lo:hi] = [heappop(heap) for _ in range(hi - lo)]
+
+
+def _partition(values: list, lo: int, hi: int) -> int:
+    """Helper function that partitions values[lo:hi] around the median of its first, middle and last values (Hoare
+    scheme). Sorting the three values first makes the first and the last one sentinels of the scans.
+
+    Returns:
+        The index p such that every value in values[lo:p+1] is less than or equal to every value in values[p+1:hi].
+    """
+    mid = (lo + hi - 1) // 2
+    last = hi - 1
+    if values[mid] < values[lo]:
+        values[lo], values[mid] = values[mid], values[lo]
+    if values[last] < values[mid]:
+        values[mid], values[last] = values[last], values[mid]
+        if values[mid] < values[lo]:
+            values[lo], values[mid] = values[mid], values[lo]
+    pivot = values[mid]
+    i = lo
+    j = last
+    while True:
+        i += 1
+        while values[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < values[j]:
+            j -= 1
+        if i >= j:
+            return j
+        values[i], values[j] = values[j], values[i]
+
+
+def intro_sort(collection: MutableSequence[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+    """Sorts the collection in place with the introsort algorithm, which is not stable. It is a quicksort that
+    partitions around the median of three values, recursing only into the smaller part (so the stack depth is
+    O(log n)) and sorting the small ranges by insertion sort. If the recursion gets deeper than 2*log2(n), which
+    happens only with adversarial inputs, the range is sorted by heapsort instead, so the time complexity is
+    O(n log n) in the worst case.
+
+    The collection is read once into a list, sorted there, and written back, so it can be any mutable sequence,
+    e.g. a list, an `Array` or a `Vector`.
+
+    Args:
+        collection: a collection of elements, it implements the __len__, __iter__ and __setitem__ dunder methods.
+        key: a function that computes from each element the value it is compared by, if None the elements themselves.
+        reverse: if True the elements are sorted in descending order.
+    """
+    items, values = _load(collection, key, reverse)
+    stack = [(0, len(values), 2 * len(values).bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo > _INSERTION_THRESHOLD:
+            if depth == 0:
+                _heap_sort(values, lo, hi)
+                break
+            depth -= 1
+            p = _partition(values, lo, hi)
+            # postpone the larger part, so that the stack holds O(log n) ranges
+            if p + 1 - lo < hi - p - 1:
+                stack.append((p + 1, hi, depth))
+                hi = p + 1
+            else:
+                stack.append((lo, p + 1, depth))
+                lo = p + 1
+        else:
+            _insertion_sort(values, lo, hi, lo + 1)
+    _store(collection, items, values, key, reverse)
+
+
+def _count_run(values: list, lo: int, hi: int) -> int:
+    """Helper function that finds the length of the run starting at `lo`: the longest non-descending, or strictly
+    descending, sequence of values. A descending run is reversed in place; being strictly descending, reversing it
+    does not change the order of equal values.
+
+    Returns:
+        The length of the run.
+    """
+    i = lo + 1
+    if i == hi:
+        return 1
+    if values[i] < values[lo]:
+        while i + 1 < hi and values[i + 1] < values[i]:
+            i += 1
+        values[lo:i + 1] = values[lo:i + 1][::-1]
+    else:
+        while i + 1 < hi and not values[i + 1] < values[i]:
+            i += 1
+    return i + 1 - lo
+
+
+def _min_run(n: int) -> int:
+    """Helper function that computes the minimum length of a run, between 16 and 32, such that n / min_run is equal
+    to, or slightly less than, a power of two, which keeps the merges balanced.
+    """
+    remainder = 0
+    while n >= _INSERTION_THRESHOLD:
+        remainder |= n & 1
+        n >>= 1
+    return n + remainder
+
+
+class _MergeState:
+    """Helper class that holds the state shared by the merges of merge_sort(): the stack of pending runs, the buffer
+    that receives the left run of every merge (allocated once, as large as the input) and the galloping threshold.
+    """
+
+    def __init__(self, values: list) -> None:
+        self.values = values
+        self.buffer = [None] * len(values)
+        self.runs: list[tuple[int, int]] = []
+        self.min_gallop = _MIN_GALLOP
+
+    def collapse(self) -> None:
+        """Merges the runs on the top of the stack until, for the three topmost runs X, Y, Z (Z on top), their lengths
+        satisfy |X| > |Y| + |Z| and |Y| > |Z|: the lengths then grow at least as fast as the Fibonacci numbers, so
+        the stack holds O(log n) runs and the merged runs have similar lengths.
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                    (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self.merge_at(n)
+
+    def collapse_all(self) -> None:
+        while len(self.runs) > 1:
+            n = len(self.runs) - 2
+            if n > 0 and self.runs[n - 1][1] < self.runs[n + 1][1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, n: int) -> None:
+        """Merges the runs n and n+1 of the stack."""
+        (start, length), (_, length2) = self.runs[n], self.runs[n + 1]
+        self.runs[n:n + 2] = [(start, length + length2)]
+        values = self.values
+        mid = start + length
+        hi = mid + length2
+        # the values of the left run not greater than the first value of the right run, and the values of the right
+        # run greater than the last value of the left run, are already in place
+        start = bisect_right(values, values[mid], start, mid)
+        hi = bisect_left(values, values[mid - 1], mid, hi)
+        if start < mid < hi:
+            self.merge(start, mid, hi)
+
+    def merge(self, lo: int, mid: int, hi: int) -> None:
+        """Merges the adjacent sorted ranges values[lo:mid] and values[mid:hi]. The left range is moved to the buffer
+        and merged back with the right one from position `lo`. When a range wins `min_gallop` comparisons in a row,
+        the merge starts galloping: the number of consecutive values to take from that range is found by binary
+        search and they are moved with a single slice assignment. The threshold decreases while galloping pays off
+        and increases when it does not.
+        """
+        values = self.values
+        buffer = self.buffer
+        length = mid - lo
+        buffer[:length] = values[lo:mid]
+        i, j, k = 0, mid, lo
+        min_gallop = self.min_gallop
+        while i < length and j < hi:
+            left_wins = right_wins = 0
+            # one comparison at a time, until a range wins too often
+            while i < length and j < hi:
+                if values[j] < buffer[i]:
+                    values[k] = values[j]
+                    j += 1
+                    right_wins += 1
+                    left_wins = 0
+                else:
+                    values[k] = buffer[i]
+                    i += 1
+                    left_wins += 1
+                    right_wins = 0
+                k += 1
+                if left_wins >= min_gallop or right_wins >= min_gallop:
+                    break
+            # galloping, until both ranges win less than _MIN_GALLOP values per step
+            while i < length and j < hi:
+                count = bisect_right(buffer, values[j], i, length) - i
+                values[k:k + count] = buffer[i:i + count]
+                i += count
+                k += count
+                if i == length:
+                    break
+                count2 = bisect_left(values, buffer[i], j, hi) - j
+                values[k:k + count2] = values[j:j + count2]
+                j += count2
+                k += count2
+                if count < _MIN_GALLOP and count2 < _MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
+        self.min_gallop = min_gallop
+        # the rest of the right range is already in place
+        values[k:k + length - i] = buffer[i:length]
+
+
+def merge_sort(collection: MutableSequence[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+    """Sorts the collection in place with a stable natural merge sort, in the style of Timsort. The collection is
+    split into runs, sequences that are already sorted (descending ones are reversed), extended to a minimum length
+    by insertion sort; the runs are kept on a stack and merged as soon as their lengths would unbalance the merges.
+    Every merge skips with a binary search the prefix and the suffix already in place, and gallops over long
+    sequences taken from the same run. The time complexity is O(n log n), and O(n) for inputs made of few runs, e.g.
+    sorted or reversed ones.
+
+    The collection is read once into a list, sorted there with a single buffer shared by all the merges, and written
+    back, so it can be any mutable sequence, e.g. a list, an `Array` or a `Vector`.
+
+    Args:
+        collection: a collection of elements, it implements the __len__, __iter__ and __setitem__ dunder methods.
+        key: a function that computes from each element the value it is compared by, if None the elements themselves.
+        reverse: if True the elements are sorted in descending order. Equal elements keep their relative order in both
+            cases.
+    """
+    items, values = _load(collection, key, reverse)
+    n = len(values)
+    state = _MergeState(values)
+    min_run = _min_run(n)
+    lo = 0
+    while lo < n:
+        length = _count_run(values, lo, n)
+        if length < min_run:
+            forced = min(min_run, n - lo)
+            _insertion_sort(values, lo, lo + forced, lo + length)
+            length = forced
+        state.runs.append((lo, length))
+        state.collapse()
+        lo += length
+    state.collapse_all()
+    _store(collection, items, values, key, reverse)
+
+
+def _load_keys(collection: MutableSequence[T], key: Optional[Callable[[T], Any]], reverse: bool,
+               kind: type | tuple[type, ...]) -> tuple[list, list]:
+    """Helper function that reads the collection into a list, once, and computes the key of each item, which must be
+    an instance of `kind`. With `reverse` the keys are negated, so that sorting them in ascending order with a stable
+    algorithm gives the descending order with the equal items in their original order.
+
+    Returns:
+        The list of items and the list of their keys.
+    """
+    items = list(collection)
+    keys = items if key is None else [key(item) for item in items]
+    assert all(isinstance(k, kind) for k in keys), f"The keys must be instances of {kind}!"
+    if reverse:
+        keys = [-k for k in keys]
+    return items, keys
+
+
+def _counting_order(keys: list[int]) -> list[int]:
+    """Helper function that computes the stable sorted order of integer keys with a counting sort, in O(n + k) time
+    where k is the difference between the largest and the smallest key.
+
+    Returns:
+        The positions of the keys in sorted order.
+    """
+    lo = min(keys)
+    counts = [0] * (max(keys) - lo + 1)
+    for k in keys:
+        counts[k - lo] += 1
+    # the first position of each key in the output
+    starts = list(accumulate(counts, initial=0))
+    order = [0] * len(keys)
+    for i, k in enumerate(keys):
+        position = starts[k - lo]
+        order[position] = i
+        starts[k - lo] = position + 1
+    return order
+
+
+def _lsd_order(keys: list[int], bits: int) -> list[int]:
+    """Helper function that computes the stable sorted order of integer keys with a least significant digit radix
+    sort: the positions are distributed into 2^bits buckets by each digit of `bits` bits, from the lowest to the
+    highest one, and each pass preserves the order of the previous one. The time complexity is O(d * (n + 2^bits)),
+    where d is the number of digits of the difference between the largest and the smallest key.
+
+    Returns:
+        The positions of the keys in sorted order.
+    """
+    lo = min(keys)
+    keys = [k - lo for k in keys]
+    mask = (1 << bits) - 1
+    order = range(len(keys))
+    for shift in range(0, max(keys).bit_length(), bits):
+        digits = [(k >> shift) & mask for k in keys]
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[digits[i]].append(i)
+        order = list(chain.from_iterable(buckets))
+    return list(order)
+
+
+def _msd_order(keys: list[int], bits: int) -> list[int]:
+    """Helper function that computes the stable sorted order of integer keys with a most significant digit radix
+    sort: the positions are distributed into 2^bits buckets by the highest digit of `bits` bits, and each bucket is
+    then sorted by the next digit, until the digits end or the bucket is small enough to be sorted by insertion sort.
+    Buckets are processed in order with an explicit stack, so a bucket is never revisited and no sorted prefix moves.
+
+    Returns:
+        The positions of the keys in sorted order.
+    """
+    lo = min(keys)
+    keys = [k - lo for k in keys]
+    mask = (1 << bits) - 1
+    digits = -(-max(keys).bit_length() // bits)
+    order = []
+    stack = [(list(range(len(keys))), (digits - 1) * bits)]
+    while stack:
+        bucket, shift = stack.pop()
+        if shift < 0:
+            # all the keys of the bucket are equal
+            order.extend(bucket)
+        elif len(bucket) <= _INSERTION_THRESHOLD:
+            decorated = [(keys[i], i) for i in bucket]
+            _insertion_sort(decorated, 0, len(decorated), 1)
+            order.extend(i for _, i in decorated)
+        else:
+            buckets = [[] for _ in range(mask + 1)]
+            for i in bucket:
+                buckets[(keys[i] >> shift) & mask].append(i)
+            stack.extend((sub_bucket, shift - bits) for sub_bucket in reversed(buckets) if sub_bucket)
+    return order
+
+
+def _comparison_order(keys: list, reverse: bool = False) -> list[int]:
+    """Helper function that computes the stable sorted order of any comparable keys with `merge_sort()`.
+
+    Returns:
+        The positions of the keys in sorted order.
+    """
+    # with `reverse`, the pairs (key, -position) sorted in ascending order and then reversed give the descending order
+    # of the keys with the equal ones in their original order
+    sign = -1 if reverse else 1
+    values = [(k, sign * i) for i, k in enumerate(keys)]
+    merge_sort(values, reverse=reverse)
+    return [sign * i for _, i in values]
+
+
+def _bucket_order(keys: list[float], num_buckets: int) -> list[int]:
+    """Helper function that computes the stable sorted order of numeric keys with a bucket sort: the range between
+    the smallest and the largest key is split into `num_buckets` equal intervals, each key is put in the bucket of its
+    interval, and the buckets are sorted by merge sort (by insertion sort when small). With keys spread uniformly and
+    as many buckets as keys, every bucket holds O(1) keys and the time complexity is O(n). Infinite and NaN keys have
+    no bucket, and neither have keys whose range overflows a float: such keys are sorted by comparison.
+
+    Returns:
+        The positions of the keys in sorted order.
+    """
+    lo = min(keys)
+    width = max(keys) - lo
+    try:
+        finite = isfinite(width) and all(map(isfinite, keys))
+    except OverflowError:  # integers too large for a float
+        finite = False
+    if not finite:
+        return _comparison_order(keys)
+    if width == 0:
+        return list(range(len(keys)))
+    scale = num_buckets / width
+    last = num_buckets - 1
+    buckets = [[] for _ in range(num_buckets)]
+    for i, k in enumerate(keys):
+        buckets[min(int((k - lo) * scale), last)].append((k, i))
+    for bucket in buckets:
+        if len(bucket) <= _INSERTION_THRESHOLD:
+            _insertion_sort(bucket, 0, len(bucket), 1)
+        else:
+            merge_sort(bucket)
+    return [i for bucket in buckets for _, i in bucket]
+
+
+def _sort_by_order(collection: MutableSequence[T], key: Optional[Callable[[T], Any]], reverse: bool,
+                   kind: type | tuple[type, ...], compute_order: Callable[[list], list[int]]) -> None:
+    """Helper function that sorts the collection in place by the order of the positions computed from its keys."""
+    items, keys = _load_keys(collection, key, reverse, kind)
+    if len(items) < 2:
+        return
+    order = compute_order(keys)
+    _write(collection, [items[i] for i in order])
+
+
+def counting_sort(collection: MutableSequence[T], key: Optional[Callable[[T], Any]] = None,
+                  reverse: bool = False) -> None:
+    """Sorts the collection in place with a stable counting sort. The keys must be integers: the number of items with
+    each key is counted and their prefix sums give the position in the output of the first item with each key. The
+    time complexity is O(n + k), where k is the difference between the largest and the smallest key, so it is linear
+    when the keys are dense (e.g. small categories or ages), and wasteful when they are spread (e.g. 32-bit IDs).
+
+    Args:
+        collection: a collection of elements, it implements the __len__, __iter__ and __setitem__ dunder methods.
+        key: a function that computes from each element the integer it is sorted by, if None the elements themselves.
+        reverse: if True the elements are sorted in descending order. Equal elements keep their relative order in both
+            cases.
+    """
+    _sort_by_order(collection, key, reverse, int, _counting_order)
+
+
+def lsd_radix_sort(collection: MutableSequence[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False,
+                   bits: int = 8) -> None:
+    """Sorts the collection in place with a stable least significant digit radix sort. The keys must be integers:
+    they are distributed into 2^bits buckets by their lowest digit of `bits` bits, then by the next one and so on; as
+    every pass is stable, after the last one the keys are sorted. The time complexity is O(d * (n + 2^bits)), where d
+    is the number of digits of the range of the keys, so sorting 32-bit integers takes 4 linear passes.
+
+    A typed integer `Array` sorted by its elements is sorted by NumPy, when installed, with the same algorithm: every
+    pass is a stable argsort of the digits, which NumPy implements as a counting sort for digits of up to 16 bits.
+
+    Args:
+        collection: a collection of elements, it implements the __len__, __iter__ and __setitem__ dunder methods.
+        key: a function that computes from each element the integer it is sorted by, if None the elements themselves.
+        reverse: if True the elements are sorted in descending order. Equal elements keep their relative order in both
+            cases.
+        bits: the number of bits of each digit.
+    """
+    assert bits > 0, f"`bits` must be greater than zero but it was {bits}!"
+    if key is None and _numpy_typed(collection, 'iu'):
+        _numpy_radix_sort(collection, reverse, bits)
+    else:
+        _sort_by_order(collection, key, reverse, int, lambda keys: _lsd_order(keys, bits))
+
+
+def msd_radix_sort(collection: MutableSequence[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False,
+                   bits: int = 8) -> None:
+    """Sorts the collection in place with a stable most significant digit radix sort. The keys must be integers: they
+    are distributed into 2^bits buckets by their highest digit of `bits` bits, and each bucket is sorted recursively
+    by the next digit; small buckets are sorted by insertion sort. Unlike `lsd_radix_sort()` it stops as soon as a
+    bucket is small, so it examines fewer digits when the keys differ in their high digits, at the price of
+    allocating the buckets of every large bucket.
+
+    Args:
+        collection: a collection of elements, it implements the __len__, __iter__ and __setitem__ dunder methods.
+        key: a function that computes from each element the integer it is sorted by, if None the elements themselves.
+        reverse: if True the elements are sorted in descending order. Equal elements keep their relative order in both
+            cases.
+        bits: the number of bits of each digit.
+    """
+    assert bits > 0, f"`bits` must be greater than zero but it was {bits}!"
+    _sort_by_order(collection, key, reverse, int, lambda keys: _msd_order(keys, bits))
+
+
+def bucket_sort(collection: MutableSequence[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False,
+                num_buckets: Optional[int] = None) -> None:
+    """Sorts the collection in place with a stable bucket sort. The keys must be numbers: the range between the
+    smallest and the largest key is split into `num_buckets` equal intervals, the items are distributed into the
+    buckets of the intervals of their keys, and each bucket is sorted by merge sort. The time complexity is O(n) on
+    average for keys spread uniformly (e.g. random floats), and degrades to O(n log n) when most keys fall in few
+    buckets. If some key is infinite or NaN the buckets cannot be computed, and the keys are sorted by `merge_sort()`.
+
+    Args:
+        collection: a collection of elements, it implements the __len__, __iter__ and __setitem__ dunder methods.
+        key: a function that computes from each element the number it is sorted by, if None the elements themselves.
+        reverse: if True the elements are sorted in descending order. Equal elements keep their relative order in both
+            cases.
+        num_buckets: the number of buckets, if None as many as the elements.
+    """
+    assert num_buckets is None or num_buckets > 0, f"`num_buckets` must be greater than zero but it was {num_buckets}!"
+    _sort_by_order(collection, key, reverse, (int, float),
+                   lambda keys: _bucket_order(keys, num_buckets or len(keys)))
+
+
+def sort(collection: MutableSequence[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+    """Sorts the collection in place with a stable algorithm chosen by looking at the keys:
+
+    - fewer than `_MIN_DISTRIBUTION` elements, or keys that are not numbers: `merge_sort()`, since distributing few
+      keys costs more than comparing them;
+    - integer keys whose range is at most twice the number of elements: `counting_sort()`;
+    - other integer keys: `lsd_radix_sort()` with 8-bit digits, or 16-bit digits for large inputs, which halves the
+      number of passes while the buckets stay fewer than the elements;
+    - float keys: `bucket_sort()`.
+
+    A typed `Array` sorted by its elements is sorted by NumPy when it is installed: by `lsd_radix_sort()` if its
+    elements are integers, otherwise by NumPy's own stable sort.
+
+    Args:
+        collection: a collection of elements, it implements the __len__, __iter__ and __setitem__ dunder methods.
+        key: a function that computes from each element the value it is compared by, if None the elements themselves.
+        reverse: if True the elements are sorted in descending order. Equal elements keep their relative order in both
+            cases.
+    """
+    if key is None and _numpy_typed(collection, 'iuf'):
+        if collection.dtype[0] == 'f':
+            data = numpy.asarray(collection.memoryview())
+            # reversing before and after the stable sort keeps equal elements (e.g. 0.0 and -0.0) in their order
+            data[:] = numpy.sort(data[::-1], kind='stable')[::-1] if reverse else numpy.sort(data, kind='stable')
+        else:
+            _numpy_radix_sort(collection, reverse)
+        return
+    items = list(collection)
+    keys = items if key is None else [key(item) for item in items]
+    if len(items) < _MIN_DISTRIBUTION or not all(isinstance(k, (int, float)) for k in keys):
+        order = None
+    else:
+        if reverse:
+            keys = [-k for k in keys]
+        if all(isinstance(k, int) for k in keys):
+            span = max(keys) - min(keys) + 1
+            if span <= 2 * len(keys):
+                order = _counting_order(keys)
+            else:
+                order = _lsd_order(keys, 16 if len(keys) >= 1 << 16 else 8)
+        else:
+            order = _bucket_order(keys, len(keys))
+    if order is None:
+        order = _comparison_order(keys, reverse)
+    _write(collection, [items[i] for i in order])
+
+
+def _numpy_typed(collection: MutableSequence[T], kinds: str) -> bool:
+    """Helper function that tells if the collection is a typed Array whose dtype kind is one of `kinds`, and NumPy can
+    sort it.
+    """
+    return numpy is not None and use_numpy and isinstance(collection, Array) and collection.dtype is not None \
+        and collection.dtype[0] in kinds and len(collection) > 1
+
+
+def _numpy_radix_sort(array: Array[int], reverse: bool, bits: int = 8) -> None:
+    """Helper function that sorts a typed integer Array with a least significant digit radix sort of `bits`-bit
+    digits, each pass being a stable argsort of the digits, which NumPy implements as a counting sort for digits of up
+    to 16 bits. The signed keys get their sign bit flipped, which maps them to unsigned integers in the same order,
+    and only the digits of the range of the keys are examined.
+    """
+    data = numpy.asarray(array.memoryview())
+    width = 8 * data.itemsize
+    unsigned = data.view(f'u{data.itemsize}')
+    if array.dtype[0] == 'i':
+        unsigned = unsigned ^ unsigned.dtype.type(1 << (width - 1))
+    # the keys agree on the bits above the highest one where the smallest and the largest key differ
+    key_bits = int(unsigned.min() ^ unsigned.max()).bit_length()
+    # the smallest unsigned type that holds a digit; a digit as wide as the keys is the key itself
+    bits = min(bits, width)
+    digit_type = numpy.dtype(f'u{min(data.itemsize, 1 << max(0, (bits - 1).bit_length() - 3))}')
+    mask = unsigned.dtype.type((1 << bits) - 1)
+    order = numpy.arange(len(data))
+    for shift in range(0, key_bits, bits):
+        digits = ((unsigned[order] >> unsigned.dtype.type(shift)) & mask).astype(digit_type)
+        order = order[numpy.argsort(digits, kind='stable')]
+    result = data[order]
+    data[:] = result[::-1] if reverse else result
@@ -4,4 +4,15 @@ from .matrix import Matrix
 from .vector import Vector
 from .set import Set
 from .map import Map
-from .arrayND import MultiArray
\ No newline at end of file
+from .arrayND import MultiArray
+from .hash_map import HashMap
+from .tree_map import TreeMap
+from .hash_set import HashSet
+from .bit_set import BitSet
+from .sparse_matrix import COOMatrix, CSRMatrix, CSCMatrix
+from .matrix_expression import MatrixExpression
+from .matrix_decomposition import LUDecomposition, CholeskyDecomposition, QRDecomposition
+from .chunked_array import ChunkedMultiArray
+from .gap_vector import GapVector
+from .rope_vector import RopeVector
+from .deque import Deque
@@ -1,28 +1,91 @@
 from __future__ import annotations
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Optional, Union, Iterable, Iterator
 import ctypes
 T = TypeVar('T')
 
+# ctypes element type of each supported dtype code: a kind letter (i: signed int, u: unsigned int, f: float) followed
+# by the size of the element in bytes
+_DTYPES = {
+    'i1': ctypes.c_int8,
+    'i2': ctypes.c_int16,
+    'i4': ctypes.c_int32,
+    'i8': ctypes.c_int64,
+    'u1': ctypes.c_uint8,
+    'u2': ctypes.c_uint16,
+    'u4': ctypes.c_uint32,
+    'u8': ctypes.c_uint64,
+    'f4': ctypes.c_float,
+    'f8': ctypes.c_double,
+}
+
+# the iterators read the elements in slices of this many elements: reading a slice converts all its elements in C,
+# which is much faster than indexing them one at a time, and the block bounds the extra memory
+_ITER_BLOCK = 1024
+
 
 class Array(Generic[T]):
     """Implementation of a 1D Array Abstract Data Type.
 
     An **array** is a data structure that has a fixed **size** and a fixed type, its elements are stored contiguously
     in memory and can be accessed in constant time.
+
+    By default the elements are references to arbitrary Python objects. When a `dtype` is given the array is *typed*:
+    it stores raw C numbers contiguously (e.g. 8 bytes per element for 'f8') which are converted to Python numbers only
+    when accessed, and its memory can be shared without copying through `memoryview()`.
     """
 
-    def __init__(self, size: int) -> None:
-        """Creates a one-dimensional array consisting of `size` elements with each element initially set to None. Size
-        must be greater than zero.
+    def __init__(self, size: int, dtype: Optional[str] = None) -> None:
+        """Creates a one-dimensional array consisting of `size` elements with each element initially set to None, or
+        to zero for a typed array. Size must be greater than zero.
 
         Args:
             size (int): The size of the array.
+            dtype (str): The code of the element type of a typed array: one of 'i1', 'i2', 'i4', 'i8', 'u1', 'u2',
+                'u4', 'u8', 'f4' and 'f8'. If None the array stores Python objects.
         """
         assert size > 0, f"`size` must be greater than zero but it was {size}!"
+        assert dtype is None or dtype in _DTYPES, f"`dtype` must be one of {list(_DTYPES)} but it was {dtype}!"
         self._size = size
-        py_array_type = ctypes.py_object * size
-        self._elements = py_array_type()
-        self.clear(None)
+        self._dtype = dtype
+        if dtype is None:
+            py_array_type = ctypes.py_object * size
+            self._elements = py_array_type()
+            self.clear(None)
+        else:
+            # ctypes zero-initializes the memory of the primitive arrays
+            c_array_type = _DTYPES[dtype] * size
+            self._elements = c_array_type()
+
+    @property
+    def dtype(self) -> Optional[str]:
+        """Returns the code of the element type.
+
+        Returns:
+            The dtype code of a typed array or None if the array stores Python objects.
+        """
+        return self._dtype
+
+    @property
+    def itemsize(self) -> int:
+        """Returns the number of bytes occupied by each element in the underlying storage.
+
+        Returns:
+            The size in bytes of an element.
+        """
+        return ctypes.sizeof(self._elements._type_)
+
+    def memoryview(self) -> memoryview:
+        """Exposes the underlying storage of a typed array through the buffer protocol, so that other code (e.g. the
+        `array` and `struct` modules or NumPy) can read and write it without copying.
+
+        Returns:
+            A writable memoryview with one element per array cell.
+        """
+        assert self._dtype is not None, "Only typed arrays expose their memory!"
+        return memoryview(self._elements).cast('B').cast(self._elements._type_._type_)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.memoryview()
 
     def __len__(self) -> int:
         """Computes the array length.
@@ -32,46 +95,186 @@ class Array(Generic[T]):
         """
         return self._size
 
-    def __getitem__(self, index: int) -> T:
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, Array[T]]:
         """Returns the value stored in the array at element position `index`. The `index` argument must be within the
-        valid range.
+        valid range. If `index` is a slice, a new array of the same type containing a copy of the selected range of
+        elements is returned instead, which is empty if the slice selects no elements.
 
         Args:
-            index (int): The index of the element we want to get.
+            index (int | slice): The index of the element we want to get, or a slice of indices.
 
         Returns:
-            The element at the specified index.
+            The element at the specified index, or a new Array for a slice.
         """
-        assert 0 <= index <= len(self), f"`index` must be in range [0, {len(self)-1}] but it was {index}!"
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            num_items = len(range(start, stop, step))
+            if num_items == 0:
+                return Array._empty(self._dtype)
+            result = Array(num_items, self._dtype)
+            if step == 1 and self._dtype is not None:
+                ctypes.memmove(result._elements, self._address_of(start), num_items * self.itemsize)
+            else:
+                result._elements[:] = self._elements[start:stop:step]
+            return result
+        assert 0 <= index < self._size, f"`index` must be in range [0, {self._size - 1}] but it was {index}!"
         return self._elements[index]
 
-    def __setitem__(self, index: int, value: T) -> None:
+    def __setitem__(self, index: Union[int, slice], value: Union[T, Iterable[T]]) -> None:
         """Modifies the contents of the array element at position `index` to contain `value`. The `index` must be within
-        the valid range.
+        the valid range. If `index` is a slice, `value` must be an Array or an iterable with as many elements as the
+        slice selects, and they are stored in the selected positions.
 
         Args:
-            index (int): The index of the element we want to set.
-            value: The new value.
+            index (int | slice): The index of the element we want to set, or a slice of indices.
+            value: The new value, or the new values for a slice.
         """
-        assert 0 <= index <= len(self), f"`index` must be in range [0, {len(self)-1}] but it was {index}!"
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            num_items = len(range(start, stop, step))
+            if isinstance(value, Array):
+                assert len(value) == num_items, \
+                    f"The slice selects {num_items} elements but {len(value)} values were given!"
+                if step == 1:
+                    self.copy_from(value, slice(None), start)
+                else:
+                    self._elements[start:stop:step] = value._elements[:]
+            else:
+                values = list(value)
+                assert len(values) == num_items, \
+                    f"The slice selects {num_items} elements but {len(values)} values were given!"
+                self._elements[start:stop:step] = values
+            return
+        assert 0 <= index < self._size, f"`index` must be in range [0, {self._size - 1}] but it was {index}!"
         self._elements[index] = value
 
+    def _address_of(self, index: int) -> int:
+        """Helper method that computes the memory address of an element of a typed array."""
+        return ctypes.addressof(self._elements) + index * self.itemsize
+
+    def fill(self, value: T, start: int = 0, stop: Optional[int] = None) -> None:
+        """Sets every element in the range [`start`, `stop`) to `value` with block operations: a single assignment for
+        arrays of objects, and for typed arrays a memset when `value` is zero, otherwise O(log n) memory copies, each
+        one doubling the filled range.
+
+        Args:
+            value: The value stored in the elements.
+            start (int): The index of the first element to set.
+            stop (int): The index after the last element to set, if None the end of the array.
+        """
+        start, stop, _ = slice(start, stop).indices(self._size)
+        if stop <= start:
+            return
+        if self._dtype is None:
+            self._elements[start:stop] = [value] * (stop - start)
+        elif value == 0:
+            ctypes.memset(self._address_of(start), 0, (stop - start) * self.itemsize)
+        else:
+            # store the value once, then double the filled prefix by copying it after itself
+            self._elements[start] = value
+            address = self._address_of(start)
+            filled = 1
+            while filled < stop - start:
+                count = min(filled, stop - start - filled)
+                ctypes.memmove(address + filled * self.itemsize, address, count * self.itemsize)
+                filled += count
+
     def clear(self, value: T) -> None:
         """Clears the array by setting every element to `value`.
 
         Args:
             value: The value used to clear the array.
         """
-        for i in range(len(self)):
-            self._elements[i] = value
+        self.fill(value)
 
-    def __iter__(self) -> _ArrayIterator:
-        """Creates and returns an iterator that can be used to traverse the elements of the array.
+    def copy_from(self, other: Array[T], src_slice: Optional[slice] = None, dst_offset: int = 0) -> None:
+        """Copies the elements of `other` selected by `src_slice` into this array, starting at position `dst_offset`.
+        Contiguous ranges of typed arrays with the same dtype are copied as a single block of memory, and `other` can
+        be this same array even when the source and destination ranges overlap.
+
+        Args:
+            other (Array): The source array.
+            src_slice (slice): The elements of `other` to copy, if None all of them.
+            dst_offset (int): The index of this array where the first copied element is stored.
+        """
+        start, stop, step = (src_slice or slice(None)).indices(len(other))
+        num_items = len(range(start, stop, step))
+        assert 0 <= dst_offset and dst_offset + num_items <= self._size, \
+            f"{num_items} elements do not fit in the array from index {dst_offset}!"
+        if num_items == 0:
+            return
+        if step == 1 and self._dtype is not None and self._dtype == other._dtype:
+            ctypes.memmove(self._address_of(dst_offset), other._address_of(start), num_items * self.itemsize)
+        else:
+            self._elements[dst_offset:dst_offset + num_items] = other._elements[start:stop:step]
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], dtype: Optional[str] = None) -> Array[T]:
+        """Creates an array containing the elements of the given (non-empty) iterable.
+
+        Args:
+            iterable: The source of the elements.
+            dtype (str): The code of the element type, see `Array.__init__`.
 
         Returns:
-            An  `_ArrayIterator` instance.
+            The new Array.
+        """
+        values = list(iterable)
+        array = cls(len(values), dtype)
+        array._elements[:] = values
+        return array
+
+    @classmethod
+    def from_buffer(cls, buffer, size: int, dtype: str, offset: int = 0) -> Array[T]:
+        """Creates a typed array whose storage is the memory of a writable buffer (e.g. a `bytearray` or a memory
+        mapped file) starting at byte `offset`. No element is copied: the array reads and writes the buffer directly,
+        and the buffer cannot be resized or closed while the array is alive.
+
+        Args:
+            buffer: An object supporting the writable buffer protocol.
+            size (int): The number of elements.
+            dtype (str): The code of the element type, see `Array.__init__`.
+            offset (int): The position in bytes of the first element in the buffer.
+
+        Returns:
+            The new Array.
+        """
+        assert size > 0, f"`size` must be greater than zero but it was {size}!"
+        assert dtype in _DTYPES, f"`dtype` must be one of {list(_DTYPES)} but it was {dtype}!"
+        array = cls.__new__(cls)
+        array._size = size
+        array._dtype = dtype
+        array._elements = (_DTYPES[dtype] * size).from_buffer(buffer, offset)
+        return array
+
+    @classmethod
+    def _empty(cls, dtype: Optional[str] = None) -> Array[T]:
+        """Helper method that creates an array without elements, e.g. the result of a slice that selects nothing. The
+        constructor does not allow it, since an empty array cannot store anything.
         """
-        return _ArrayIterator(self._elements)
+        array = cls.__new__(cls)
+        array._size = 0
+        array._dtype = dtype
+        array._elements = ((ctypes.py_object if dtype is None else _DTYPES[dtype]) * 0)()
+        return array
+
+    def __iter__(self) -> Iterator[T]:
+        """Creates and returns an iterator that can be used to traverse the elements of the array. The elements are read
+        in blocks of 1024, so an element assigned during the iteration after its block is read is yielded with its old
+        value.
+
+        Returns:
+            An iterator over the elements.
+        """
+        return _iterate(self._elements, 0, self._size)
+
+    def __reversed__(self) -> Iterator[T]:
+        """Creates and returns an iterator that traverses the elements of the array from the last one.
+
+        Returns:
+            An iterator over the elements in reverse order.
+        """
+        return _iterate(self._elements, 0, self._size, reverse=True)
 
     def __str__(self) -> str:
         """Defines the string representation of the array.
@@ -79,27 +282,35 @@ class Array(Generic[T]):
         Returns:
             The string representation.
         """
-        string = f"[{self._elements[0]}, "
-        for i in range(1, self._size-1):
-            string += f"{self._elements[i]}, "
-        string += f"{self._elements[self._size-1]}]"
-        return string
+        return "[" + ", ".join([str(element) for element in self._elements]) + "]"
+
 
+def _iterate(elements, start: int, stop: int, reverse: bool = False) -> Iterator[T]:
+    """Helper generator that yields the elements in the range [start, stop) of a ctypes array (or any sequence),
+    reading them in blocks of `_ITER_BLOCK` elements. Each block is a snapshot: an element assigned after its block is
+    read is yielded with its old value.
+    """
+    if reverse:
+        for block_stop in range(stop, start, -_ITER_BLOCK):
+            yield from reversed(elements[max(start, block_stop - _ITER_BLOCK):block_stop])
+    else:
+        for block_start in range(start, stop, _ITER_BLOCK):
+            yield from elements[block_start:min(stop, block_start + _ITER_BLOCK)]
 
-class _ArrayIterator:
-    """Helper class that implements the iterator for the Array ADT."""
 
-    def __init__(self, array: Array[T]):
-        self._array_ref = array
-        self._cur_ndx = 0
+def _fail_fast(container, items: Iterable[T]) -> Iterator[T]:
+    """Helper function that wraps the iterator of a container so that it raises a RuntimeError as soon as the container
+    is structurally modified (i.e. its `_modifications` counter changes) after the iterator is created, including
+    while the caller handles the last item.
+    """
+    expected = container._modifications
 
-    def __iter__(self) -> _ArrayIterator:
-        return self
+    def generator() -> Iterator[T]:
+        for item in items:
+            if container._modifications != expected:
+                raise RuntimeError(f"{type(container).__name__} changed size during iteration!")
+            yield item
+        if container._modifications != expected:
+            raise RuntimeError(f"{type(container).__name__} changed size during iteration!")
 
-    def __next__(self) -> T:
-        if self._cur_ndx < len(self._array_ref):
-            entry = self._array_ref[self._cur_ndx]
-            self._cur_ndx += 1
-            return entry
-        else:
-            raise StopIteration
+    return generator()
@@ -1,24 +1,33 @@
+from __future__ import annotations
 from . import Array
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Optional, Iterator
 T = TypeVar('T')
 
 
 class Array2D(Generic[T]):
-    """Implementation of a 2-dimensional Array Abstract Data Type."""
+    """Implementation of a 2-dimensional Array Abstract Data Type.
 
-    def __init__(self, num_rows: int, num_cols: int) -> None:
+    The elements are stored in a single one-dimensional `Array` in row-major order: the element (i, j) is at position
+    i * num_cols + j. Rows and columns can be accessed without copying through the views returned by `row()` and
+    `col()`.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int, dtype: Optional[str] = None) -> None:
         """Creates a two-dimensional array organized into rows and columns. The `num_rows` and `num_cols` arguments
-        indicate the size of the table. The individual elements of the table are initialized to None.
+        indicate the size of the table. The individual elements of the table are initialized to None, or to zero for
+        a typed array.
 
         Args:
             num_rows (int): Number of rows.
             num_cols (int): Number of columns.
+            dtype (str): The element type code of a typed backing array (see `Array`), if None it stores Python
+                objects.
         """
         assert num_rows > 0 and num_cols > 0, \
             f"Number of rows and cols must be greater than zero but was rows:{num_rows}, cols:{num_cols}!"
-        self._elements = Array(num_rows)
-        for i in range(num_rows):
-            self._elements[i] = Array(num_cols)
+        self._num_rows = num_rows
+        self._num_cols = num_cols
+        self._elements: Array[T] = Array(num_rows * num_cols, dtype)
 
     @property
     def num_rows(self) -> int:
@@ -27,7 +36,7 @@ class Array2D(Generic[T]):
         Returns:
             The number of rows in the 2-D array.
         """
-        return len(self._elements)
+        return self._num_rows
 
     @property
     def num_cols(self) -> int:
@@ -36,7 +45,7 @@ class Array2D(Generic[T]):
         Returns:
             The number of columns in the 2-D array.
         """
-        return len(self._elements[0])
+        return self._num_cols
 
     def __getitem__(self, ndx_tuple: tuple[int, int]) -> T:
         """Returns the value stored in the 2-D array element at the position indicated by the 2-tuple (i1 , i2 ), both
@@ -48,10 +57,9 @@ class Array2D(Generic[T]):
         Returns:
             The value contained in the element indexed by (i1, i2).
         """
-        i1 = ndx_tuple[0]
-        i2 = ndx_tuple[1]
-        assert 0 <= i1 < self.num_rows and 0 <= i2 < self.num_cols, f"Index out of range!"
-        return self._elements[i1][i2]
+        i1, i2 = ndx_tuple
+        assert 0 <= i1 < self._num_rows and 0 <= i2 < self._num_cols, f"Index out of range!"
+        return self._elements._elements[i1 * self._num_cols + i2]
 
     def __setitem__(self, ndx_tuple: tuple[int, int], value: T) -> None:
         """Modifies the contents of the 2-D array element indicated by the 2-tuple (i1 , i2) with the new value. Both
@@ -61,10 +69,33 @@ class Array2D(Generic[T]):
             ndx_tuple (tuple[int, int]): A tuple containing the indices of the element we want set.
             value: The value stored in the element at position (i1, i2).
         """
-        row = ndx_tuple[0]
-        col = ndx_tuple[1]
-        assert 0 <= row < self.num_rows and 0 <= col < self.num_cols, f"Index out of range!"
-        self._elements[row][col] = value
+        row, col = ndx_tuple
+        assert 0 <= row < self._num_rows and 0 <= col < self._num_cols, f"Index out of range!"
+        self._elements._elements[row * self._num_cols + col] = value
+
+    def row(self, index: int) -> _LineView[T]:
+        """Returns a view of a row: reading or writing the view reads or writes the 2-D array, no element is copied.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            A view of the `num_cols` elements of the row.
+        """
+        assert 0 <= index < self._num_rows, f"`index` must be in range [0, {self._num_rows-1}] but it was {index}!"
+        return _LineView(self._elements, index * self._num_cols, self._num_cols, 1)
+
+    def col(self, index: int) -> _LineView[T]:
+        """Returns a view of a column: reading or writing the view reads or writes the 2-D array, no element is copied.
+
+        Args:
+            index (int): The index of the column.
+
+        Returns:
+            A view of the `num_rows` elements of the column.
+        """
+        assert 0 <= index < self._num_cols, f"`index` must be in range [0, {self._num_cols-1}] but it was {index}!"
+        return _LineView(self._elements, index, self._num_rows, self._num_cols)
 
     def clear(self, value: T) -> None:
         """Clears the array by setting each element to the given value.
@@ -72,8 +103,7 @@ class Array2D(Generic[T]):
         Args:
             value: The value used to clear the 2D array.
         """
-        for i in range(self.num_rows):
-            self._elements[i].clear(value)
+        self._elements.clear(value)
 
     def __str__(self) -> str:
         """Defines the string representation of the 2D array.
@@ -81,8 +111,34 @@ class Array2D(Generic[T]):
         Returns:
             The string representation.
         """
-        string = f"[{self._elements[0].__str__()}\n"
-        for i in range(1, self.num_rows-1):
-            string += f" {self._elements[i].__str__()}\n"
-        string += f" {self._elements[self.num_rows-1].__str__()}]"
-        return string
+        return "[" + "\n ".join([str(self.row(i)) for i in range(self._num_rows)]) + "]"
+
+
+class _LineView(Generic[T]):
+    """Helper class that implements a zero-copy view of the elements of an `Array` that are evenly spaced by a given
+    stride, such as a row or a column of an Array2D.
+    """
+
+    def __init__(self, array: Array[T], start: int, length: int, stride: int) -> None:
+        self._array = array
+        self._start = start
+        self._length = length
+        self._stride = stride
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> T:
+        assert 0 <= index < self._length, f"`index` must be in range [0, {self._length-1}] but it was {index}!"
+        return self._array._elements[self._start + index * self._stride]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        assert 0 <= index < self._length, f"`index` must be in range [0, {self._length-1}] but it was {index}!"
+        self._array._elements[self._start + index * self._stride] = value
+
+    def __iter__(self) -> Iterator[T]:
+        stop = self._start + self._length * self._stride
+        return iter(self._array._elements[self._start:stop:self._stride])
+
+    def __str__(self) -> str:
+        return "[" + ", ".join([str(element) for element in self]) + "]"
@@ -1,14 +1,76 @@
 from __future__ import annotations
 from . import Array
-from typing import TypeVar, Generic
+from .array import _DTYPES
+from typing import TypeVar, Generic, Optional, Union, Iterator, Callable
+from itertools import product, accumulate
+from operator import add, sub, mul, truediv
+import ctypes
+import mmap
+import os
+import struct
+import sys
+import warnings
+import weakref
 T = TypeVar('T')
 
+try:
+    import numpy
+except ImportError:  # NumPy is optional, without it every operation runs in pure Python
+    numpy = None
+
+# layout of the header of a MultiArray file: magic string, dtype code, byte order ('<' or '>'), number of dimensions
+# and position of the first element, followed by the dimensions as unsigned 64-bit integers. The elements follow in
+# row-major order from the first multiple of _FILE_ALIGNMENT after the header, so the data section can also be opened
+# with e.g. numpy.memmap(path, dtype, offset=data_offset, shape=dims).
+_FILE_MAGIC = b'MULTIARR'
+_FILE_HEADER = struct.Struct('<8s2scBQ')
+_FILE_DIM = struct.Struct('<Q')
+_FILE_ALIGNMENT = 64
+
 
 class MultiArray(Generic[T]):
-    """Implements the Multidimensional Array Abstract Data Type as an abstract view of a one-dimensional array."""
+    """Implements the Multidimensional Array Abstract Data Type as an abstract view of a one-dimensional array.
+
+    A typed MultiArray (see the `dtype` of `Array`) can also be stored in a file with `create()` and mapped back into
+    memory with `open()`: opening is instantaneous whatever the size of the file, since the operating system reads
+    only the pages that are actually accessed, and a file opened read-only by several processes shares the same
+    physical memory.
+
+    Indexing with slices (and `...`) returns a *view*: a MultiArray with its own dimensions, offsets and starting
+    position that shares the one-dimensional array of the original one, so slicing, `transpose()`, `broadcast_to()`
+    and `reshape()` (of a contiguous array) copy no element. The elementwise operators (+, -, *, /) broadcast their
+    operands to a common shape.
+
+    The reductions (`sum()`, `mean()`, `min()`, `max()`, `argmin()`, `argmax()`, `cumsum()`) and the elementwise
+    operations never convert coordinates to indices: they read the one-dimensional array one row at a time, with a
+    single slice in stride order. Typed arrays dispatch them to NumPy when it is installed.
+    """
 
-    def __init__(self, *dimensions: int) -> None:
+    # typed arrays dispatch the reductions and the elementwise operations to NumPy when it is installed, unless this
+    # flag is turned off
+    use_numpy: bool = True
+
+    def __init__(self, *dimensions: int, dtype: Optional[str] = None) -> None:
+        """Creates a multidimensional array with the given dimensions, whose cells are initialized to None (or to zero
+        if `dtype` is given).
+
+        Args:
+            dimensions: The number of elements in each dimension, at least two dimensions are needed.
+            dtype (str): The element type code of a typed array (see `Array`), if None it stores Python objects.
+        """
         assert len(dimensions) > 1, "A MultiArray must have 2 or more dimensions!"
+        self._init_shape(dimensions)
+        self._array: Array[T] = Array(self._size, dtype)
+        self._mmap: Optional[mmap.mmap] = None
+        # the views of a file-backed array, which share its storage and are released with it by close()
+        self._views: Optional[weakref.WeakSet[MultiArray[T]]] = None
+        self._path: Optional[str] = None
+        self._read_only = False
+
+    def _init_shape(self, dimensions: tuple[int, ...]) -> None:
+        """Helper method that validates the dimensions and initializes the attributes describing the shape of a
+        contiguous array.
+        """
         size = 1
         for d in dimensions:
             size *= d
@@ -16,9 +78,116 @@ class MultiArray(Generic[T]):
 
         self._size: int = size
         self._num_dims: int = len(dimensions)
-        self._dims: tuple[int, ...] = dimensions
-        self._offsets: Array[int] = self._compute_offsets()
-        self._array: Array[T] = Array(size)
+        self._dims: tuple[int, ...] = tuple(dimensions)
+        self._offsets: tuple[int, ...] = self._compute_offsets()
+        self._start: int = 0
+
+    @staticmethod
+    def create(path: str, *dimensions: int, dtype: str) -> MultiArray:
+        """Creates a file containing a zero-filled typed array with the given dimensions, and opens it for reading
+        and writing.
+
+        Args:
+            path (str): The path of the new file.
+            dimensions: The number of elements in each dimension.
+            dtype (str): The element type code (see `Array`).
+
+        Returns:
+            The MultiArray mapped on the file.
+        """
+        assert dtype in _DTYPES, f"`dtype` must be one of {list(_DTYPES)} but it was {dtype}!"
+        size = 1
+        for d in dimensions:
+            size *= d
+        header_size = _FILE_HEADER.size + len(dimensions) * _FILE_DIM.size
+        data_offset = -(-header_size // _FILE_ALIGNMENT) * _FILE_ALIGNMENT
+        byte_order = b'<' if sys.byteorder == 'little' else b'>'
+        with open(path, 'wb') as file:
+            file.write(_FILE_HEADER.pack(_FILE_MAGIC, dtype.encode(), byte_order, len(dimensions), data_offset))
+            for d in dimensions:
+                file.write(_FILE_DIM.pack(d))
+            # the data section is a hole of zeros, allocated on disk only when written
+            file.truncate(data_offset + size * ctypes.sizeof(_DTYPES[dtype]))
+        return MultiArray.open(path, read_only=False)
+
+    @staticmethod
+    def open(path: str, read_only: bool = True) -> MultiArray:
+        """Maps into memory an array stored in a file by `create()`. Nothing is read but the header: the elements are
+        loaded by the operating system when accessed.
+
+        Args:
+            path (str): The path of the file.
+            read_only (bool): If True the array cannot be modified and its memory is shared with the other processes
+                that map the same file, otherwise the changes are written to the file.
+
+        Returns:
+            The MultiArray mapped on the file.
+        """
+        with open(path, 'r+b' if not read_only else 'rb') as file:
+            header = file.read(_FILE_HEADER.size)
+            magic, dtype, byte_order, num_dims, data_offset = _FILE_HEADER.unpack(header)
+            assert magic == _FILE_MAGIC, f"{path} is not a MultiArray file!"
+            assert byte_order == (b'<' if sys.byteorder == 'little' else b'>'), \
+                f"{path} was written on a machine with a different byte order!"
+            dims = tuple(_FILE_DIM.unpack(file.read(_FILE_DIM.size))[0] for _ in range(num_dims))
+            # a copy-on-write mapping can be wrapped by ctypes, and its pages are shared until they are written
+            access = mmap.ACCESS_COPY if read_only else mmap.ACCESS_WRITE
+            mapping = mmap.mmap(file.fileno(), 0, access=access)
+        multi_array = MultiArray.__new__(MultiArray)
+        multi_array._init_shape(dims)
+        multi_array._array = Array.from_buffer(mapping, multi_array._size, dtype.decode(), data_offset)
+        multi_array._mmap = mapping
+        multi_array._views = weakref.WeakSet()
+        multi_array._path = os.path.abspath(path)
+        multi_array._read_only = read_only
+        return multi_array
+
+    @property
+    def dtype(self) -> Optional[str]:
+        """Returns the element type code of a typed array, or None if it stores Python objects."""
+        return self._array.dtype
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+    def flush(self) -> None:
+        """Writes to disk the changes made to an array opened for writing."""
+        if self._mmap is not None and not self._read_only:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """Releases the memory mapping of a file-backed array, which cannot be used anymore, nor can its views.
+
+        If some memory exported by `memoryview()` (e.g. a NumPy array) is still referenced, the mapping cannot be
+        closed yet: a ResourceWarning is issued, and the mapping and its file are released with the last reference.
+        """
+        if self._mmap is not None:
+            self.flush()
+            # the ctypes storage, shared by the views, must be released before the mapping can be closed
+            for view in list(self._views):
+                view._array = None
+            self._array = None
+            try:
+                self._mmap.close()
+            except BufferError:
+                warnings.warn(f"The mapping of {self._path} is still exported, it will be closed when released",
+                              ResourceWarning)
+            self._mmap = None
+
+    def __enter__(self) -> MultiArray:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reduce_ex__(self, protocol: int):
+        """Pickles a file-backed array as the path of its file, so that it is reopened (not copied) by the worker
+        processes it is sent to.
+        """
+        if self._path is None:
+            return super().__reduce_ex__(protocol)
+        return MultiArray.open, (self._path, self._read_only)
 
     def length(self, dim: int) -> int:
         """Computes the size of a dimension given its index. The index of the dimension must be within the correct
@@ -51,19 +220,48 @@ class MultiArray(Generic[T]):
         """
         return self._size
 
-    def _compute_offsets(self) -> Array[int]:
+    def _compute_offsets(self) -> tuple[int, ...]:
         """Helper method that computes the offsets necessary for the abstract interpretation of the actual 1D array that
-        stores the values.
+        stores the values. The offset of a dimension (also called *stride*) is the distance, in the 1D array, between
+        two cells whose coordinates differ by one along that dimension.
 
         Returns:
-            An int array of offsets values.
+            A tuple of offsets values.
         """
-        offsets = Array(self._num_dims)
+        offsets = [0] * self._num_dims
         prod = 1
         for i in range(self._num_dims-1, -1, -1):
             offsets[i] = prod
             prod *= self._dims[i]
-        return offsets
+        return tuple(offsets)
+
+    def _view(self, start: int, dims: tuple[int, ...], offsets: tuple[int, ...],
+              read_only: bool = False) -> MultiArray[T]:
+        """Helper method that creates a view: an array with its own shape that shares the 1D array of this one. The
+        cell (i1, ..., iN) of the view is the cell start + i1*offsets[0] + ... + iN*offsets[N-1] of the 1D array.
+        """
+        view = MultiArray.__new__(MultiArray)
+        view._init_shape(dims)
+        view._offsets = offsets
+        view._start = start
+        view._array = self._array
+        view._mmap = None
+        view._views = self._views
+        if self._views is not None:
+            self._views.add(view)
+        view._path = None
+        view._read_only = self._read_only or read_only
+        return view
+
+    @property
+    def is_contiguous(self) -> bool:
+        """Tells if the cells of the array are stored contiguously in row-major order, i.e. if it is not a strided
+        view.
+
+        Returns:
+            True if the array is contiguous.
+        """
+        return self._offsets == self._compute_offsets()
 
     def _compute_index(self, coords: tuple[int, ...]) -> int:
         """Helper method that computes the corresponding index of the one-dimensional array cell given the coordinates
@@ -75,12 +273,93 @@ class MultiArray(Generic[T]):
         Returns:
             The index of the corresponding cell of the 1D array.
         """
-        assert len(coords) == self._num_dims, "Wrong number of dimensions!"
-        index = 0
-        for i in range(self._num_dims):
-            index += self._offsets[i]*coords[i]
-        assert 0 <= index < self._size, f"Index {coords} out of range!"
-        return index
+        if __debug__:
+            # checked mode: the bounds are checked while the index is computed (`python -O` removes this block)
+            assert len(coords) == self._num_dims, "Wrong number of dimensions!"
+            index = self._start
+            for coord, dim, offset in zip(coords, self._dims, self._offsets):
+                assert 0 <= coord < dim, f"Index {coords} out of range!"
+                index += offset * coord
+            return index
+        return self._start + sum(map(mul, coords, self._offsets))
+
+    def _resolve(self, key) -> tuple[int, tuple[int, ...], tuple[int, ...]]:
+        """Helper method that interprets an index made of integers, slices and at most one Ellipsis (which stands for
+        as many full slices as needed). The missing trailing components are full slices.
+
+        Returns:
+            The start, the dimensions and the offsets of the selected cells: an integer component selects a cell along
+            its dimension, which disappears; a slice keeps the dimension, with the selected length and step.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        num_ellipsis = sum(1 for k in key if k is Ellipsis)
+        assert num_ellipsis <= 1, "An index can contain a single Ellipsis!"
+        assert len(key) - num_ellipsis <= self._num_dims, "Too many indices!"
+        if num_ellipsis:
+            position = key.index(Ellipsis)
+            full = (slice(None),) * (self._num_dims - len(key) + 1)
+            key = key[:position] + full + key[position + 1:]
+        key = key + (slice(None),) * (self._num_dims - len(key))
+
+        start = self._start
+        dims = []
+        offsets = []
+        for k, dim, offset in zip(key, self._dims, self._offsets):
+            if isinstance(k, slice):
+                k_start, k_stop, k_step = k.indices(dim)
+                length = len(range(k_start, k_stop, k_step))
+                assert length > 0, f"The slice {k} selects no elements!"
+                start += k_start * offset
+                dims.append(length)
+                offsets.append(k_step * offset)
+            else:
+                assert 0 <= k < dim, f"Index {k} out of range [0, {dim - 1}]!"
+                start += k * offset
+        return start, tuple(dims), tuple(offsets)
+
+    def _rows(self) -> Iterator[tuple[int, int, int]]:
+        """Helper method that enumerates in row-major order the rows (the sequences of cells along the last
+        dimension) of the array.
+
+        Returns:
+            An iterator of tuples (index of the first cell in the 1D array, offset, number of cells).
+        """
+        count = self._dims[-1]
+        offset = self._offsets[-1]
+        outer = [range(0, d * o, o) if o else [0] * d for d, o in zip(self._dims[:-1], self._offsets[:-1])]
+        for position in product(*outer):
+            yield self._start + sum(position), offset, count
+
+    def _read_row(self, first: int, offset: int, count: int) -> list[T]:
+        """Helper method that reads a row with a single slice of the 1D array."""
+        elements = self._array._elements
+        if offset == 0:
+            return [elements[first]] * count
+        stop = first + count * offset
+        return elements[first:stop if stop >= 0 else None:offset]
+
+    def _to_flat(self) -> list[T]:
+        """Helper method that copies the cells into a list in row-major order."""
+        if self.is_contiguous:
+            return self._array._elements[self._start:self._start + self._size]
+        data = []
+        for row in self._rows():
+            data.extend(self._read_row(*row))
+        return data
+
+    def _store_flat(self, data: list[T]) -> None:
+        """Helper method that overwrites the cells with the values of a list in row-major order."""
+        assert not self._read_only, "The array is read-only!"
+        elements = self._array._elements
+        if self.is_contiguous:
+            elements[self._start:self._start + self._size] = data
+            return
+        position = 0
+        for first, offset, count in self._rows():
+            stop = first + count * offset
+            elements[first:stop if stop >= 0 else None:offset] = data[position:position + count]
+            position += count
 
     def clear(self, value: T) -> None:
         """Sets all the cells of the array to the same given value.
@@ -88,30 +367,392 @@ class MultiArray(Generic[T]):
         Args:
             value: The given value with which the array will be populated.
         """
-        self._array.clear(value)
+        assert not self._read_only, "The array is read-only!"
+        if self.is_contiguous:
+            self._array.fill(value, self._start, self._start + self._size)
+        else:
+            self._store_flat([value] * self._size)
+
+    def copy(self) -> MultiArray[T]:
+        """Creates a contiguous copy of the array, with the same dtype.
 
-    def __getitem__(self, coords: tuple[int, ...]) -> T:
-        """Returns the value of the cell indexed by the coordinates (i1, ..., iN).
+        Returns:
+            The new MultiArray.
+        """
+        result = MultiArray._empty(self._dims, self.dtype)
+        result._store_flat(self._to_flat())
+        return result
+
+    @staticmethod
+    def _wrap(array: Optional[Array[T]], dims: tuple[int, ...]) -> MultiArray[T]:
+        """Helper method that creates a contiguous array of any number of dimensions whose cells are the first cells
+        of the given one-dimensional array.
+        """
+        result = MultiArray.__new__(MultiArray)
+        result._init_shape(dims)
+        result._array = array
+        result._mmap = None
+        result._views = None
+        result._path = None
+        result._read_only = False
+        return result
+
+    @staticmethod
+    def _empty(dims: tuple[int, ...], dtype: Optional[str]) -> MultiArray[T]:
+        """Helper method that creates a contiguous array of any number of dimensions."""
+        result = MultiArray._wrap(None, dims)
+        result._array = Array(result._size, dtype)
+        return result
+
+    def __getitem__(self, coords) -> Union[T, MultiArray[T]]:
+        """Returns the value of the cell indexed by the coordinates (i1, ..., iN). If some of the coordinates are
+        slices (or an Ellipsis), a view of the selected cells is returned: it shares the memory of this array, so no
+        cell is copied and the changes made through the view are visible in this array.
 
         Args:
-            coords: The coordinates (i1, ..., iN) of a cell of the ND array.
+            coords: The coordinates (i1, ..., iN) of a cell of the ND array, or an index containing slices.
 
         Returns:
-            The content of the cell indexed by the coordinates `coords`.
+            The content of the cell indexed by the coordinates `coords`, or a MultiArray view.
         """
-        index = self._compute_index(coords)
-        return self._array[index]
+        if type(coords) is tuple and len(coords) == self._num_dims:
+            try:
+                return self._array._elements[self._compute_index(coords)]
+            except TypeError:
+                pass  # the index contains slices or an Ellipsis
+        start, dims, offsets = self._resolve(coords)
+        if not dims:
+            return self._array._elements[start]
+        return self._view(start, dims, offsets)
 
-    def __setitem__(self, coords: tuple[int, ...], value: T) -> None:
-        """Updates the value of the cell indexed by the coordinates (i1, ..., iN).
+    def __setitem__(self, coords, value: Union[T, MultiArray[T]]) -> None:
+        """Updates the value of the cell indexed by the coordinates (i1, ..., iN). If some of the coordinates are
+        slices (or an Ellipsis), all the selected cells are updated: `value` can be a single value or a MultiArray
+        broadcastable to the shape of the selection.
 
         Args:
-            coords: The coordinates (i1, ..., iN) of a cell.
+            coords: The coordinates (i1, ..., iN) of a cell, or an index containing slices.
             value: The value that will be stored into the cell indexed by `coords`.
         """
-        index = self._compute_index(coords)
-        self._array[index] = value
+        assert not self._read_only, "The array is read-only!"
+        if type(coords) is tuple and len(coords) == self._num_dims:
+            try:
+                index = self._compute_index(coords)
+            except TypeError:
+                pass  # the index contains slices or an Ellipsis
+            else:
+                self._array._elements[index] = value
+                return
+        start, dims, offsets = self._resolve(coords)
+        if not dims:
+            self._array._elements[start] = value
+            return
+        target = self._view(start, dims, offsets)
+        if isinstance(value, MultiArray):
+            target._store_flat(value.broadcast_to(*dims)._to_flat())
+        else:
+            target.clear(value)
+
+    def reshape(self, *dimensions: int) -> MultiArray[T]:
+        """Gives a new shape, with the same number of cells, to the array. A contiguous array is reshaped as a view,
+        a strided view is copied first.
+
+        Args:
+            dimensions: The new dimensions.
+
+        Returns:
+            The reshaped MultiArray.
+        """
+        size = 1
+        for d in dimensions:
+            size *= d
+        assert size == self._size, f"Cannot reshape an array of {self._size} cells into {dimensions}!"
+        source = self if self.is_contiguous else self.copy()
+        view = source._view(source._start, tuple(dimensions), ())
+        view._offsets = view._compute_offsets()
+        return view
+
+    def transpose(self, *axes: int) -> MultiArray[T]:
+        """Permutes the dimensions of the array as a view: the dimension i of the result is the dimension axes[i] of
+        this array. Without arguments the order of the dimensions is reversed.
+
+        Args:
+            axes: A permutation of the dimension indices.
+
+        Returns:
+            The transposed view.
+        """
+        if not axes:
+            axes = tuple(range(self._num_dims - 1, -1, -1))
+        assert sorted(axes) == list(range(self._num_dims)), f"{axes} is not a permutation of the dimensions!"
+        return self._view(self._start, tuple(self._dims[a] for a in axes), tuple(self._offsets[a] for a in axes))
+
+    def broadcast_to(self, *dimensions: int) -> MultiArray[T]:
+        """Creates a read-only view that repeats the array to the given shape, following the broadcasting rules: the
+        dimensions are aligned from the last one, and each dimension of the array must be equal to the corresponding
+        one of the shape or 1. The repeated dimensions have offset 0, so no cell is copied.
+
+        Args:
+            dimensions: The target shape.
+
+        Returns:
+            The broadcast view.
+        """
+        assert len(dimensions) >= self._num_dims, f"Cannot broadcast {self._dims} to {dimensions}!"
+        if tuple(dimensions) == self._dims:
+            return self
+        extra = len(dimensions) - self._num_dims
+        offsets = [0] * extra
+        for dim, offset, target in zip(self._dims, self._offsets, dimensions[extra:]):
+            assert dim == target or dim == 1, f"Cannot broadcast {self._dims} to {dimensions}!"
+            offsets.append(offset if dim == target else 0)
+        return self._view(self._start, tuple(dimensions), tuple(offsets), read_only=True)
+
+    @staticmethod
+    def _broadcast_shape(first: tuple[int, ...], second: tuple[int, ...]) -> tuple[int, ...]:
+        """Helper method that computes the shape resulting from broadcasting two shapes against each other."""
+        length = max(len(first), len(second))
+        first = (1,) * (length - len(first)) + first
+        second = (1,) * (length - len(second)) + second
+        shape = []
+        for a, b in zip(first, second):
+            assert a == b or a == 1 or b == 1, f"Shapes {first} and {second} cannot be broadcast together!"
+            shape.append(max(a, b))
+        return tuple(shape)
+
+    def _numpy_enabled(self, *others) -> bool:
+        """Helper method that tells if an operation between this array and `others` (MultiArrays or scalars) can be
+        dispatched to NumPy.
+        """
+        if numpy is None or not self.use_numpy or self.dtype is None:
+            return False
+        return all(other.dtype is not None for other in others if isinstance(other, MultiArray))
+
+    def _as_ndarray(self) -> numpy.ndarray:
+        """Helper method that creates an ndarray sharing the memory, and the strides, of a typed array."""
+        base = numpy.asarray(self._array.memoryview())
+        itemsize = base.itemsize
+        return numpy.lib.stride_tricks.as_strided(base[self._start:], shape=self._dims,
+                                                  strides=[offset * itemsize for offset in self._offsets],
+                                                  writeable=not self._read_only)
+
+    @staticmethod
+    def _from_ndarray(array: numpy.ndarray) -> Union[T, MultiArray[T]]:
+        """Helper method that creates a MultiArray from an ndarray, typed if the dtype of the ndarray is supported by
+        `Array`. A 0-dimensional ndarray is converted to a Python number.
+        """
+        if array.ndim == 0:
+            return array.item()
+        dtype = f"{array.dtype.kind}{array.dtype.itemsize}"
+        if dtype not in _DTYPES:
+            result = MultiArray._empty(array.shape, None)
+            result._store_flat(array.ravel().tolist())
+        else:
+            result = MultiArray._empty(array.shape, dtype)
+            result._as_ndarray()[...] = array
+        return result
+
+    def _elementwise(self, other: Union[T, MultiArray[T]], operation: Callable[[T, T], T],
+                     reflected: bool = False) -> MultiArray[T]:
+        """Helper method that applies a binary operation to the corresponding cells of this array and `other`, which
+        is broadcast if needed (a scalar is broadcast to every cell).
+
+        Returns:
+            A new contiguous MultiArray, of Python objects unless it is computed by NumPy.
+        """
+        if self._numpy_enabled(other):
+            left = self._as_ndarray()
+            right = other._as_ndarray() if isinstance(other, MultiArray) else other
+            return MultiArray._from_ndarray(operation(right, left) if reflected else operation(left, right))
+        if isinstance(other, MultiArray):
+            shape = MultiArray._broadcast_shape(self._dims, other._dims)
+            left, right = self.broadcast_to(*shape)._to_flat(), other.broadcast_to(*shape)._to_flat()
+            if reflected:
+                left, right = right, left
+            data = list(map(operation, left, right))
+        else:
+            shape = self._dims
+            if reflected:
+                data = [operation(other, x) for x in self._to_flat()]
+            else:
+                data = [operation(x, other) for x in self._to_flat()]
+        result = MultiArray._empty(shape, None)
+        result._store_flat(data)
+        return result
+
+    def map(self, function: Callable[[T], T]) -> MultiArray[T]:
+        """Applies a function to every cell of the array.
+
+        Args:
+            function: The function applied to the value of each cell.
+
+        Returns:
+            A new contiguous MultiArray of Python objects with the results.
+        """
+        result = MultiArray._empty(self._dims, None)
+        result._store_flat(list(map(function, self._to_flat())))
+        return result
+
+    def __add__(self, other: Union[T, MultiArray[T]]) -> MultiArray[T]:
+        return self._elementwise(other, add)
+
+    def __radd__(self, other: T) -> MultiArray[T]:
+        return self._elementwise(other, add, reflected=True)
+
+    def __sub__(self, other: Union[T, MultiArray[T]]) -> MultiArray[T]:
+        return self._elementwise(other, sub)
+
+    def __rsub__(self, other: T) -> MultiArray[T]:
+        return self._elementwise(other, sub, reflected=True)
+
+    def __mul__(self, other: Union[T, MultiArray[T]]) -> MultiArray[T]:
+        return self._elementwise(other, mul)
+
+    def __rmul__(self, other: T) -> MultiArray[T]:
+        return self._elementwise(other, mul, reflected=True)
+
+    def __truediv__(self, other: Union[T, MultiArray[T]]) -> MultiArray[T]:
+        return self._elementwise(other, truediv)
+
+    def __rtruediv__(self, other: T) -> MultiArray[T]:
+        return self._elementwise(other, truediv, reflected=True)
+
+    def _axis_to_end(self, axis: int) -> MultiArray[T]:
+        """Helper method that creates a view in which the dimension `axis` is the last one, so that its rows are the
+        lines along `axis`.
+        """
+        assert 0 <= axis < self._num_dims, f"Axis {axis} out of range [0, {self._num_dims - 1}]!"
+        axes = [a for a in range(self._num_dims) if a != axis] + [axis]
+        return self.transpose(*axes)
+
+    def _reduce(self, axis: Optional[int], function: Callable[[list[T]], T], name: str) -> Union[T, MultiArray[T]]:
+        """Helper method that reduces with `function` all the cells, if `axis` is None, or the lines along `axis`.
+        Typed arrays call instead the NumPy function called `name`.
+
+        Returns:
+            The result of the reduction of all the cells, or a MultiArray without the dimension `axis`, holding the
+            result of the reduction of each line.
+        """
+        if self._numpy_enabled():
+            return MultiArray._from_ndarray(getattr(numpy, name)(self._as_ndarray(), axis=axis))
+        if axis is None:
+            return function(self._to_flat())
+        view = self._axis_to_end(axis)
+        data = [function(view._read_row(*row)) for row in view._rows()]
+        if self._num_dims == 1:
+            return data[0]
+        result = MultiArray._empty(view._dims[:-1], None)
+        result._store_flat(data)
+        return result
+
+    def sum(self, axis: Optional[int] = None) -> Union[T, MultiArray[T]]:
+        """Computes the sum of all the cells, or of the cells along a dimension.
+
+        Args:
+            axis: The index of the dimension that is summed, if None all the cells are summed.
+
+        Returns:
+            The sum, or a MultiArray without the dimension `axis` holding the sum of each line along it.
+        """
+        return self._reduce(axis, sum, 'sum')
+
+    def mean(self, axis: Optional[int] = None) -> Union[float, MultiArray[float]]:
+        """Computes the arithmetic mean of all the cells, or of the cells along a dimension.
+
+        Args:
+            axis: The index of the dimension that is averaged, if None all the cells are averaged.
+
+        Returns:
+            The mean, or a MultiArray without the dimension `axis` holding the mean of each line along it.
+        """
+        return self._reduce(axis, lambda values: sum(values) / len(values), 'mean')
+
+    def min(self, axis: Optional[int] = None) -> Union[T, MultiArray[T]]:
+        """Computes the minimum of all the cells, or of the cells along a dimension.
+
+        Args:
+            axis: The index of the dimension that is reduced, if None all the cells are compared.
+
+        Returns:
+            The minimum, or a MultiArray without the dimension `axis` holding the minimum of each line along it.
+        """
+        return self._reduce(axis, min, 'min')
+
+    def max(self, axis: Optional[int] = None) -> Union[T, MultiArray[T]]:
+        """Computes the maximum of all the cells, or of the cells along a dimension.
+
+        Args:
+            axis: The index of the dimension that is reduced, if None all the cells are compared.
+
+        Returns:
+            The maximum, or a MultiArray without the dimension `axis` holding the maximum of each line along it.
+        """
+        return self._reduce(axis, max, 'max')
+
+    def _arg_reduce(self, axis: Optional[int], function: Callable,
+                    name: str) -> Union[tuple[int, ...], MultiArray[int]]:
+        """Helper method that finds the position of the minimum or the maximum (the first one in case of ties)."""
+        if axis is None:
+            if self._numpy_enabled():
+                flat = getattr(numpy, name)(self._as_ndarray())
+                return tuple(int(c) for c in numpy.unravel_index(flat, self._dims))
+            data = self._to_flat()
+            flat = function(range(len(data)), key=data.__getitem__)
+            coords = []
+            for dim in reversed(self._dims):
+                flat, coord = divmod(flat, dim)
+                coords.append(coord)
+            return tuple(reversed(coords))
+        return self._reduce(axis, lambda values: function(range(len(values)), key=values.__getitem__), name)
+
+    def argmin(self, axis: Optional[int] = None) -> Union[tuple[int, ...], MultiArray[int]]:
+        """Finds the position of the minimum of all the cells, or of the cells along a dimension.
+
+        Args:
+            axis: The index of the dimension that is searched, if None all the cells are searched.
+
+        Returns:
+            The coordinates of the minimum cell, or a MultiArray without the dimension `axis` holding the index of the
+            minimum of each line along it.
+        """
+        return self._arg_reduce(axis, min, 'argmin')
+
+    def argmax(self, axis: Optional[int] = None) -> Union[tuple[int, ...], MultiArray[int]]:
+        """Finds the position of the maximum of all the cells, or of the cells along a dimension.
+
+        Args:
+            axis: The index of the dimension that is searched, if None all the cells are searched.
+
+        Returns:
+            The coordinates of the maximum cell, or a MultiArray without the dimension `axis` holding the index of the
+            maximum of each line along it.
+        """
+        return self._arg_reduce(axis, max, 'argmax')
+
+    def cumsum(self, axis: Optional[int] = None) -> MultiArray[T]:
+        """Computes the cumulative sums of the cells along a dimension.
+
+        Args:
+            axis: The index of the dimension along which the sums are accumulated, if None the cells are accumulated
+                in row-major order into a one-dimensional array.
+
+        Returns:
+            A new MultiArray with the cumulative sums.
+        """
+        if self._numpy_enabled():
+            return MultiArray._from_ndarray(numpy.cumsum(self._as_ndarray(), axis=axis))
+        if axis is None:
+            result = MultiArray._empty((self._size,), None)
+            result._store_flat(list(accumulate(self._to_flat())))
+            return result
+        view = self._axis_to_end(axis)
+        data = []
+        for row in view._rows():
+            data.extend(accumulate(view._read_row(*row)))
+        result = MultiArray._empty(self._dims, None)
+        result._axis_to_end(axis)._store_flat(data)
+        return result
 
     def __str__(self) -> str:
         # TODO: update to string to correctly visualize the multidimensional array
-        return self._array.__str__()
+        return "[" + ", ".join([str(x) for x in self._to_flat()]) + "]"
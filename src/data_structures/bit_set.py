@@ -0,0 +1,145 @@
+from __future__ import annotations
+from typing import Iterator
+import ctypes
+
+_WORD_BITS = 64
+_WORD_BYTES = 8
+
+
+class BitSet:
+    """Implements the Set Abstract Data Type for non-negative integers as a bitmap: the item `i` belongs to the set if
+    the bit `i` of a contiguous array of 64-bit words is set. Every possible item costs a single bit, and the array
+    grows automatically when an item beyond its end is added.
+
+    The set algebra is computed on whole buffers at once: the words of each operand are reinterpreted as a single
+    arbitrary-precision integer and combined with the bitwise operators, so no per-item work is performed.
+    """
+
+    def __init__(self, universe_size: int = _WORD_BITS) -> None:
+        """Creates a new empty set able to hold the items in range [0, `universe_size`) without growing.
+
+        Args:
+            universe_size (int): The expected upper bound (excluded) of the items.
+        """
+        assert universe_size > 0, f"`universe_size` must be greater than zero but it was {universe_size}!"
+        self._num_words = (universe_size + _WORD_BITS - 1) // _WORD_BITS
+        self._words = (ctypes.c_uint64 * self._num_words)()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item: int) -> bool:
+        if not isinstance(item, int):
+            return False
+        word = item // _WORD_BITS
+        if item < 0 or word >= self._num_words:
+            return False
+        return (self._words[word] >> (item % _WORD_BITS)) & 1 == 1
+
+    def _grow(self, num_words: int) -> None:
+        """Helper method that enlarges the array of words to at least `num_words` words, preserving its content."""
+        new_num_words = max(num_words, 2 * self._num_words)
+        new_words = (ctypes.c_uint64 * new_num_words)()
+        ctypes.memmove(new_words, self._words, self._num_words * _WORD_BYTES)
+        self._words = new_words
+        self._num_words = new_num_words
+
+    def add(self, item: int) -> None:
+        """Adds a new item to the set if not already available.
+
+        Args:
+            item: The non-negative integer to be added.
+        """
+        assert item >= 0, f"The item must be a non-negative integer but it was {item}!"
+        word = item // _WORD_BITS
+        if word >= self._num_words:
+            self._grow(word + 1)
+        mask = 1 << (item % _WORD_BITS)
+        if not self._words[word] & mask:
+            self._words[word] |= mask
+            self._size += 1
+
+    def remove(self, item: int) -> None:
+        """Removes the provided item, which must be in the set.
+
+        Args:
+            item: The item to be removed.
+        """
+        assert item in self, f"The item {item} is not in the set!"
+        self._words[item // _WORD_BITS] &= ~(1 << (item % _WORD_BITS))
+        self._size -= 1
+
+    def _as_int(self) -> int:
+        """Helper method that reinterprets the whole bitmap as an integer whose bit `i` is the bit of the item `i`."""
+        return int.from_bytes(bytes(self._words), 'little')
+
+    @staticmethod
+    def _from_int(value: int, num_words: int) -> BitSet:
+        """Helper method that builds a set of `num_words` words from an integer bitmap that fits into them."""
+        result = BitSet(num_words * _WORD_BITS)
+        ctypes.memmove(result._words, value.to_bytes(num_words * _WORD_BYTES, 'little'), num_words * _WORD_BYTES)
+        # bin().count() rather than int.bit_count(), which needs Python 3.10
+        result._size = bin(value).count('1')
+        return result
+
+    def __eq__(self, other: BitSet) -> bool:
+        return len(self) == len(other) and self._as_int() == other._as_int()
+
+    def is_subset_of(self, other: BitSet) -> bool:
+        """Computes if the self set is a subset of the other provided set.
+
+        Args:
+            other: The other set.
+
+        Returns:
+            True if it is a subset, otherwise False.
+        """
+        return len(self) <= len(other) and self._as_int() & ~other._as_int() == 0
+
+    def union(self, other: BitSet) -> BitSet:
+        """Computes the union between the self set and the other provided set.
+
+        Args:
+            other: The other set.
+
+        Returns:
+            The union set.
+        """
+        return BitSet._from_int(self._as_int() | other._as_int(), max(self._num_words, other._num_words))
+
+    def intersect(self, other: BitSet) -> BitSet:
+        """Computes the intersection between the self set and the other provided set.
+
+        Args:
+            other: The other set.
+
+        Returns:
+            The intersection set.
+        """
+        return BitSet._from_int(self._as_int() & other._as_int(), min(self._num_words, other._num_words))
+
+    def difference(self, other: BitSet) -> BitSet:
+        """Computes the difference between the self set and the other provided set.
+
+        Args:
+            other: The other set.
+
+        Returns:
+            The difference set.
+        """
+        return BitSet._from_int(self._as_int() & ~other._as_int(), self._num_words)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates over the items in increasing order, skipping the empty words.
+
+        Returns:
+            An iterator over the items.
+        """
+        for i in range(self._num_words):
+            word = self._words[i]
+            base = i * _WORD_BITS
+            while word:
+                lowest = word & -word
+                yield base + lowest.bit_length() - 1
+                word ^= lowest
@@ -0,0 +1,243 @@
+from __future__ import annotations
+from . import Array, MultiArray
+from .array import _DTYPES
+from collections import OrderedDict
+from typing import TypeVar, Generic, Optional, Iterator, Union
+import ctypes
+import lzma
+import zlib
+T = TypeVar('T')
+
+# compression functions of the stored chunks: name -> (compress(data, level), decompress(data))
+_COMPRESSORS = {
+    'zlib': (lambda data, level: zlib.compress(data, -1 if level is None else level), zlib.decompress),
+    'lzma': (lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+}
+
+
+class ChunkedMultiArray(Generic[T]):
+    """Implements a multidimensional array whose index space is split into chunks: N-dimensional tiles of
+    `chunk_shape` cells, each stored in its own one-dimensional array that is allocated by the first write to one of
+    its cells. The cells of the chunks never written hold the fill value (None, or zero for a typed array), so the
+    memory used is proportional to the touched volume rather than to the size of the array.
+
+    A typed array can also keep its chunks compressed with zlib or lzma. In that case the most recently used chunks
+    are kept decompressed in a LRU cache of `cache_size` chunks, and a chunk is compressed again only when it is
+    evicted from the cache (or on `flush()`), so repeated accesses to the same region do not pay the (de)compression.
+    """
+
+    def __init__(self, *dimensions: int, chunk_shape: tuple[int, ...], dtype: Optional[str] = None,
+                 compression: Optional[str] = None, level: Optional[int] = None, cache_size: int = 16) -> None:
+        """Creates a chunked array with the given dimensions in which no chunk is allocated.
+
+        Args:
+            dimensions: The number of elements in each dimension, at least two dimensions are needed.
+            chunk_shape: The number of elements of a chunk in each dimension.
+            dtype (str): The element type code of a typed array (see `Array`), if None it stores Python objects.
+            compression (str): 'zlib' or 'lzma' to compress the chunks of a typed array, None to store them as is.
+            level (int): The compression level, if None the default one of the compressor.
+            cache_size (int): The number of decompressed chunks kept in memory when the chunks are compressed.
+        """
+        assert len(dimensions) > 1, "A ChunkedMultiArray must have 2 or more dimensions!"
+        assert all(d > 0 for d in dimensions), "The number of elements in each dimension must be greater than zero!"
+        assert len(chunk_shape) == len(dimensions), "The chunk shape must have a length for each dimension!"
+        assert all(c > 0 for c in chunk_shape), "The chunk lengths must be greater than zero!"
+        assert dtype is None or dtype in _DTYPES, f"`dtype` must be one of {list(_DTYPES)} but it was {dtype}!"
+        assert compression is None or compression in _COMPRESSORS, \
+            f"`compression` must be one of {list(_COMPRESSORS)} but it was {compression}!"
+        assert compression is None or dtype is not None, "Only typed arrays can be compressed!"
+        assert cache_size > 0, "The cache must hold at least one chunk!"
+
+        self._dims: tuple[int, ...] = tuple(dimensions)
+        self._chunk_shape: tuple[int, ...] = tuple(chunk_shape)
+        self._dtype = dtype
+        self._compression = compression
+        self._level = level
+        self._cache_size = cache_size
+        self._fill = None if dtype is None else _DTYPES[dtype]().value
+
+        # row-major offsets of the cells inside a chunk
+        offsets = []
+        prod = 1
+        for c in reversed(chunk_shape):
+            offsets.append(prod)
+            prod *= c
+        self._chunk_offsets: tuple[int, ...] = tuple(reversed(offsets))
+        self._chunk_size: int = prod
+
+        # chunk coordinates -> Array, or the compressed bytes of the Array if `compression` is given
+        self._chunks: dict[tuple[int, ...], Union[Array[T], bytes]] = {}
+        # chunk coordinates -> decompressed Array, from the least to the most recently used
+        self._cache: OrderedDict[tuple[int, ...], Array[T]] = OrderedDict()
+        # coordinates of the cached chunks modified since they were decompressed
+        self._dirty: set[tuple[int, ...]] = set()
+
+    @property
+    def num_dims(self) -> int:
+        return len(self._dims)
+
+    @property
+    def size(self) -> int:
+        size = 1
+        for d in self._dims:
+            size *= d
+        return size
+
+    def length(self, dim: int) -> int:
+        """Computes the size of a dimension given its index.
+
+        Args:
+            dim: The index of the dimension.
+
+        Returns:
+            The size of the dimension.
+        """
+        assert 0 <= dim < len(self._dims), f"Dimension {dim} out of range [0, {len(self._dims) - 1}]!"
+        return self._dims[dim]
+
+    @property
+    def dtype(self) -> Optional[str]:
+        return self._dtype
+
+    @property
+    def chunk_shape(self) -> tuple[int, ...]:
+        return self._chunk_shape
+
+    @property
+    def num_chunks(self) -> int:
+        """Returns the number of allocated chunks."""
+        return len(self._chunks.keys() | self._cache.keys())
+
+    def _locate(self, coords: tuple[int, ...]) -> tuple[tuple[int, ...], int]:
+        """Helper method that finds the chunk containing a cell.
+
+        Returns:
+            The coordinates of the chunk and the index of the cell in the one-dimensional array of the chunk.
+        """
+        assert len(coords) == len(self._dims), "Wrong number of dimensions!"
+        key = []
+        index = 0
+        for coord, dim, c, offset in zip(coords, self._dims, self._chunk_shape, self._chunk_offsets):
+            assert 0 <= coord < dim, f"Index {coords} out of range!"
+            chunk, local = divmod(coord, c)
+            key.append(chunk)
+            index += local * offset
+        return tuple(key), index
+
+    def _chunk(self, key: tuple[int, ...], create: bool) -> Optional[Array[T]]:
+        """Helper method that returns the (decompressed) array of a chunk.
+
+        Args:
+            key: The coordinates of the chunk.
+            create: If True, a chunk that is not allocated is allocated and filled with the fill value.
+
+        Returns:
+            The array of the chunk, or None if it is not allocated and `create` is False.
+        """
+        if self._compression is None:
+            chunk = self._chunks.get(key)
+            if chunk is None and create:
+                chunk = self._chunks[key] = Array(self._chunk_size, self._dtype)
+            return chunk
+
+        chunk = self._cache.get(key)
+        if chunk is not None:
+            self._cache.move_to_end(key)
+            return chunk
+        data = self._chunks.get(key)
+        if data is not None:
+            decompress = _COMPRESSORS[self._compression][1]
+            chunk = Array.from_buffer(bytearray(decompress(data)), self._chunk_size, self._dtype)
+        elif create:
+            chunk = Array(self._chunk_size, self._dtype)
+            self._dirty.add(key)
+        else:
+            return None
+        self._cache[key] = chunk
+        if len(self._cache) > self._cache_size:
+            self._evict()
+        return chunk
+
+    def _evict(self) -> None:
+        """Helper method that removes the least recently used chunk from the cache, compressing it if modified."""
+        key, chunk = self._cache.popitem(last=False)
+        if key in self._dirty:
+            self._dirty.discard(key)
+            self._chunks[key] = self._compress(chunk)
+
+    def _compress(self, chunk: Array[T]) -> bytes:
+        compress = _COMPRESSORS[self._compression][0]
+        return compress(chunk.memoryview().cast('B'), self._level)
+
+    def flush(self) -> None:
+        """Compresses the chunks modified since they were decompressed. The cache keeps its content."""
+        for key in self._dirty:
+            self._chunks[key] = self._compress(self._cache[key])
+        self._dirty.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes used by the stored chunks, compressed or not, and by the cached chunks."""
+        assert self._dtype is not None, "The size in bytes is defined only for typed arrays!"
+        chunk_bytes = self._chunk_size * ctypes.sizeof(_DTYPES[self._dtype])
+        stored = sum(len(data) if isinstance(data, bytes) else chunk_bytes for data in self._chunks.values())
+        return stored + len(self._cache) * chunk_bytes
+
+    def __getitem__(self, coords: tuple[int, ...]) -> T:
+        """Returns the value of the cell indexed by the coordinates (i1, ..., iN).
+
+        Args:
+            coords: The coordinates of a cell.
+
+        Returns:
+            The content of the cell, the fill value if its chunk was never written.
+        """
+        key, index = self._locate(coords)
+        chunk = self._chunk(key, create=False)
+        return self._fill if chunk is None else chunk._elements[index]
+
+    def __setitem__(self, coords: tuple[int, ...], value: T) -> None:
+        """Updates the value of the cell indexed by the coordinates (i1, ..., iN), allocating its chunk if it is the
+        first write to it. Writing the fill value into a chunk never written does not allocate it.
+
+        Args:
+            coords: The coordinates of a cell.
+            value: The value that will be stored into the cell.
+        """
+        key, index = self._locate(coords)
+        chunk = self._chunk(key, create=value != self._fill)
+        if chunk is None:
+            return
+        chunk._elements[index] = value
+        if self._compression is not None:
+            self._dirty.add(key)
+
+    def chunks(self) -> Iterator[tuple[tuple[int, ...], MultiArray[T]]]:
+        """Streams the allocated chunks in row-major order of their coordinates, decompressing one at a time, so that
+        a scan of the whole array never holds more than the cache in memory. The chunks never written are skipped:
+        all their cells hold the fill value.
+
+        Returns:
+            An iterator of tuples (coordinates of the first cell of the chunk, MultiArray with the cells of the chunk).
+            The chunks at the end of a dimension are cut to the bounds of the array. When the chunks are not
+            compressed, the MultiArray is a view of the chunk, otherwise a copy.
+        """
+        for key in sorted(self._chunks.keys() | self._cache.keys()):
+            origin = tuple(k * c for k, c in zip(key, self._chunk_shape))
+            chunk = MultiArray._wrap(self._chunk(key, create=False), self._chunk_shape)
+            bounds = tuple(slice(0, min(c, d - o)) for c, d, o in zip(self._chunk_shape, self._dims, origin))
+            if any(b.stop < c for b, c in zip(bounds, self._chunk_shape)):
+                chunk = chunk[bounds]
+            yield origin, chunk if self._compression is None else chunk.copy()
+
+    def to_multi_array(self) -> MultiArray[T]:
+        """Copies the chunked array into a (dense) MultiArray with the same dtype.
+
+        Returns:
+            The new MultiArray.
+        """
+        result = MultiArray(*self._dims, dtype=self._dtype)
+        for origin, chunk in self.chunks():
+            region = tuple(slice(o, o + chunk.length(i)) for i, o in enumerate(origin))
+            result[region] = chunk
+        return result
@@ -0,0 +1,215 @@
+from __future__ import annotations
+from . import Array
+from .array import _iterate, _fail_fast
+from typing import TypeVar, Generic, Optional, Iterable, Iterator
+from itertools import chain
+T = TypeVar('T')
+
+
+class Deque(Generic[T]):
+    """Implements a double-ended queue as a circular buffer: the items occupy a range of an `Array` that wraps around
+    its end, starting at the position `head`. Adding or removing an item at either end only moves `head` or the end
+    of the range, so `append()`, `appendleft()`, `pop()` and `popleft()` take O(1) time (amortized, since a full
+    buffer doubles its capacity), and indexing takes O(1) time as well.
+
+    If `maxlen` is given the capacity is fixed: adding an item to a full deque overwrites the item at the opposite
+    end, which makes it a rolling window over the last `maxlen` items of a stream.
+    """
+
+    def __init__(self, capacity: int = 8, maxlen: Optional[int] = None) -> None:
+        """Creates an empty deque.
+
+        Args:
+            capacity (int): The initial number of items that can be stored without reallocating the buffer.
+            maxlen (int): The maximum number of items of a fixed-capacity deque, if None the deque grows as needed.
+        """
+        assert maxlen is None or maxlen > 0, f"`maxlen` must be greater than zero but it was {maxlen}!"
+        assert capacity > 0, f"`capacity` must be greater than zero but it was {capacity}!"
+        self._array: Array[T] = Array(maxlen if maxlen is not None else capacity)
+        self._head = 0
+        self._size = 0
+        self._maxlen = maxlen
+        # incremented by every change of the items at the ends or of the buffer, to detect changes during iteration
+        self._modifications = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._array)
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        return self._maxlen
+
+    def _position(self, index: int) -> int:
+        """Helper method that converts the index of an item to its position in the buffer."""
+        position = self._head + index
+        capacity = len(self._array)
+        return position - capacity if position >= capacity else position
+
+    def _reallocate(self, capacity: int) -> None:
+        """Helper method that moves the items into a new buffer with the given capacity, starting at position 0. The
+        (at most two) contiguous ranges of items are copied as blocks.
+        """
+        new_array = Array(capacity)
+        first = min(self._size, len(self._array) - self._head)
+        new_array.copy_from(self._array, slice(self._head, self._head + first), 0)
+        new_array.copy_from(self._array, slice(0, self._size - first), first)
+        self._array = new_array
+        self._head = 0
+        self._modifications += 1
+
+    def _ranges(self, start: int, count: int) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Helper method that finds the positions in the buffer of the `count` items from index `start`.
+
+        Returns:
+            The two ranges [start, stop) of positions, the second one is empty if the items do not wrap around.
+        """
+        capacity = len(self._array)
+        first = self._position(start) if count else 0
+        stop = first + count
+        if stop <= capacity:
+            return (first, stop), (0, 0)
+        return (first, capacity), (0, stop - capacity)
+
+    def append(self, item: T) -> None:
+        """Adds an item at the end of the deque. If the deque has a `maxlen` and it is full, the first item is
+        discarded.
+
+        Args:
+            item: The new item.
+        """
+        if self._size == len(self._array):
+            if self._maxlen is not None:
+                self._array._elements[self._head] = item
+                self._head = self._position(1)
+                self._modifications += 1
+                return
+            self._reallocate(2 * len(self._array))
+        self._array._elements[self._position(self._size)] = item
+        self._size += 1
+        self._modifications += 1
+
+    def appendleft(self, item: T) -> None:
+        """Adds an item at the beginning of the deque. If the deque has a `maxlen` and it is full, the last item is
+        discarded.
+
+        Args:
+            item: The new item.
+        """
+        if self._size == len(self._array):
+            if self._maxlen is None:
+                self._reallocate(2 * len(self._array))
+            else:
+                self._size -= 1
+        self._head = self._position(len(self._array) - 1)
+        self._array._elements[self._head] = item
+        self._size += 1
+        self._modifications += 1
+
+    def pop(self) -> T:
+        """Removes the last item of the deque, which must not be empty.
+
+        Returns:
+            The removed item.
+        """
+        assert self._size > 0, "The deque is empty!"
+        position = self._position(self._size - 1)
+        item = self._array._elements[position]
+        self._array._elements[position] = None
+        self._size -= 1
+        self._modifications += 1
+        return item
+
+    def popleft(self) -> T:
+        """Removes the first item of the deque, which must not be empty.
+
+        Returns:
+            The removed item.
+        """
+        assert self._size > 0, "The deque is empty!"
+        item = self._array._elements[self._head]
+        self._array._elements[self._head] = None
+        self._head = self._position(1)
+        self._size -= 1
+        self._modifications += 1
+        return item
+
+    def __getitem__(self, index: int) -> T:
+        assert 0 <= index < self._size, f"The index must be between 0 and {self._size - 1}, but it was {index}!"
+        return self._array._elements[self._position(index)]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        assert 0 <= index < self._size, f"The index must be between 0 and {self._size - 1}, but it was {index}!"
+        self._array._elements[self._position(index)] = item
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Adds the given items at the end of the deque, in order. The buffer is enlarged at most once, and the items
+        are written with at most two block assignments. If the deque has a `maxlen`, the items exceeding it are
+        discarded from the beginning, as if they were appended one at a time.
+
+        Args:
+            items: The new items.
+        """
+        items = list(items)
+        if self._maxlen is not None:
+            items = items[-self._maxlen:]
+            overflow = self._size + len(items) - self._maxlen
+            if overflow > 0:
+                self.drain(overflow)
+        elif self._size + len(items) > len(self._array):
+            capacity = len(self._array)
+            while capacity < self._size + len(items):
+                capacity *= 2
+            self._reallocate(capacity)
+        (start, stop), (wrap_start, wrap_stop) = self._ranges(self._size, len(items))
+        elements = self._array._elements
+        elements[start:stop] = items[:stop - start]
+        elements[wrap_start:wrap_stop] = items[stop - start:]
+        self._size += len(items)
+        self._modifications += 1
+
+    def drain(self, count: Optional[int] = None) -> list[T]:
+        """Removes the first `count` items of the deque (all of them if None or if the deque is shorter) with at most
+        two block reads.
+
+        Args:
+            count (int): The maximum number of items to remove.
+
+        Returns:
+            The removed items, in order.
+        """
+        assert count is None or count >= 0, f"`count` must not be negative but it was {count}!"
+        count = self._size if count is None else min(count, self._size)
+        (start, stop), (wrap_start, wrap_stop) = self._ranges(0, count)
+        elements = self._array._elements
+        items = elements[start:stop] + elements[wrap_start:wrap_stop]
+        self._array.fill(None, start, stop)
+        self._array.fill(None, wrap_start, wrap_stop)
+        self._head = self._position(count)
+        self._size -= count
+        self._modifications += 1
+        return items
+
+    def __iter__(self) -> Iterator[T]:
+        """Creates an iterator over the items, which raises a RuntimeError if the deque is modified at its ends while
+        it is used. The items are read in blocks of 1024, so an item assigned during the iteration after its block is
+        read is yielded with its old value.
+        """
+        (start, stop), (wrap_start, wrap_stop) = self._ranges(0, self._size)
+        elements = self._array._elements
+        return _fail_fast(self, chain(_iterate(elements, start, stop), _iterate(elements, wrap_start, wrap_stop)))
+
+    def __reversed__(self) -> Iterator[T]:
+        """Creates an iterator over the items from the last one, which raises a RuntimeError if the deque is modified
+        at its ends while it is used.
+        """
+        (start, stop), (wrap_start, wrap_stop) = self._ranges(0, self._size)
+        elements = self._array._elements
+        return _fail_fast(self, chain(_iterate(elements, wrap_start, wrap_stop, reverse=True),
+                                      _iterate(elements, start, stop, reverse=True)))
+
+    def __str__(self) -> str:
+        return "[" + ", ".join([str(item) for item in self]) + "]"
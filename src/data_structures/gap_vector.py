@@ -0,0 +1,147 @@
+from __future__ import annotations
+from typing import TypeVar, Iterator
+from itertools import chain
+from . import Array, Vector
+from .array import _iterate, _fail_fast
+T = TypeVar('T')
+
+
+class GapVector(Vector[T]):
+    """
+    Implements a Vector stored as a gap buffer: the free space of the underlying array is kept as a single gap at the
+    position of the last edit, with the items before it at the beginning of the array and the items after it at the
+    end. An insertion or a removal moves the gap to its position, copying only the items between the old and the new
+    position as a single block, and then takes O(1) time, so clustered edits (like the ones of a text editor around
+    the cursor) cost O(1) amortized instead of O(n).
+    """
+
+    def __init__(self, growth_factor: float = 2.0):
+        """
+        Creates an empty vector.
+
+        Args:
+            growth_factor: the factor by which the capacity of the underlying array is multiplied when it is full.
+        """
+        super().__init__(growth_factor)
+        # the gap is the range [_gap_start, _gap_end) of the underlying array
+        self._gap_start: int = 0
+        self._gap_end: int = self._physical_size
+
+    def _position(self, index: int) -> int:
+        """
+        Helper method that converts the index of an item to its position in the underlying array.
+        """
+        return index if index < self._gap_start else index + self._gap_end - self._gap_start
+
+    def __getitem__(self, index: int) -> T:
+        assert 0 <= index < len(self), f"The index must be between 0 and {len(self)-1}, but it was {index}!"
+        return self._array._elements[self._position(index)]
+
+    def __setitem__(self, index: int, item: T):
+        assert 0 <= index < len(self), f"The index must be between 0 and {len(self) - 1}, but it was {index}!"
+        self._array._elements[self._position(index)] = item
+
+    def _move_gap(self, index: int) -> None:
+        """
+        Helper method that moves the gap so that it starts before the item at position `index`.
+        """
+        gap_length = self._gap_end - self._gap_start
+        if index < self._gap_start:
+            # the items in [index, gap_start) move to the end of the gap
+            self._array.copy_from(self._array, slice(index, self._gap_start), index + gap_length)
+            self._array.fill(None, index, min(self._gap_start, index + gap_length))
+        elif index > self._gap_start:
+            # the items after the gap, up to index, move to its start
+            self._array.copy_from(self._array, slice(self._gap_end, index + gap_length), self._gap_start)
+            self._array.fill(None, max(index, self._gap_end), index + gap_length)
+        self._gap_start = index
+        self._gap_end = index + gap_length
+
+    def _reallocate(self, capacity: int) -> None:
+        """
+        Helper method that moves the items into a new underlying array with the given capacity, keeping the gap at the
+        same position.
+        """
+        new_array = Array(capacity)
+        after_gap = self._physical_size - self._gap_end
+        new_array.copy_from(self._array, slice(0, self._gap_start), 0)
+        new_array.copy_from(self._array, slice(self._gap_end, self._physical_size), capacity - after_gap)
+        del self._array
+        self._array = new_array
+        self._physical_size = capacity
+        self._gap_end = capacity - after_gap
+        self._modifications += 1
+
+    def append(self, item: T) -> None:
+        """
+        Appends a new item at the end of the vector.
+
+        Args:
+            item: the new item that is appended at the end of the vector.
+        """
+        self._insert(len(self), item)
+
+    def insert(self, index: int, item: T) -> None:
+        """
+        Given a positional index and a new item, inserts the new item at the provided index, after moving the gap
+        there.
+
+        Args:
+            index: an integer representing the positional index where we want to insert the new item.
+            item: the new item.
+        """
+        assert 0 <= index < len(self), f"The index must be between 0 and {len(self) - 1}, but it was {index}!"
+        self._insert(index, item)
+
+    def _insert(self, index: int, item: T) -> None:
+        if self._gap_start == self._gap_end:
+            self._grow()
+        self._move_gap(index)
+        self._array._elements[self._gap_start] = item
+        self._gap_start += 1
+        self._abstract_size += 1
+        self._modifications += 1
+
+    def remove(self, index: int) -> T:
+        """
+        Removes the item at the provided positional index, after moving the gap before it: the item is then removed by
+        enlarging the gap.
+
+        Args:
+            index: an integer representing the positional index of the item we want to remove.
+
+        Returns:
+            the removed item.
+        """
+        assert len(self) > 0, f"There are no items in the vector!"
+        assert 0 <= index < len(self), f"The index must be between 0 and {len(self) - 1}, but it was {index}!"
+        self._move_gap(index)
+        removed_item = self._array._elements[self._gap_end]
+        self._array._elements[self._gap_end] = None
+        self._gap_end += 1
+        self._abstract_size -= 1
+        self._modifications += 1
+        self._shrink_if_sparse()
+        return removed_item
+
+    def pop(self) -> T:
+        """
+        Removes the last item.
+
+        Returns:
+            the removed item.
+        """
+        assert len(self) > 0, f"There are no items in the vector!"
+        return self.remove(len(self) - 1)
+
+    def __iter__(self) -> Iterator[T]:
+        # the items before and after the gap, read in blocks of 1024: an item assigned after its block is read is
+        # yielded with its old value
+        elements = self._array._elements
+        return _fail_fast(self, chain(_iterate(elements, 0, self._gap_start),
+                                      _iterate(elements, self._gap_end, self._physical_size)))
+
+    def __reversed__(self) -> Iterator[T]:
+        elements = self._array._elements
+        return _fail_fast(self, chain(_iterate(elements, self._gap_end, self._physical_size, reverse=True),
+                                      _iterate(elements, 0, self._gap_start, reverse=True)))
@@ -0,0 +1,239 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Optional, Iterator
+from . import Array
+from .map import _MapEntry
+K = TypeVar('K')
+V = TypeVar('V')
+
+# marks a slot whose entry has been removed, so that probe sequences passing through it are not interrupted
+_DELETED = object()
+
+
+class HashMap(Generic[K, V]):
+    """Implements the Map Abstract Data Type as a hash table with open addressing (linear probing) on top of an
+    `Array`. Single-key operations run in O(1) expected time.
+
+    When the table becomes too full a new table is allocated, but the entries are not moved all at once: every
+    following operation migrates a small, fixed number of slots from the old table to the new one. Until the migration
+    is completed both tables are searched. In this way the cost of a resize is spread over many operations and no
+    single operation pays O(n).
+    """
+
+    # number of slots of the old table migrated by every operation while a resize is in progress
+    _REHASH_STEP = 4
+
+    def __init__(self, capacity: int = 8, max_load_factor: float = 0.75) -> None:
+        """Creates a new empty map.
+
+        Args:
+            capacity (int): The initial number of slots, it is rounded up to a power of two.
+            max_load_factor (float): The maximum ratio between occupied slots and capacity before the table grows, it
+                must be in the range (0, 1).
+        """
+        assert capacity > 0, f"`capacity` must be greater than zero but it was {capacity}!"
+        assert 0 < max_load_factor < 1, f"`max_load_factor` must be in range (0, 1) but it was {max_load_factor}!"
+        self._max_load_factor = max_load_factor
+        self._size = 0
+        self._table, self._capacity = self._new_table(capacity)
+        self._used = 0  # live entries plus deleted slots in the current table
+        self._old_table: Optional[Array] = None
+        self._old_capacity = 0
+        self._migrate_ndx = 0
+
+    @staticmethod
+    def _new_table(capacity: int) -> tuple[Array, int]:
+        """Helper method that allocates an empty table whose capacity is the smallest power of two >= `capacity`.
+
+        Returns:
+            A tuple containing the new table and its capacity.
+        """
+        actual_capacity = 1
+        while actual_capacity < capacity:
+            actual_capacity *= 2
+        return Array(actual_capacity), actual_capacity
+
+    def __len__(self) -> int:
+        """Computes the number of key/value pairs in the map.
+
+        Returns:
+            The number of entries.
+        """
+        return self._size
+
+    @property
+    def load_factor(self) -> float:
+        """Returns the ratio between the occupied slots (including the deleted ones) and the capacity of the current
+        table.
+
+        Returns:
+            The load factor.
+        """
+        return self._used / self._capacity
+
+    @property
+    def is_rehashing(self) -> bool:
+        """Tells if an incremental resize is in progress.
+
+        Returns:
+            True if the entries are still split between an old and a new table, otherwise False.
+        """
+        return self._old_table is not None
+
+    @staticmethod
+    def _probe(table: Array, capacity: int, key: K) -> Optional[int]:
+        """Helper method that finds the slot of a table containing the given key.
+
+        Returns:
+            The index of the slot or None if the key is not in the table.
+        """
+        mask = capacity - 1
+        ndx = hash(key) & mask
+        while True:
+            slot = table[ndx]
+            if slot is None:
+                return None
+            if slot is not _DELETED and slot.key == key:
+                return ndx
+            ndx = (ndx + 1) & mask
+
+    def _insert_new(self, entry: _MapEntry) -> None:
+        """Helper method that stores an entry, whose key is known not to be in the map, in the current table."""
+        mask = self._capacity - 1
+        ndx = hash(entry.key) & mask
+        while True:
+            slot = self._table[ndx]
+            if slot is None:
+                self._used += 1
+                break
+            if slot is _DELETED:
+                break
+            ndx = (ndx + 1) & mask
+        self._table[ndx] = entry
+
+    def _start_rehash(self) -> None:
+        """Helper method that allocates the new table and begins an incremental resize. If most of the occupied slots
+        are deleted ones the capacity is kept, otherwise it is doubled.
+        """
+        if self.is_rehashing:
+            self._finish_rehash()
+        if (self._size + 1) > self._max_load_factor * self._capacity / 2:
+            new_capacity = self._capacity * 2
+        else:
+            new_capacity = self._capacity
+        self._old_table, self._old_capacity = self._table, self._capacity
+        self._table, self._capacity = self._new_table(new_capacity)
+        self._used = 0
+        self._migrate_ndx = 0
+
+    def _rehash_step(self, num_slots: int) -> None:
+        """Helper method that moves the live entries found in the next `num_slots` slots of the old table into the
+        current one.
+        """
+        old_table = self._old_table
+        stop = min(self._migrate_ndx + num_slots, self._old_capacity)
+        for i in range(self._migrate_ndx, stop):
+            slot = old_table[i]
+            if slot is not None and slot is not _DELETED:
+                self._insert_new(slot)
+                old_table[i] = _DELETED
+        self._migrate_ndx = stop
+        if stop == self._old_capacity:
+            self._old_table = None
+            self._old_capacity = 0
+
+    def _finish_rehash(self) -> None:
+        """Helper method that completes the resize in progress, if any."""
+        if self.is_rehashing:
+            self._rehash_step(self._old_capacity)
+
+    def _locate(self, key: K) -> tuple[Optional[Array], Optional[int]]:
+        """Helper method that finds the table and the slot containing the given key.
+
+        Returns:
+            A tuple (table, index) or (None, None) if the key is not in the map.
+        """
+        ndx = self._probe(self._table, self._capacity, key)
+        if ndx is not None:
+            return self._table, ndx
+        if self._old_table is not None:
+            ndx = self._probe(self._old_table, self._old_capacity, key)
+            if ndx is not None:
+                return self._old_table, ndx
+        return None, None
+
+    def __contains__(self, key: K) -> bool:
+        """Determines if the given key is in the map.
+
+        Args:
+            key: The given key.
+
+        Returns:
+            True if the key is found and False otherwise.
+        """
+        return self._locate(key)[0] is not None
+
+    def add(self, key: K, value: V) -> bool:
+        """Adds a new key/value pair to the map if the key is not already in the map or replaces the data associated
+        with the key if the key is in the map.
+
+        Args:
+            key: The given key.
+            value: The given value.
+
+        Returns:
+            True if this is a new key and False if the data associated with the existing key is replaced.
+        """
+        if self.is_rehashing:
+            self._rehash_step(self._REHASH_STEP)
+        table, ndx = self._locate(key)
+        if table is not None:
+            table[ndx].value = value
+            return False
+        if self._used + 1 > self._max_load_factor * self._capacity:
+            self._start_rehash()
+            self._rehash_step(self._REHASH_STEP)
+        self._insert_new(_MapEntry(key, value))
+        self._size += 1
+        return True
+
+    def remove(self, key: K) -> None:
+        """Removes the key/value pair for the given key if it is in the map and raises an exception otherwise.
+
+        Args:
+            key: The given key.
+        """
+        if self.is_rehashing:
+            self._rehash_step(self._REHASH_STEP)
+        table, ndx = self._locate(key)
+        assert table is not None, f"Not available key '{key}'"
+        table[ndx] = _DELETED
+        self._size -= 1
+
+    def value_of(self, key: K) -> V:
+        """Returns the data record associated with the given key. The key must exist in the map or an exception is
+        raised.
+
+        Args:
+            key: The given key.
+
+        Returns:
+            The value associated to the given key.
+        """
+        table, ndx = self._locate(key)
+        assert table is not None, f"Not available key '{key}'"
+        return table[ndx].value
+
+    def __iter__(self) -> Iterator[K]:
+        """Creates and returns an iterator that can be used to iterate over the keys in the map.
+
+        Returns:
+            An iterator over the keys.
+        """
+        tables = [(self._table, self._capacity)]
+        if self._old_table is not None:
+            tables.append((self._old_table, self._old_capacity))
+        for table, capacity in tables:
+            for i in range(capacity):
+                slot = table[i]
+                if slot is not None and slot is not _DELETED:
+                    yield slot.key
@@ -0,0 +1,117 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Iterator
+from . import HashMap
+T = TypeVar('T')
+
+
+class HashSet(Generic[T]):
+    """Implements the Set Abstract Data Type on top of a `HashMap` whose keys are the items of the set. Membership tests,
+    insertions and removals run in O(1) expected time, so the set algebra runs in linear time.
+
+    The set operations accept as `other` operand any collection that implements the __len__, __contains__ and __iter__
+    dunder methods (e.g. `Set` or another `HashSet`).
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        """Creates a new empty set.
+
+        Args:
+            capacity (int): The number of items the set can hold before its table needs to grow.
+        """
+        # twice the slots keep the load factor at or below 1/2, under the default maximum of the map
+        self._map: HashMap[T, None] = HashMap(max(8, 2 * capacity))
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._map
+
+    def add(self, item: T) -> None:
+        """Adds a new item to the set if not already available.
+
+        Args:
+            item: The item to be added.
+        """
+        self._map.add(item, None)
+
+    def remove(self, item: T) -> None:
+        """Removes the provided item, which must be in the set.
+
+        Args:
+            item: The item to be removed.
+        """
+        assert item in self, f"The item {item} is not in the set!"
+        self._map.remove(item)
+
+    def __eq__(self, other: HashSet[T]) -> bool:
+        if len(self) == len(other):
+            return self.is_subset_of(other)
+        return False
+
+    def is_subset_of(self, other: HashSet[T]) -> bool:
+        """Computes if the self set is a subset of the other provided set.
+
+        Args:
+            other: The other set.
+
+        Returns:
+            True if it is a subset, otherwise False.
+        """
+        if len(self) > len(other):
+            return False
+        for item in self:
+            if item not in other:
+                return False
+        return True
+
+    def union(self, other: HashSet[T]) -> HashSet[T]:
+        """Computes the union between the self set and the other provided set in O(n + m).
+
+        Args:
+            other: The other set.
+
+        Returns:
+            The union set.
+        """
+        union_set = HashSet(len(self) + len(other))
+        for item in self:
+            union_set.add(item)
+        for item in other:
+            union_set.add(item)
+        return union_set
+
+    def intersect(self, other: HashSet[T]) -> HashSet[T]:
+        """Computes the intersection between the self set and the other provided set. Only the smaller set is traversed,
+        so the cost is O(min(n, m)).
+
+        Args:
+            other: The other set.
+
+        Returns:
+            The intersection set.
+        """
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+        intersection_set = HashSet(len(smaller))
+        for item in smaller:
+            if item in larger:
+                intersection_set.add(item)
+        return intersection_set
+
+    def difference(self, other: HashSet[T]) -> HashSet[T]:
+        """Computes the difference between the self set and the other provided set in O(n).
+
+        Args:
+            other: The other set.
+
+        Returns:
+            The difference set.
+        """
+        difference_set = HashSet(len(self))
+        for item in self:
+            if item not in other:
+                difference_set.add(item)
+        return difference_set
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._map)
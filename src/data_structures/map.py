@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, Optional, Iterator
+from operator import attrgetter
+from .array import _fail_fast
 K = TypeVar('K')
 V = TypeVar('V')
 
@@ -14,6 +16,8 @@ class Map(Generic[K, V]):
         Creates a new empty map.
         """
         self._entry_list: list[_MapEntry] = list()
+        # incremented by every addition and removal of a key, to detect changes during iteration
+        self._modifications = 0
 
     def __len__(self) -> int:
         """
@@ -52,6 +56,7 @@ class Map(Generic[K, V]):
         else:
             new_entry = _MapEntry(key, value)
             self._entry_list.append(new_entry)
+            self._modifications += 1
             return True
 
     def remove(self, key: K) -> None:
@@ -64,6 +69,7 @@ class Map(Generic[K, V]):
         index = self._find_position(key)
         assert index is not None, f"Not available key '{key}'"
         self._entry_list.pop(index)
+        self._modifications += 1
 
     def value_of(self, key: K) -> V:
         """
@@ -76,33 +82,21 @@ class Map(Generic[K, V]):
         assert index is not None, f"Not available key '{key}'"
         return self._entry_list[index].value
 
-    def __iter__(self) -> _MapIterator:
+    def __iter__(self) -> Iterator[K]:
         """
-        Creates and returns an iterator that can be used to iterate over the keys in the map.
+        Creates and returns an iterator that can be used to iterate over the keys in the map. It raises a RuntimeError
+        if a key is added or removed while it is used.
 
-        :return: a custom map iterator class called _MapIterator
+        :return: an iterator over the keys
         """
-        return _MapIterator(self._entry_list)
+        return _fail_fast(self, map(_get_key, self._entry_list))
 
+    def __reversed__(self) -> Iterator[K]:
+        return _fail_fast(self, map(_get_key, reversed(self._entry_list)))
 
-class _MapIterator:
-    """
-    Helper class that implements a map entry.
-    """
-    def __init__(self, entries: list[_MapEntry]) -> None:
-        self._map_entries = entries
-        self._cur_ndx = 0
-
-    def __iter__(self) -> _MapIterator:
-        return self
-
-    def __next__(self) -> _MapEntry:
-        if self._cur_ndx < len(self._map_entries):
-            entry = self._map_entries[self._cur_ndx]
-            self._cur_ndx += 1
-            return entry
-        else:
-            raise StopIteration
+
+# reads the attribute directly, skipping the call of the `key` property
+_get_key = attrgetter('_key')
 
 
 class _MapEntry(Generic[K, V]):
@@ -1,15 +1,50 @@
 from __future__ import annotations
 from . import Array2D
-from typing import TypeVar, Generic
+from .matrix_product import strassen_product, DEFAULT_STRASSEN_THRESHOLD, DEFAULT_BLOCK_SIZE, \
+    DEFAULT_PARALLEL_THRESHOLD
+from .array import _DTYPES
+from typing import TypeVar, Generic, Optional
+from operator import add, sub
 from numbers import Number
 T = TypeVar('T',  bound=Number)  # can be any subtype of Number
 
+try:
+    import numpy
+except ImportError:  # NumPy is optional, without it every operation runs in pure Python
+    numpy = None
+
 
 class Matrix(Generic[T]):
 
-    def __init__(self, num_rows: int, num_cols: int) -> None:
-        self._grid = Array2D(num_rows, num_cols)
+    # products whose dimensions are all at least `strassen_threshold` use the Strassen algorithm, the others the
+    # blocked kernel with tiles of `block_size` x `block_size` elements (see matrix_product.py)
+    strassen_threshold: int = DEFAULT_STRASSEN_THRESHOLD
+    block_size: int = DEFAULT_BLOCK_SIZE
+
+    # with more than one worker, products of at least `parallel_threshold` multiply-adds are split among
+    # `parallel_workers` processes (see parallel_product.py)
+    parallel_workers: int = 1
+    parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD
+
+    # typed matrices dispatch their arithmetic to NumPy when it is installed, unless this flag is turned off
+    use_numpy: bool = True
+
+    def __init__(self, num_rows: int, num_cols: int, dtype: Optional[str] = None) -> None:
+        """
+        Creates a matrix of zeros. If `dtype` is given (see `Array`) the elements are stored as raw C numbers, and
+        when NumPy is available scale_by, transpose, +, -, * and == are computed by NumPy on a zero-copy view of them.
+        """
+        self._grid = Array2D(num_rows, num_cols, dtype)
         self._grid.clear(0)
+        # LU factorization reused by solve(), det() and inverse() until the matrix is modified
+        self._lu: Optional[LUDecomposition] = None
+        # incremented whenever the elements change, so that the lazy expressions reading the matrix can tell if their
+        # cached value is stale
+        self._modifications = 0
+
+    @property
+    def dtype(self) -> Optional[str]:
+        return self._grid._elements.dtype
 
     @property
     def num_rows(self) -> int:
@@ -19,55 +54,176 @@ class Matrix(Generic[T]):
     def num_cols(self) -> int:
         return self._grid.num_cols
 
+    def _to_flat(self) -> list[T]:
+        """
+        Copies the elements of the matrix into a list in row-major order
+        """
+        return self._grid._elements._elements[:]
+
+    @staticmethod
+    def _from_flat(num_rows: int, num_cols: int, data: list[T], dtype: Optional[str] = None) -> Matrix[T]:
+        """
+        Creates a matrix, typed if `dtype` is given, from the list of its elements in row-major order
+        """
+        result = Matrix(num_rows, num_cols, dtype)
+        result._store_flat(data)
+        return result
+
+    def _store_flat(self, data: list[T]) -> None:
+        """
+        Overwrites all the elements of the matrix with the list `data`, in row-major order
+        """
+        self._grid._elements._elements[:] = data
+        self._modified()
+
+    def _modified(self) -> None:
+        """
+        Discards the data derived from the elements of the matrix, which have been changed
+        """
+        self._lu = None
+        self._modifications += 1
+
+    def _transposed_flat(self) -> list[T]:
+        """
+        Copies the elements of the matrix into a list in column-major order, i.e. the row-major order of the transpose
+        """
+        n = self.num_cols
+        data = self._to_flat()
+        transposed = []
+        for j in range(n):
+            transposed.extend(data[j::n])
+        return transposed
+
+    def _check_out(self, out: Optional[Matrix[T]], num_rows: int, num_cols: int,
+                   dtype: Optional[str] = None) -> Matrix[T]:
+        """
+        Returns `out`, after checking its dimensions, or a new matrix with the given dtype if it is None
+        """
+        if out is None:
+            return Matrix(num_rows, num_cols, dtype)
+        assert out.num_rows == num_rows and out.num_cols == num_cols, \
+            f"`out` must be a ({num_rows}, {num_cols}) matrix but it is ({out.num_rows}, {out.num_cols})!"
+        return out
+
+    @staticmethod
+    def _result_dtype(operands: list[Optional[Matrix[T]]], scalars: tuple = ()) -> Optional[str]:
+        """
+        Computes the dtype of the result of an operation in pure Python, following the NumPy promotion in the common
+        cases: untyped if any operand is untyped, the dtype of the operands if they agree, otherwise 'f8' if any of
+        them (or of the scalars) is a float and the widest integer type if they are all integers
+        """
+        dtypes = {operand.dtype for operand in operands if operand is not None}
+        if None in dtypes:
+            return None
+        kinds = {dtype[0] for dtype in dtypes}
+        if 'f' not in kinds and not all(isinstance(scalar, int) for scalar in scalars):
+            return 'f8'
+        if len(dtypes) == 1:
+            return dtypes.pop()
+        if 'f' in kinds:
+            return 'f8'
+        size = max(int(dtype[1]) for dtype in dtypes)
+        return f"{kinds.pop()}{size}" if len(kinds) == 1 else 'i8'
+
+    def _numpy_enabled(self, *others: Matrix[T]) -> bool:
+        """
+        Tells if an operation between this matrix and `others` can be dispatched to NumPy
+        """
+        if numpy is None or not self.use_numpy:
+            return False
+        return self.dtype is not None and all(other.dtype is not None for other in others)
+
+    def _as_ndarray(self) -> numpy.ndarray:
+        """
+        Returns a 2-D ndarray sharing the memory of a typed matrix
+        """
+        return numpy.asarray(self._grid._elements.memoryview()).reshape(self.num_rows, self.num_cols)
+
+    @staticmethod
+    def _from_ndarray(array: numpy.ndarray) -> Matrix[T]:
+        """
+        Creates a matrix from a 2-D ndarray, typed if the dtype of the ndarray is supported by `Array`
+        """
+        dtype = f"{array.dtype.kind}{array.dtype.itemsize}"
+        if dtype not in _DTYPES:
+            return Matrix._from_flat(array.shape[0], array.shape[1], array.ravel().tolist())
+        result = Matrix(array.shape[0], array.shape[1], dtype)
+        result._as_ndarray()[...] = array
+        return result
+
+    def lazy(self) -> MatrixExpression[T]:
+        """
+        Starts a lazily evaluated expression: the operators applied to the returned object build an expression tree
+        which is evaluated, with fused elementwise operations and optimally ordered products, only when needed (see
+        `MatrixExpression`)
+        """
+        from .matrix_expression import _Leaf
+        return _Leaf(self)
+
     def __getitem__(self, ndx_tuple: tuple[int, int]) -> T:
         return self._grid[ndx_tuple[0], ndx_tuple[1]]
 
     def __setitem__(self, ndx_tuple: tuple[int, int], value: T) -> None:
         self._grid[ndx_tuple[0], ndx_tuple[1]] = value
+        self._modified()
 
-    def scale_by(self, scalar: T) -> Matrix[T]:
+    def scale_by(self, scalar: T, out: Optional[Matrix[T]] = None) -> Matrix[T]:
         """
-        Implements the product between a matrix and a scalar value
+        Implements the product between a matrix and a scalar value. The result is written into `out` if given,
+        otherwise into a new matrix
         """
-        result = Matrix(self.num_rows, self.num_cols)
-        for i in range(self.num_rows):
-            for j in range(self.num_cols):
-                result[i, j] = scalar * self[i, j]
+        if out is None and self._numpy_enabled():
+            return Matrix._from_ndarray(self._as_ndarray() * scalar)
+        result = self._check_out(out, self.num_rows, self.num_cols, Matrix._result_dtype([self], (scalar,)))
+        if self._numpy_enabled(result):
+            numpy.multiply(self._as_ndarray(), scalar, out=result._as_ndarray(), casting='unsafe')
+            result._modified()
+            return result
+        result._store_flat([scalar * x for x in self._to_flat()])
         return result
 
-    def transpose(self) -> Matrix[T]:
+    def transpose(self, out: Optional[Matrix[T]] = None) -> Matrix[T]:
         """
-        Computes the transpose of the matrix
+        Computes the transpose of the matrix. The result is written into `out` if given, otherwise into a new matrix
         """
-        result = Matrix(self.num_cols, self.num_rows)
-        for i in range(self.num_rows):
-            for j in range(self.num_cols):
-                result[j, i] = self[i, j]
+        if out is None and self._numpy_enabled():
+            return Matrix._from_ndarray(self._as_ndarray().T)
+        result = self._check_out(out, self.num_cols, self.num_rows, self.dtype)
+        if result is self:
+            self.transpose_in_place()
+            return self
+        if self._numpy_enabled(result):
+            result._as_ndarray()[...] = self._as_ndarray().T
+            result._modified()
+            return result
+        result._store_flat(self._transposed_flat())
         return result
 
     def __add__(self, other: Matrix[T]) -> Matrix[T]:
         """
         Implements the sum operator between two matrices.
         """
+        if not isinstance(other, Matrix):
+            return NotImplemented
         assert self.num_rows == other.num_rows and self.num_cols == other.num_cols, \
             "The matrices must have same dimensions!"
-        result = Matrix(self.num_rows, self.num_cols)
-        for i in range(self.num_rows):
-            for j in range(self.num_cols):
-                result[i, j] = self[i, j] + other[i, j]
-        return result
+        if self._numpy_enabled(other):
+            return Matrix._from_ndarray(self._as_ndarray() + other._as_ndarray())
+        return Matrix._from_flat(self.num_rows, self.num_cols, list(map(add, self._to_flat(), other._to_flat())),
+                                 Matrix._result_dtype([self, other]))
 
     def __sub__(self, other: Matrix[T]) -> Matrix[T]:
         """
         Implements the subtraction operator between two matrices.
         """
+        if not isinstance(other, Matrix):
+            return NotImplemented
         assert self.num_rows == other.num_rows and self.num_cols == other.num_cols, \
             "The matrices must have same dimensions!"
-        result = Matrix(self.num_rows, self.num_cols)
-        for i in range(self.num_rows):
-            for j in range(self.num_cols):
-                result[i, j] = self[i, j] - other[i, j]
-        return result
+        if self._numpy_enabled(other):
+            return Matrix._from_ndarray(self._as_ndarray() - other._as_ndarray())
+        return Matrix._from_flat(self.num_rows, self.num_cols, list(map(sub, self._to_flat(), other._to_flat())),
+                                 Matrix._result_dtype([self, other]))
 
     def __mul__(self, other: Matrix[T]) -> Matrix[T]:
         """
@@ -75,25 +231,190 @@ class Matrix(Generic[T]):
         given A(m,n) * B(n,q) = C(m,q), where (m,n), (n,q) and (m,q) are dimensions:
 
         C_ik = A_i1 * B_1k + A_i2 * B_2k + ... + A_in * B_nk
+
+        The product is computed on the flat row-major copies of the operands, by the blocked kernel or by the Strassen
+        algorithm for large matrices, or by a pool of processes if `parallel_workers` is greater than one.
         """
+        if not isinstance(other, Matrix):
+            return NotImplemented
         assert self.num_cols == other.num_rows, \
             f"Number of columns in A and number rows in B must be equal but "\
             f"they are {self.num_cols} cols and {other.num_rows} rows!"
-        result = Matrix(self.num_rows, other.num_cols)
-        for i in range(self.num_rows):
-            for k in range(other.num_cols):
-                r_ik = 0
-                for j in range(self.num_cols):
-                    r_ik += self[i, j] * other[j, k]
-                result[i, k] = r_ik
+        if self._numpy_enabled(other):
+            return Matrix._from_ndarray(self._as_ndarray() @ other._as_ndarray())
+        if self.parallel_workers > 1 and self.num_rows * self.num_cols * other.num_cols >= self.parallel_threshold:
+            from .parallel_product import parallel_product
+            return parallel_product(self, other, self.parallel_workers, self.parallel_threshold, self.block_size)
+        data = strassen_product(self._to_flat(), other._to_flat(), self.num_rows, self.num_cols, other.num_cols,
+                                self.strassen_threshold, self.block_size)
+        return Matrix._from_flat(self.num_rows, other.num_cols, data, Matrix._result_dtype([self, other]))
+
+    def __iadd__(self, other: Matrix[T]) -> Matrix[T]:
+        """
+        Implements the in-place sum, A += B stores the result into A without allocating a new matrix
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        assert self.num_rows == other.num_rows and self.num_cols == other.num_cols, \
+            "The matrices must have same dimensions!"
+        if self._numpy_enabled(other):
+            self._as_ndarray()[...] += other._as_ndarray()
+            self._modified()
+        else:
+            self._store_flat(list(map(add, self._to_flat(), other._to_flat())))
+        return self
+
+    def __isub__(self, other: Matrix[T]) -> Matrix[T]:
+        """
+        Implements the in-place subtraction, A -= B stores the result into A without allocating a new matrix
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        assert self.num_rows == other.num_rows and self.num_cols == other.num_cols, \
+            "The matrices must have same dimensions!"
+        if self._numpy_enabled(other):
+            self._as_ndarray()[...] -= other._as_ndarray()
+            self._modified()
+        else:
+            self._store_flat(list(map(sub, self._to_flat(), other._to_flat())))
+        return self
+
+    def __imul__(self, scalar: T) -> Matrix[T]:
+        """
+        Implements the in-place product by a scalar value, A *= s. The in-place matrix product is not supported, so
+        A *= B computes A * B as a new matrix
+        """
+        if isinstance(scalar, Matrix):
+            return NotImplemented
+        if self._numpy_enabled():
+            self._as_ndarray()[...] *= scalar
+            self._modified()
+        else:
+            self._store_flat([scalar * x for x in self._to_flat()])
+        return self
+
+    def transpose_in_place(self) -> None:
+        """
+        Transposes a square matrix by overwriting its elements
+        """
+        assert self.num_rows == self.num_cols, "Only square matrices can be transposed in place!"
+        if self._numpy_enabled():
+            array = self._as_ndarray()
+            array[...] = array.T.copy()
+            self._modified()
+            return
+        self._store_flat(self._transposed_flat())
+
+    def axpy(self, alpha: T, x: Matrix[T]) -> Matrix[T]:
+        """
+        Computes Y = alpha*X + Y in a single pass, where Y is this matrix, without any temporary matrix
+
+        Returns:
+            This matrix.
+        """
+        assert self.num_rows == x.num_rows and self.num_cols == x.num_cols, \
+            "The matrices must have same dimensions!"
+        if self._numpy_enabled(x):
+            self._as_ndarray()[...] += alpha * x._as_ndarray()
+            self._modified()
+        else:
+            self._store_flat([alpha * a + b for a, b in zip(x._to_flat(), self._to_flat())])
+        return self
+
+    @staticmethod
+    def gemm(a: Matrix[T], b: Matrix[T], alpha: T = 1, beta: T = 0, c: Optional[Matrix[T]] = None,
+             out: Optional[Matrix[T]] = None) -> Matrix[T]:
+        """
+        Computes alpha*A*B + beta*C, scaling and accumulating the product in the same pass that stores it. The result
+        is written into `out` if given, which can be C itself to update it in place, or into a new matrix
+
+        Args:
+            a: The (m, n) matrix A.
+            b: The (n, q) matrix B.
+            alpha: The scale factor of the product.
+            beta: The scale factor of C, ignored if C is None.
+            c: The (m, q) matrix C, if None only alpha*A*B is computed.
+            out: The (m, q) matrix where the result is stored.
+
+        Returns:
+            The matrix containing the result.
+        """
+        assert a.num_cols == b.num_rows, \
+            f"Number of columns in A and number rows in B must be equal but "\
+            f"they are {a.num_cols} cols and {b.num_rows} rows!"
+        m, q = a.num_rows, b.num_cols
+        if c is not None:
+            assert c.num_rows == m and c.num_cols == q, f"C must be a ({m}, {q}) matrix!"
+        result = a._check_out(out, m, q, Matrix._result_dtype([a, b, c], (alpha, beta) if c is not None else (alpha,)))
+        if a._numpy_enabled(b, result, *([c] if c is not None else [])):
+            product = a._as_ndarray() @ b._as_ndarray()
+            if c is not None and beta != 0:
+                product = alpha * product + beta * c._as_ndarray()
+            elif alpha != 1:
+                product = alpha * product
+            result._as_ndarray()[...] = product
+            result._modified()
+            return result
+        product = strassen_product(a._to_flat(), b._to_flat(), m, a.num_cols, q, a.strassen_threshold, a.block_size)
+        if c is not None and beta != 0:
+            data = [alpha * p + beta * x for p, x in zip(product, c._to_flat())]
+        elif alpha != 1:
+            data = [alpha * p for p in product]
+        else:
+            data = product
+        result._store_flat(data)
         return result
 
+    def lu(self) -> LUDecomposition:
+        """
+        Returns the LU factorization with partial pivoting of the square matrix, computed once and reused until the
+        matrix is modified
+        """
+        if self._lu is None:
+            from .matrix_decomposition import LUDecomposition
+            self._lu = LUDecomposition(self)
+        return self._lu
+
+    def cholesky(self) -> CholeskyDecomposition:
+        """
+        Computes the Cholesky factorization of the symmetric positive definite matrix
+        """
+        from .matrix_decomposition import CholeskyDecomposition
+        return CholeskyDecomposition(self)
+
+    def qr(self) -> QRDecomposition:
+        """
+        Computes the Householder QR factorization of the matrix, which must have at least as many rows as columns
+        """
+        from .matrix_decomposition import QRDecomposition
+        return QRDecomposition(self)
+
+    def solve(self, b: Matrix[T]) -> Matrix[T]:
+        """
+        Solves the linear systems A X = B, where A is this square matrix and B contains a right-hand side per column.
+        The LU factorization is cached, so solving again with other right-hand sides costs O(n^2) per column
+        """
+        return self.lu().solve(b)
+
+    def det(self) -> T:
+        """
+        Computes the determinant of the square matrix from its (cached) LU factorization
+        """
+        return self.lu().det()
+
+    def inverse(self) -> Matrix[T]:
+        """
+        Computes the inverse of the non-singular square matrix from its (cached) LU factorization
+        """
+        return self.lu().inverse()
+
     def __eq__(self, other: Matrix[T]) -> bool:
-        for i in range(self.num_rows):
-            for j in range(self.num_cols):
-                if self[i, j] != other[i, j]:
-                    return False
-        return True
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self._numpy_enabled(other):
+            return bool(numpy.array_equal(self._as_ndarray(), other._as_ndarray()))
+        return self.num_rows == other.num_rows and self.num_cols == other.num_cols and \
+            self._to_flat() == other._to_flat()
 
     def __str__(self):
         return self._grid.__str__()
@@ -0,0 +1,293 @@
+"""Factorizations of a `Matrix` and the linear system solvers built on them.
+
+A factorization costs O(n^3), but once computed every system A x = b with a new right-hand side costs only O(n^2), so
+the factorization objects are meant to be kept and reused (`Matrix.solve()`, `det()` and `inverse()` cache the LU one).
+The factors are stored as lists of rows of Python numbers.
+"""
+from __future__ import annotations
+from . import Matrix
+from math import sqrt
+from operator import mul
+
+
+def _rows_of(matrix: Matrix) -> list[list]:
+    """Helper function that copies a matrix into a list of rows."""
+    data = matrix._to_flat()
+    n = matrix.num_cols
+    return [data[i * n:(i + 1) * n] for i in range(matrix.num_rows)]
+
+
+def _columns_of(matrix: Matrix) -> list[list]:
+    """Helper function that copies a matrix into a list of columns."""
+    data = matrix._to_flat()
+    q = matrix.num_cols
+    return [data[k::q] for k in range(q)]
+
+
+def _from_columns(columns: list[list]) -> Matrix:
+    """Helper function that builds a matrix from the list of its columns."""
+    num_rows, num_cols = len(columns[0]), len(columns)
+    flat = []
+    for i in range(num_rows):
+        flat.extend([column[i] for column in columns])
+    return Matrix._from_flat(num_rows, num_cols, flat)
+
+
+def _forward_substitution(lower: list[list], b: list, unit_diagonal: bool) -> list:
+    """Helper function that solves L y = b for a lower triangular L."""
+    y = []
+    for i, row in enumerate(lower):
+        value = b[i] - sum(map(mul, row[:i], y))
+        y.append(value if unit_diagonal else value / row[i])
+    return y
+
+
+def _backward_substitution(upper: list[list], y: list) -> list:
+    """Helper function that solves U x = y for an upper triangular U with a non-zero diagonal."""
+    n = len(upper)
+    x = [0] * n
+    for i in range(n - 1, -1, -1):
+        row = upper[i]
+        x[i] = (y[i] - sum(map(mul, row[i + 1:n], x[i + 1:]))) / row[i]
+    return x
+
+
+class LUDecomposition:
+    """Implements the LU factorization with partial pivoting of a square matrix: P A = L U, where P is a permutation,
+    L is lower triangular with unit diagonal and U is upper triangular. At every step the row with the largest pivot
+    (in absolute value) is swapped in, which keeps the factorization numerically stable.
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        """Factorizes the given square matrix in O(n^3).
+
+        Args:
+            matrix: The matrix A.
+        """
+        assert matrix.num_rows == matrix.num_cols, "Only square matrices have an LU decomposition!"
+        n = matrix.num_rows
+        rows = _rows_of(matrix)
+        perm = list(range(n))
+        sign = 1
+        singular = False
+        for k in range(n):
+            pivot = max(range(k, n), key=lambda i: abs(rows[i][k]))
+            if rows[pivot][k] == 0:
+                singular = True
+                continue
+            if pivot != k:
+                rows[k], rows[pivot] = rows[pivot], rows[k]
+                perm[k], perm[pivot] = perm[pivot], perm[k]
+                sign = -sign
+            pivot_row = rows[k]
+            for i in range(k + 1, n):
+                row = rows[i]
+                factor = row[k] / pivot_row[k]
+                if factor != 0:
+                    row[k + 1:] = [x - factor * p for x, p in zip(row[k + 1:], pivot_row[k + 1:])]
+                row[k] = factor
+        # L (without its unit diagonal) and U share the same rows
+        self._lu = rows
+        self._perm = perm
+        self._sign = sign
+        self._singular = singular
+
+    @property
+    def is_singular(self) -> bool:
+        return self._singular
+
+    def lower(self) -> Matrix:
+        """Returns the lower triangular factor L."""
+        n = len(self._lu)
+        return Matrix._from_flat(n, n, [self._lu[i][j] if j < i else int(i == j) for i in range(n) for j in range(n)])
+
+    def upper(self) -> Matrix:
+        """Returns the upper triangular factor U."""
+        n = len(self._lu)
+        return Matrix._from_flat(n, n, [self._lu[i][j] if j >= i else 0 for i in range(n) for j in range(n)])
+
+    def permutation(self) -> list[int]:
+        """Returns the permutation P as a list: the row i of P A is the row `permutation()[i]` of A."""
+        return self._perm[:]
+
+    def det(self) -> float:
+        """Computes the determinant of A as the signed product of the diagonal of U, in O(n).
+
+        Returns:
+            The determinant.
+        """
+        if self._singular:
+            return 0
+        result = self._sign
+        for i, row in enumerate(self._lu):
+            result *= row[i]
+        return result
+
+    def _solve_vector(self, b: list) -> list:
+        y = _forward_substitution(self._lu, [b[p] for p in self._perm], unit_diagonal=True)
+        return _backward_substitution(self._lu, y)
+
+    def solve(self, b: Matrix) -> Matrix:
+        """Solves the systems A X = B for every column of B in O(n^2) per column.
+
+        Args:
+            b: The (n, k) matrix of the right-hand sides.
+
+        Returns:
+            The (n, k) matrix X.
+        """
+        assert not self._singular, "The matrix is singular!"
+        assert b.num_rows == len(self._lu), f"The right-hand side must have {len(self._lu)} rows!"
+        return _from_columns([self._solve_vector(column) for column in _columns_of(b)])
+
+    def inverse(self) -> Matrix:
+        """Computes the inverse of A by solving A X = I.
+
+        Returns:
+            The inverse matrix.
+        """
+        assert not self._singular, "The matrix is singular!"
+        n = len(self._lu)
+        return _from_columns([self._solve_vector([int(i == j) for i in range(n)]) for j in range(n)])
+
+
+class CholeskyDecomposition:
+    """Implements the Cholesky factorization of a symmetric positive definite matrix: A = L L^T, where L is lower
+    triangular with a positive diagonal. It costs half of the LU factorization and needs no pivoting.
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        """Factorizes the given symmetric positive definite matrix in O(n^3).
+
+        Args:
+            matrix: The matrix A.
+        """
+        assert matrix.num_rows == matrix.num_cols, "Only square matrices have a Cholesky decomposition!"
+        n = matrix.num_rows
+        rows = _rows_of(matrix)
+        lower = []
+        for i in range(n):
+            assert all(rows[i][j] == rows[j][i] for j in range(i)), "The matrix is not symmetric!"
+            row = []
+            for j in range(i):
+                row.append((rows[i][j] - sum(map(mul, row[:j], lower[j][:j]))) / lower[j][j])
+            diagonal = rows[i][i] - sum(map(mul, row, row))
+            assert diagonal > 0, "The matrix is not positive definite!"
+            row.append(sqrt(diagonal))
+            lower.append(row)
+        self._lower = lower
+        self._upper = [[lower[j][i] if j >= i else 0 for j in range(n)] for i in range(n)]
+
+    def lower(self) -> Matrix:
+        """Returns the lower triangular factor L."""
+        n = len(self._lower)
+        return Matrix._from_flat(n, n, [self._lower[i][j] if j <= i else 0 for i in range(n) for j in range(n)])
+
+    def det(self) -> float:
+        """Computes the determinant of A as the squared product of the diagonal of L.
+
+        Returns:
+            The determinant.
+        """
+        result = 1
+        for i, row in enumerate(self._lower):
+            result *= row[i]
+        return result * result
+
+    def solve(self, b: Matrix) -> Matrix:
+        """Solves the systems A X = B for every column of B, as L Y = B followed by L^T X = Y.
+
+        Args:
+            b: The (n, k) matrix of the right-hand sides.
+
+        Returns:
+            The (n, k) matrix X.
+        """
+        n = len(self._lower)
+        assert b.num_rows == n, f"The right-hand side must have {n} rows!"
+        return _from_columns([_backward_substitution(self._upper, _forward_substitution(self._lower, column, False))
+                              for column in _columns_of(b)])
+
+
+class QRDecomposition:
+    """Implements the QR factorization of a (m, n) matrix with m >= n through Householder reflections: A = Q R, where
+    Q is orthogonal and R is upper triangular. Each of the n steps reflects the current column onto the first axis,
+    which is more stable than the Gram-Schmidt orthogonalization. Q is kept implicitly as the list of reflection
+    vectors.
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        """Factorizes the given matrix in O(m n^2).
+
+        Args:
+            matrix: The (m, n) matrix A, with m >= n.
+        """
+        m, n = matrix.num_rows, matrix.num_cols
+        assert m >= n, "The matrix must have at least as many rows as columns!"
+        columns = _columns_of(matrix)
+        reflectors = []
+        for k in range(n):
+            x = columns[k][k:]
+            norm = sqrt(sum(map(mul, x, x)))
+            if norm == 0:
+                reflectors.append(None)
+                continue
+            # v = x + sign(x_0) |x| e_0, normalized, reflects x onto -sign(x_0) |x| e_0
+            v = x[:]
+            v[0] += norm if x[0] >= 0 else -norm
+            v_norm = sqrt(sum(map(mul, v, v)))
+            v = [e / v_norm for e in v]
+            reflectors.append(v)
+            for j in range(k, n):
+                QRDecomposition._reflect(v, columns[j], k)
+        self._m = m
+        self._n = n
+        self._reflectors = reflectors
+        self._r_columns = columns
+        self._upper = [[columns[j][i] if j >= i else 0 for j in range(n)] for i in range(n)]
+
+    @staticmethod
+    def _reflect(v: list, column: list, k: int) -> None:
+        """Helper method that applies the reflection I - 2 v v^T to the entries from k onward of `column`."""
+        dot = 2 * sum(map(mul, v, column[k:]))
+        column[k:] = [c - dot * e for c, e in zip(column[k:], v)]
+
+    def _apply_qt(self, column: list) -> list:
+        """Helper method that computes Q^T b."""
+        column = column[:]
+        for k, v in enumerate(self._reflectors):
+            if v is not None:
+                QRDecomposition._reflect(v, column, k)
+        return column
+
+    def r(self) -> Matrix:
+        """Returns the (n, n) upper triangular factor R."""
+        return _from_columns([[column[i] if i <= j else 0 for i in range(self._n)]
+                              for j, column in enumerate(self._r_columns)])
+
+    def q(self) -> Matrix:
+        """Returns the (m, n) factor Q with orthonormal columns (the thin Q)."""
+        columns = []
+        for j in range(self._n):
+            column = [int(i == j) for i in range(self._m)]
+            for k in range(self._n - 1, -1, -1):
+                v = self._reflectors[k]
+                if v is not None:
+                    QRDecomposition._reflect(v, column, k)
+            columns.append(column)
+        return _from_columns(columns)
+
+    def solve(self, b: Matrix) -> Matrix:
+        """Solves the least squares problems min ||A x - b|| for every column b of B, as R x = (Q^T b)[:n]. When A is
+        square and non-singular it is the exact solution of A X = B.
+
+        Args:
+            b: The (m, k) matrix of the right-hand sides.
+
+        Returns:
+            The (n, k) matrix X.
+        """
+        assert b.num_rows == self._m, f"The right-hand side must have {self._m} rows!"
+        assert all(self._upper[i][i] != 0 for i in range(self._n)), "The matrix does not have full column rank!"
+        return _from_columns([_backward_substitution(self._upper, self._apply_qt(column)[:self._n])
+                              for column in _columns_of(b)])
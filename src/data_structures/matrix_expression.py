@@ -0,0 +1,307 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from . import Matrix
+from .matrix_product import strassen_product
+from operator import itemgetter
+from typing import TypeVar, Generic, Callable, Optional, Union, Iterator
+from numbers import Number
+T = TypeVar('T', bound=Number)
+
+
+class MatrixExpression(ABC, Generic[T]):
+    """Implements a lazily evaluated matrix expression, created by `Matrix.lazy()`. The operators (+, -, *, scale_by and
+    transpose) do not compute anything: they build a tree of operations that is evaluated only when an element is
+    accessed or `evaluate()` is called. The whole tree is known at that point, so the evaluation can be planned:
+
+    - the transposes are pushed down to the input matrices, where they become a different reading order of the
+      elements, and two transposes cancel out;
+    - the elementwise operations (+, -, scale_by) of a subtree are fused in a single function applied to every
+      element in one pass, so no intermediate matrix is built;
+    - the operands of consecutive products form a chain that is multiplied in the optimal order, found with the
+      dynamic programming algorithm for the matrix-chain parenthesization.
+
+    The value is cached after the first evaluation, together with the modification counters of the input matrices:
+    if any of them is modified, the next access evaluates the expression again.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int) -> None:
+        self._num_rows = num_rows
+        self._num_cols = num_cols
+        self._value: Optional[Matrix[T]] = None
+        # the modification counters of the input matrices when `_value` was computed
+        self._inputs_state: Optional[tuple[int, ...]] = None
+
+    @property
+    def num_rows(self) -> int:
+        return self._num_rows
+
+    @property
+    def num_cols(self) -> int:
+        return self._num_cols
+
+    def __add__(self, other: Union[MatrixExpression[T], Matrix[T]]) -> MatrixExpression[T]:
+        other = _as_expression(other)
+        assert self.num_rows == other.num_rows and self.num_cols == other.num_cols, \
+            "The matrices must have same dimensions!"
+        return _Sum(self, other, 1)
+
+    def __sub__(self, other: Union[MatrixExpression[T], Matrix[T]]) -> MatrixExpression[T]:
+        other = _as_expression(other)
+        assert self.num_rows == other.num_rows and self.num_cols == other.num_cols, \
+            "The matrices must have same dimensions!"
+        return _Sum(self, other, -1)
+
+    def __mul__(self, other: Union[MatrixExpression[T], Matrix[T]]) -> MatrixExpression[T]:
+        other = _as_expression(other)
+        assert self.num_cols == other.num_rows, \
+            f"Number of columns in A and number rows in B must be equal but "\
+            f"they are {self.num_cols} cols and {other.num_rows} rows!"
+        return _Product(self, other)
+
+    # a Matrix on the left of an expression defers to these operators
+    def __radd__(self, other: Matrix[T]) -> MatrixExpression[T]:
+        return _as_expression(other) + self
+
+    def __rsub__(self, other: Matrix[T]) -> MatrixExpression[T]:
+        return _as_expression(other) - self
+
+    def __rmul__(self, other: Matrix[T]) -> MatrixExpression[T]:
+        return _as_expression(other) * self
+
+    def scale_by(self, scalar: T) -> MatrixExpression[T]:
+        return _Scale(self, scalar)
+
+    def transpose(self) -> MatrixExpression[T]:
+        return _Transpose(self)
+
+    def evaluate(self) -> Matrix[T]:
+        """Computes the value of the expression, or reuses the cached one if the input matrices have not been modified
+        since it was computed.
+
+        Returns:
+            A new Matrix containing the value of the expression, which can be modified without affecting the input
+            matrices or the cache.
+        """
+        value = self._cached_value()
+        return Matrix._from_flat(self.num_rows, self.num_cols, value._to_flat())
+
+    def _cached_value(self) -> Matrix[T]:
+        """Helper method that returns the cached value of the expression, evaluating it again if it is missing or if
+        any input matrix has been modified since it was computed.
+        """
+        inputs_state = tuple(leaf._matrix._modifications for leaf in self._leaves())
+        if self._value is None or inputs_state != self._inputs_state:
+            plan = self._push_transposes(False)
+            self._value = Matrix._from_flat(self.num_rows, self.num_cols, plan._flat())
+            self._inputs_state = inputs_state
+        return self._value
+
+    def __getitem__(self, ndx_tuple: tuple[int, int]) -> T:
+        return self._cached_value()[ndx_tuple]
+
+    def __eq__(self, other: Union[MatrixExpression[T], Matrix[T]]) -> bool:
+        return self._cached_value() == (other._cached_value() if isinstance(other, MatrixExpression) else other)
+
+    def __str__(self) -> str:
+        return self._cached_value().__str__()
+
+    def _leaves(self) -> Iterator[_Leaf[T]]:
+        """Helper method that yields the input matrices of the expression, in the order of the tree."""
+        for operand in self._operands():
+            yield from operand._leaves()
+
+    @abstractmethod
+    def _operands(self) -> tuple[MatrixExpression[T], ...]:
+        """Helper method that returns the operands of the node of the expression tree."""
+
+    @abstractmethod
+    def _push_transposes(self, transposed: bool) -> MatrixExpression[T]:
+        """Helper method that rewrites the expression, transposed if `transposed` is True, so that the transposes are
+        applied only to the input matrices.
+        """
+
+    @abstractmethod
+    def _flat(self) -> list[T]:
+        """Helper method that computes the elements of a rewritten expression in row-major order."""
+
+
+def _as_expression(operand: Union[MatrixExpression[T], Matrix[T]]) -> MatrixExpression[T]:
+    return operand if isinstance(operand, MatrixExpression) else _Leaf(operand)
+
+
+class _Leaf(MatrixExpression[T]):
+    """Helper class that implements an input matrix of the expression, possibly read in transposed order."""
+
+    def __init__(self, matrix: Matrix[T], transposed: bool = False) -> None:
+        if transposed:
+            super().__init__(matrix.num_cols, matrix.num_rows)
+        else:
+            super().__init__(matrix.num_rows, matrix.num_cols)
+        self._matrix = matrix
+        self._transposed = transposed
+
+    def _operands(self) -> tuple[MatrixExpression[T], ...]:
+        return ()
+
+    def _leaves(self) -> Iterator[_Leaf[T]]:
+        yield self
+
+    def _push_transposes(self, transposed: bool) -> MatrixExpression[T]:
+        return _Leaf(self._matrix, self._transposed != transposed)
+
+    def _flat(self) -> list[T]:
+        return self._matrix._transposed_flat() if self._transposed else self._matrix._to_flat()
+
+
+class _Elementwise(MatrixExpression[T]):
+    """Helper base class of the elementwise operations, which are evaluated by fusing the elementwise operations of the
+    whole subtree in a single function of the elements of its terminal operands (matrices and products).
+    """
+
+    @abstractmethod
+    def _compile(self, terminals: list[MatrixExpression[T]]) -> Callable[[tuple], T]:
+        """Helper method that appends the terminal operands of the subtree to `terminals`.
+
+        Returns:
+            A function that, given a tuple with an element of each terminal, computes the element of the subtree.
+        """
+
+    @staticmethod
+    def _compile_operand(operand: MatrixExpression[T], terminals: list[MatrixExpression[T]]) -> Callable[[tuple], T]:
+        if isinstance(operand, _Elementwise):
+            return operand._compile(terminals)
+        terminals.append(operand)
+        return itemgetter(len(terminals) - 1)
+
+    def _flat(self) -> list[T]:
+        terminals = []
+        function = self._compile(terminals)
+        return list(map(function, zip(*[terminal._flat() for terminal in terminals])))
+
+
+class _Sum(_Elementwise[T]):
+    """Helper class that implements the sum (sign = 1) or the subtraction (sign = -1) of two expressions."""
+
+    def __init__(self, left: MatrixExpression[T], right: MatrixExpression[T], sign: int) -> None:
+        super().__init__(left.num_rows, left.num_cols)
+        self._left = left
+        self._right = right
+        self._sign = sign
+
+    def _operands(self) -> tuple[MatrixExpression[T], ...]:
+        return self._left, self._right
+
+    def _push_transposes(self, transposed: bool) -> MatrixExpression[T]:
+        return _Sum(self._left._push_transposes(transposed), self._right._push_transposes(transposed), self._sign)
+
+    def _compile(self, terminals: list[MatrixExpression[T]]) -> Callable[[tuple], T]:
+        left = self._compile_operand(self._left, terminals)
+        right = self._compile_operand(self._right, terminals)
+        if self._sign > 0:
+            return lambda values: left(values) + right(values)
+        return lambda values: left(values) - right(values)
+
+
+class _Scale(_Elementwise[T]):
+    """Helper class that implements the product between an expression and a scalar."""
+
+    def __init__(self, operand: MatrixExpression[T], scalar: T) -> None:
+        super().__init__(operand.num_rows, operand.num_cols)
+        self._operand = operand
+        self._scalar = scalar
+
+    def _operands(self) -> tuple[MatrixExpression[T], ...]:
+        return self._operand,
+
+    def _push_transposes(self, transposed: bool) -> MatrixExpression[T]:
+        return _Scale(self._operand._push_transposes(transposed), self._scalar)
+
+    def _compile(self, terminals: list[MatrixExpression[T]]) -> Callable[[tuple], T]:
+        operand = self._compile_operand(self._operand, terminals)
+        scalar = self._scalar
+        return lambda values: scalar * operand(values)
+
+
+class _Transpose(MatrixExpression[T]):
+    """Helper class that implements the transpose of an expression. It disappears when the expression is rewritten."""
+
+    def __init__(self, operand: MatrixExpression[T]) -> None:
+        super().__init__(operand.num_cols, operand.num_rows)
+        self._operand = operand
+
+    def _operands(self) -> tuple[MatrixExpression[T], ...]:
+        return self._operand,
+
+    def _push_transposes(self, transposed: bool) -> MatrixExpression[T]:
+        return self._operand._push_transposes(not transposed)
+
+    def _flat(self) -> list[T]:
+        return self._push_transposes(False)._flat()
+
+
+class _Product(MatrixExpression[T]):
+    """Helper class that implements the matrix product of two expressions."""
+
+    def __init__(self, left: MatrixExpression[T], right: MatrixExpression[T]) -> None:
+        super().__init__(left.num_rows, right.num_cols)
+        self._left = left
+        self._right = right
+
+    def _operands(self) -> tuple[MatrixExpression[T], ...]:
+        return self._left, self._right
+
+    def _push_transposes(self, transposed: bool) -> MatrixExpression[T]:
+        if transposed:
+            # (A*B)^T = B^T * A^T
+            return _Product(self._right._push_transposes(True), self._left._push_transposes(True))
+        return _Product(self._left._push_transposes(False), self._right._push_transposes(False))
+
+    def _factors(self) -> list[MatrixExpression[T]]:
+        """Helper method that collects the operands of the chain of consecutive products rooted at this node."""
+        factors = []
+        for operand in (self._left, self._right):
+            if isinstance(operand, _Product):
+                factors.extend(operand._factors())
+            else:
+                factors.append(operand)
+        return factors
+
+    def _flat(self) -> list[T]:
+        factors = self._factors()
+        dims = [factor.num_rows for factor in factors] + [factors[-1].num_cols]
+        split = _chain_order(dims)
+        values = [factor._flat() for factor in factors]
+        threshold = Matrix.strassen_threshold
+        block_size = Matrix.block_size
+
+        def multiply(i: int, j: int) -> list[T]:
+            if i == j:
+                return values[i]
+            k = split[i][j]
+            return strassen_product(multiply(i, k), multiply(k + 1, j), dims[i], dims[k + 1], dims[j + 1],
+                                    threshold, block_size)
+
+        return multiply(0, len(factors) - 1)
+
+
+def _chain_order(dims: list[int]) -> list[list[int]]:
+    """Helper function that solves the matrix-chain parenthesization problem in O(k^3): the i-th of the k matrices is a
+    (dims[i], dims[i+1]) matrix.
+
+    Returns:
+        The table `split` such that the optimal order to compute the product of the matrices from i to j is the product
+        of (i..split[i][j]) and (split[i][j]+1..j).
+    """
+    k = len(dims) - 1
+    cost = [[0] * k for _ in range(k)]
+    split = [[0] * k for _ in range(k)]
+    for length in range(2, k + 1):
+        for i in range(k - length + 1):
+            j = i + length - 1
+            cost[i][j] = None
+            for s in range(i, j):
+                c = cost[i][s] + cost[s + 1][j] + dims[i] * dims[s + 1] * dims[j + 1]
+                if cost[i][j] is None or c < cost[i][j]:
+                    cost[i][j] = c
+                    split[i][j] = s
+    return split
@@ -0,0 +1,118 @@
+"""Matrix product kernels working on flat row-major lists of numbers.
+
+A matrix with `rows` rows and `cols` columns is represented by a list `data` of length rows * cols, where the element
+(i, j) is `data[i * cols + j]`. Working on flat lists avoids the per-element method calls of `Matrix.__getitem__`, and
+lets the inner products run inside `sum(map(...))`, i.e. in C.
+"""
+from operator import add, mul, sub
+from typing import Sequence
+
+# sizes for which the product is computed with the blocked kernel, measured by benchmarks/matrix_product.py
+DEFAULT_BLOCK_SIZE = 64
+DEFAULT_STRASSEN_THRESHOLD = 512
+
+# products with fewer multiply-adds (m * n * q) than this stay serial, since starting the processes costs more (see
+# parallel_product.py)
+DEFAULT_PARALLEL_THRESHOLD = 2_000_000
+
+
+def blocked_product(a: Sequence, b: Sequence, m: int, n: int, q: int, block_size: int = DEFAULT_BLOCK_SIZE) -> list:
+    """Computes the product between a (m, n) and a (n, q) matrix with loop tiling. B is transposed first, so that both
+    operands of every inner product are contiguous rows; then the result is computed one `block_size` x `block_size`
+    tile at a time, so that the rows of A and the columns of B of a tile are reused while they are hot.
+
+    Args:
+        a: The elements of the (m, n) matrix A.
+        b: The elements of the (n, q) matrix B.
+        m: The number of rows of A.
+        n: The number of columns of A and rows of B.
+        q: The number of columns of B.
+        block_size: The side of the tiles of the result.
+
+    Returns:
+        The elements of the (m, q) matrix A*B.
+    """
+    a_rows = [a[i * n:(i + 1) * n] for i in range(m)]
+    b_cols = [b[k::q] for k in range(q)]
+    result = [0] * (m * q)
+    for i0 in range(0, m, block_size):
+        i1 = min(i0 + block_size, m)
+        for k0 in range(0, q, block_size):
+            k1 = min(k0 + block_size, q)
+            tile_cols = b_cols[k0:k1]
+            for i in range(i0, i1):
+                a_row = a_rows[i]
+                offset = i * q + k0
+                result[offset:offset + k1 - k0] = [sum(map(mul, a_row, b_col)) for b_col in tile_cols]
+    return result
+
+
+def _quadrants(data: Sequence, rows: int, cols: int) -> tuple[list, list, list, list]:
+    """Helper function that splits a matrix into its four quadrants, padding with zeros the last row and column if
+    `rows` or `cols` are odd.
+
+    Returns:
+        The top-left, top-right, bottom-left and bottom-right quadrants, each of (rows+1)//2 x (cols+1)//2 elements.
+    """
+    half_rows = (rows + 1) // 2
+    half_cols = (cols + 1) // 2
+    pad = [0] * (2 * half_cols - cols)
+    quadrants = ([], [], [], [])
+    for i in range(2 * half_rows):
+        row = list(data[i * cols:(i + 1) * cols]) + pad if i < rows else [0] * (2 * half_cols)
+        top = 0 if i < half_rows else 2
+        quadrants[top].extend(row[:half_cols])
+        quadrants[top + 1].extend(row[half_cols:])
+    return quadrants
+
+
+def strassen_product(a: Sequence, b: Sequence, m: int, n: int, q: int,
+                     threshold: int = DEFAULT_STRASSEN_THRESHOLD, block_size: int = DEFAULT_BLOCK_SIZE) -> list:
+    """Computes the product between a (m, n) and a (n, q) matrix with the Strassen algorithm: the operands are split in
+    quadrants and the product is obtained from 7 products of quadrants instead of 8, giving O(N^2.81) time. The
+    recursion stops, and `blocked_product()` is used, as soon as one of the dimensions is below `threshold`.
+
+    Args:
+        a: The elements of the (m, n) matrix A.
+        b: The elements of the (n, q) matrix B.
+        m: The number of rows of A.
+        n: The number of columns of A and rows of B.
+        q: The number of columns of B.
+        threshold: The size below which the recursion stops.
+        block_size: The tile size of the blocked kernel.
+
+    Returns:
+        The elements of the (m, q) matrix A*B.
+    """
+    if min(m, n, q) < max(threshold, 2):
+        return blocked_product(a, b, m, n, q, block_size)
+
+    hm, hn, hq = (m + 1) // 2, (n + 1) // 2, (q + 1) // 2
+    a11, a12, a21, a22 = _quadrants(a, m, n)
+    b11, b12, b21, b22 = _quadrants(b, n, q)
+
+    def product(x: list, y: list) -> list:
+        return strassen_product(x, y, hm, hn, hq, threshold, block_size)
+
+    p1 = product(list(map(add, a11, a22)), list(map(add, b11, b22)))
+    p2 = product(list(map(add, a21, a22)), b11)
+    p3 = product(a11, list(map(sub, b12, b22)))
+    p4 = product(a22, list(map(sub, b21, b11)))
+    p5 = product(list(map(add, a11, a12)), b22)
+    p6 = product(list(map(sub, a21, a11)), list(map(add, b11, b12)))
+    p7 = product(list(map(sub, a12, a22)), list(map(add, b21, b22)))
+
+    c11 = list(map(add, map(sub, map(add, p1, p4), p5), p7))
+    c12 = list(map(add, p3, p5))
+    c21 = list(map(add, p2, p4))
+    c22 = list(map(add, map(add, map(sub, p1, p2), p3), p6))
+
+    # reassemble the quadrants, dropping the padding
+    result = []
+    for i in range(m):
+        left, right = (c11, c12) if i < hm else (c21, c22)
+        offset = (i % hm) * hq
+        result.extend(left[offset:offset + hq])
+        result.extend(right[offset:offset + q - hq])
+    return result
+
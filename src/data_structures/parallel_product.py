@@ -0,0 +1,115 @@
+"""Matrix product computed by a pool of worker processes.
+
+The operands are copied once into `multiprocessing.shared_memory` blocks of raw C numbers, so every task only receives
+the names of the blocks and the range of rows it has to compute, instead of a pickled copy of the matrices. Each worker
+computes a block of rows of the result with the serial blocked kernel and returns it.
+"""
+from __future__ import annotations
+from . import Matrix
+from .matrix_product import blocked_product, DEFAULT_BLOCK_SIZE, DEFAULT_PARALLEL_THRESHOLD
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+import os
+
+# the operand B read by the worker process in its last task, reused by the following tasks on the same product
+_worker_cache: dict[str, list] = {}
+
+
+def _format_of(matrix: Matrix) -> Optional[str]:
+    """Helper function that chooses the struct format code of the raw numbers used to share a matrix.
+
+    Returns:
+        The format code, or None if some element cannot be stored exactly as a C number: 64-bit integers hold the ints
+        in their range, doubles hold the floats and the ints whose absolute value is at most 2^53.
+    """
+    if matrix.dtype is not None:
+        return matrix._grid._elements.memoryview().format
+    data = matrix._to_flat()
+    if all(type(x) is int and -2 ** 63 <= x < 2 ** 63 for x in data):
+        return 'q'
+    if all(type(x) is float or (type(x) is int and abs(x) <= 2 ** 53) for x in data):
+        return 'd'
+    return None
+
+
+def _share(matrix: Matrix, fmt: str) -> shared_memory.SharedMemory:
+    """Helper function that copies the elements of a matrix into a new shared memory block as raw numbers."""
+    if matrix.dtype is not None and matrix._grid._elements.memoryview().format == fmt:
+        raw = matrix._grid._elements.memoryview().cast('B')
+    else:
+        raw = memoryview(array(fmt, matrix._to_flat())).cast('B')
+    block = shared_memory.SharedMemory(create=True, size=max(1, raw.nbytes))
+    block.buf[:raw.nbytes] = raw
+    return block
+
+
+def _read(name: str, fmt: str, start: int, stop: int) -> list:
+    """Helper function that reads the numbers in the range [start, stop) of a shared memory block."""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf.cast(fmt) as view:
+            with view[start:stop] as selection:
+                return selection.tolist()
+    finally:
+        block.close()
+
+
+def _product_rows(a_name: str, a_fmt: str, b_name: str, b_fmt: str, n: int, q: int, row_start: int, row_stop: int,
+                  block_size: int) -> list:
+    """Helper function, run by the workers, that computes the rows [row_start, row_stop) of A*B."""
+    if b_name not in _worker_cache:
+        _worker_cache.clear()
+        _worker_cache[b_name] = _read(b_name, b_fmt, 0, n * q)
+    a_rows = _read(a_name, a_fmt, row_start * n, row_stop * n)
+    return blocked_product(a_rows, _worker_cache[b_name], row_stop - row_start, n, q, block_size)
+
+
+def parallel_product(a: Matrix, b: Matrix, num_workers: Optional[int] = None,
+                     threshold: int = DEFAULT_PARALLEL_THRESHOLD, block_size: int = DEFAULT_BLOCK_SIZE) -> Matrix:
+    """Computes the product A*B splitting the rows of the result among `num_workers` processes. Products smaller than
+    `threshold` multiply-adds, or with elements that cannot be shared exactly as C numbers (see `_format_of()`), e.g.
+    ints beyond 64 bits, are computed serially.
+
+    Args:
+        a: The (m, n) matrix A.
+        b: The (n, q) matrix B.
+        num_workers: The number of worker processes, if None the number of CPUs.
+        threshold: The minimum number of multiply-adds (m * n * q) of a parallel product.
+        block_size: The tile size of the blocked kernel run by the workers.
+
+    Returns:
+        The (m, q) matrix A*B.
+    """
+    assert a.num_cols == b.num_rows, \
+        f"Number of columns in A and number rows in B must be equal but "\
+        f"they are {a.num_cols} cols and {b.num_rows} rows!"
+    m, n, q = a.num_rows, a.num_cols, b.num_cols
+    num_workers = num_workers or os.cpu_count() or 1
+    parallel = num_workers > 1 and m > 1 and m * n * q >= threshold
+    a_fmt = _format_of(a) if parallel else None
+    b_fmt = _format_of(b) if parallel else None
+    if a_fmt is None or b_fmt is None:
+        return Matrix._from_flat(m, q, blocked_product(a._to_flat(), b._to_flat(), m, n, q, block_size),
+                                 Matrix._result_dtype([a, b]))
+
+    a_block = _share(a, a_fmt)
+    b_block = _share(b, b_fmt)
+    try:
+        # a few tasks per worker balance the load if some of them are slower
+        num_tasks = min(m, 4 * num_workers)
+        bounds = [m * t // num_tasks for t in range(num_tasks + 1)]
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(_product_rows, a_block.name, a_fmt, b_block.name, b_fmt, n, q,
+                                       bounds[t], bounds[t + 1], block_size)
+                       for t in range(num_tasks)]
+            data = []
+            for future in futures:
+                data.extend(future.result())
+    finally:
+        a_block.close()
+        a_block.unlink()
+        b_block.close()
+        b_block.unlink()
+    return Matrix._from_flat(m, q, data, Matrix._result_dtype([a, b]))
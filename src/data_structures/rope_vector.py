@@ -0,0 +1,397 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Optional, Iterator
+from . import Array, Vector
+from .array import _fail_fast
+T = TypeVar('T')
+
+# the maximum number of items of a leaf, a full leaf is split in two halves
+_LEAF_CAPACITY = 64
+
+# a leaf left with fewer items by a removal is merged with a neighbour, or takes items from it
+_LEAF_MIN_COUNT = _LEAF_CAPACITY // 4
+
+
+class RopeVector(Vector[T]):
+    """
+    Implements a Vector stored as a rope: the items are split into small arrays (the leaves, of at most 64 items each)
+    that are the nodes of an AVL tree ordered by position, where every node knows how many items its subtree contains.
+    Finding the leaf of an index only needs these counts along a path from the root, so access, insertion and removal
+    at any position take O(log n) time; the shift inside a leaf is a block copy of at most 64 items. Every leaf but a
+    lone root holds at least 16 items, so the leaves use at most four times the memory of the items.
+    """
+
+    def __init__(self):
+        """
+        Creates an empty vector.
+        """
+        super().__init__()
+        # the items are stored in the leaves, there is no flat underlying array
+        self._array = None
+        self._physical_size = 0
+        self._root: Optional[_RopeNode] = None
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity(self._root)
+
+    def _capacity(self, node: Optional[_RopeNode]) -> int:
+        if node is None:
+            return 0
+        return _LEAF_CAPACITY + self._capacity(node.left) + self._capacity(node.right)
+
+    def reserve(self, capacity: int) -> None:
+        """
+        The leaves are allocated when they are needed, so there is nothing to reserve.
+        """
+
+    def shrink_to_fit(self) -> None:
+        """
+        The leaves are released when they become empty, so there is nothing to shrink.
+        """
+
+    def _find(self, index: int) -> tuple[_RopeNode, int]:
+        """
+        Helper method that finds the leaf containing the item at the given index.
+
+        Returns:
+            the node and the position of the item in its leaf.
+        """
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index < left_size + node.count:
+                return node, index - left_size
+            else:
+                index -= left_size + node.count
+                node = node.right
+
+    def __getitem__(self, index: int) -> T:
+        assert 0 <= index < len(self), f"The index must be between 0 and {len(self)-1}, but it was {index}!"
+        node, position = self._find(index)
+        return node.leaf._elements[position]
+
+    def __setitem__(self, index: int, item: T):
+        assert 0 <= index < len(self), f"The index must be between 0 and {len(self) - 1}, but it was {index}!"
+        node, position = self._find(index)
+        node.leaf._elements[position] = item
+
+    def append(self, item: T) -> None:
+        """
+        Appends a new item at the end of the vector.
+
+        Args:
+            item: the new item that is appended at the end of the vector.
+        """
+        self._root = self._insert(self._root, len(self), item)
+        self._abstract_size += 1
+        self._modifications += 1
+
+    def insert(self, index: int, item: T) -> None:
+        """
+        Given a positional index and a new item, inserts the new item at the provided index, shifting only the items
+        of its leaf.
+
+        Args:
+            index: an integer representing the positional index where we want to insert the new item.
+            item: the new item.
+        """
+        assert 0 <= index < len(self), f"The index must be between 0 and {len(self) - 1}, but it was {index}!"
+        self._root = self._insert(self._root, index, item)
+        self._abstract_size += 1
+        self._modifications += 1
+
+    def remove(self, index: int) -> T:
+        """
+        Removes the item at the provided positional index, shifting only the items of its leaf. A leaf that becomes
+        empty is removed from the tree.
+
+        Args:
+            index: an integer representing the positional index of the item we want to remove.
+
+        Returns:
+            the removed item.
+        """
+        assert len(self) > 0, f"There are no items in the vector!"
+        assert 0 <= index < len(self), f"The index must be between 0 and {len(self) - 1}, but it was {index}!"
+        removed = []
+        self._root = self._delete(self._root, index, removed)
+        self._abstract_size -= 1
+        self._modifications += 1
+        return removed[0]
+
+    def pop(self) -> T:
+        """
+        Removes the last item.
+
+        Returns:
+            the removed item.
+        """
+        assert len(self) > 0, f"There are no items in the vector!"
+        return self.remove(len(self) - 1)
+
+    def __iter__(self) -> Iterator[T]:
+        return _fail_fast(self, self._traverse(reverse=False))
+
+    def __reversed__(self) -> Iterator[T]:
+        return _fail_fast(self, self._traverse(reverse=True))
+
+    def _traverse(self, reverse: bool) -> Iterator[T]:
+        """
+        Helper method that traverses the leaves in order (or in reverse order), reading each one with a single slice.
+        """
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            else:
+                node = stack.pop()
+                items = node.leaf._elements[:node.count]
+                yield from reversed(items) if reverse else items
+                node = node.left if reverse else node.right
+
+    def _insert(self, node: Optional[_RopeNode], index: int, item: T) -> _RopeNode:
+        """
+        Helper method that inserts an item at position `index` of the subtree rooted at `node`.
+
+        Returns:
+            The new root of the subtree.
+        """
+        if node is None:
+            node = _RopeNode()
+            node.leaf._elements[0] = item
+            node.count = 1
+            node.size = 1
+            return node
+        left_size = _size(node.left)
+        if index < left_size:
+            node.left = self._insert(node.left, index, item)
+        elif index > left_size + node.count:
+            node.right = self._insert(node.right, index - left_size - node.count, item)
+        else:
+            position = index - left_size
+            if node.count == _LEAF_CAPACITY:
+                # move the second half of the leaf into a new node, which becomes the successor of this one
+                half = _LEAF_CAPACITY // 2
+                sibling = _RopeNode()
+                sibling.leaf.copy_from(node.leaf, slice(half, _LEAF_CAPACITY), 0)
+                sibling.count = sibling.size = _LEAF_CAPACITY - half
+                node.leaf.fill(None, half)
+                node.count = half
+                if position > half:
+                    _leaf_insert(sibling, position - half, item)
+                else:
+                    _leaf_insert(node, position, item)
+                node.right = _insert_first(node.right, sibling)
+            else:
+                _leaf_insert(node, position, item)
+        return _rebalance(node)
+
+    def _delete(self, node: _RopeNode, index: int, removed: list) -> Optional[_RopeNode]:
+        """
+        Helper method that removes the item at position `index` of the subtree rooted at `node`, appending it to
+        `removed`.
+
+        Returns:
+            The new root of the subtree.
+        """
+        left_size = _size(node.left)
+        if index < left_size:
+            node.left = self._delete(node.left, index, removed)
+        elif index >= left_size + node.count:
+            node.right = self._delete(node.right, index - left_size - node.count, removed)
+        else:
+            position = index - left_size
+            removed.append(node.leaf._elements[position])
+            node.leaf.copy_from(node.leaf, slice(position + 1, node.count), position)
+            node.count -= 1
+            node.leaf._elements[node.count] = None
+            if node.count < _LEAF_MIN_COUNT:
+                if node.right is not None:
+                    # merge with the next leaf, or take half of the excess of its items
+                    node.right, successor = _detach_first(node.right)
+                    if not _redistribute(node, successor):
+                        node.right = _insert_first(node.right, successor)
+                elif node.left is not None:
+                    node.left, predecessor = _detach_last(node.left)
+                    if _redistribute(predecessor, node):
+                        node.leaf, node.count = predecessor.leaf, predecessor.count
+                    else:
+                        node.left = _insert_last(node.left, predecessor)
+                elif node.count == 0:
+                    return None
+            return _rebalance(node)
+        # a childless leaf left underfull is merged with this node, its neighbour
+        if node.left is not None and node.left.height == 1 and node.left.count < _LEAF_MIN_COUNT:
+            if _redistribute(node.left, node):
+                node.leaf, node.count = node.left.leaf, node.left.count
+                node.left = None
+            else:
+                _update(node.left)
+        if node.right is not None and node.right.height == 1 and node.right.count < _LEAF_MIN_COUNT:
+            if _redistribute(node, node.right):
+                node.right = None
+            else:
+                _update(node.right)
+        return _rebalance(node)
+
+
+def _size(node: Optional[_RopeNode]) -> int:
+    return node.size if node is not None else 0
+
+
+def _height(node: Optional[_RopeNode]) -> int:
+    return node.height if node is not None else 0
+
+
+def _update(node: _RopeNode) -> None:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = node.count + _size(node.left) + _size(node.right)
+
+
+def _rotate_right(node: _RopeNode) -> _RopeNode:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: _RopeNode) -> _RopeNode:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node: _RopeNode) -> _RopeNode:
+    """
+    Helper function that updates the height and the size of a node and restores its AVL property.
+
+    Returns:
+        The new root of the subtree.
+    """
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _leaf_insert(node: _RopeNode, position: int, item: T) -> None:
+    """
+    Helper function that inserts an item into a leaf that is not full, shifting the following items as a block.
+    """
+    node.leaf.copy_from(node.leaf, slice(position, node.count), position + 1)
+    node.leaf._elements[position] = item
+    node.count += 1
+
+
+def _insert_first(node: Optional[_RopeNode], first: _RopeNode) -> _RopeNode:
+    """
+    Helper function that inserts a node before all the nodes of the subtree rooted at `node`.
+
+    Returns:
+        The new root of the subtree.
+    """
+    if node is None:
+        _update(first)
+        return first
+    node.left = _insert_first(node.left, first)
+    return _rebalance(node)
+
+
+def _insert_last(node: Optional[_RopeNode], last: _RopeNode) -> _RopeNode:
+    """
+    Helper function that inserts a node after all the nodes of the subtree rooted at `node`.
+
+    Returns:
+        The new root of the subtree.
+    """
+    if node is None:
+        _update(last)
+        return last
+    node.right = _insert_last(node.right, last)
+    return _rebalance(node)
+
+
+def _detach_first(node: _RopeNode) -> tuple[Optional[_RopeNode], _RopeNode]:
+    """
+    Helper function that removes the first node of the subtree rooted at `node`.
+
+    Returns:
+        The new root of the subtree and the removed node, without children.
+    """
+    if node.left is None:
+        right = node.right
+        node.right = None
+        node.height = 1
+        return right, node
+    node.left, first = _detach_first(node.left)
+    return _rebalance(node), first
+
+
+def _detach_last(node: _RopeNode) -> tuple[Optional[_RopeNode], _RopeNode]:
+    """
+    Helper function that removes the last node of the subtree rooted at `node`.
+
+    Returns:
+        The new root of the subtree and the removed node, without children.
+    """
+    if node.right is None:
+        left = node.left
+        node.left = None
+        node.height = 1
+        return left, node
+    node.right, last = _detach_last(node.right)
+    return _rebalance(node), last
+
+
+def _redistribute(first: _RopeNode, second: _RopeNode) -> bool:
+    """
+    Helper function that moves the items of two consecutive leaves into the first one, if they fit, otherwise splits
+    them evenly between the two leaves. The sizes of the nodes are not updated.
+
+    Returns:
+        True if the items have been merged into the first leaf, and the second one is empty.
+    """
+    items = first.leaf._elements[:first.count] + second.leaf._elements[:second.count]
+    first.leaf.fill(None, 0, first.count)
+    second.leaf.fill(None, 0, second.count)
+    if len(items) <= _LEAF_CAPACITY:
+        first.leaf._elements[:len(items)] = items
+        first.count, second.count = len(items), 0
+        return True
+    half = len(items) // 2
+    first.leaf._elements[:half] = items[:half]
+    second.leaf._elements[:len(items) - half] = items[half:]
+    first.count, second.count = half, len(items) - half
+    return False
+
+
+class _RopeNode(Generic[T]):
+    """
+    Helper class that implements a node of the RopeVector, holding a leaf of items.
+    """
+
+    __slots__ = ('leaf', 'count', 'size', 'left', 'right', 'height')
+
+    def __init__(self) -> None:
+        self.leaf: Array[T] = Array(_LEAF_CAPACITY)
+        self.count = 0
+        self.size = 0
+        self.left: Optional[_RopeNode] = None
+        self.right: Optional[_RopeNode] = None
+        self.height = 1
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterator
+from .array import _fail_fast
 T = TypeVar('T')
 
 
@@ -11,6 +12,8 @@ class Set(Generic[T]):
 
     def __init__(self) -> None:
         self._list = list()
+        # incremented by every addition and removal, to detect changes during iteration
+        self._modifications = 0
 
     def __len__(self) -> int:
         return len(self._list)
@@ -27,6 +30,7 @@ class Set(Generic[T]):
         """
         if item not in self:
             self._list.append(item)
+            self._modifications += 1
 
     def remove(self, item: T) -> None:
         """
@@ -37,6 +41,7 @@ class Set(Generic[T]):
         """
         assert item in self, f"The item {item} is not in the set!"
         self._list.remove(item)
+        self._modifications += 1
 
     def __eq__(self, other: Set[T]) -> bool:
         if len(self) == len(other):
@@ -95,25 +100,11 @@ class Set(Generic[T]):
                 difference_set.add(item)
         return difference_set
 
-    def __iter__(self) -> _SetIterator:
-        return _SetIterator(self._list)
-
+    def __iter__(self) -> Iterator[T]:
+        """
+        Creates an iterator over the items, which raises a RuntimeError if the set changes while it is used.
+        """
+        return _fail_fast(self, iter(self._list))
 
-class _SetIterator:
-    """
-    Helper class that implements the iterator fot the Set ADT.
-    """
-    def __init__(self, elements: list[T]) -> None:
-        self._elements = elements
-        self._cur_ndx = 0
-
-    def __iter__(self) -> _SetIterator:
-        return self
-
-    def __next__(self) -> T:
-        if self._cur_ndx < len(self._elements):
-            entry = self._elements[self._cur_ndx]
-            self._cur_ndx += 1
-            return entry
-        else:
-            raise StopIteration
+    def __reversed__(self) -> Iterator[T]:
+        return _fail_fast(self, reversed(self._list))
@@ -0,0 +1,466 @@
+from __future__ import annotations
+from . import Matrix
+from typing import TypeVar, Generic, Union
+from numbers import Number
+T = TypeVar('T', bound=Number)
+
+
+class COOMatrix(Generic[T]):
+    """Implements a sparse matrix in COOrdinate format: the non-zero elements are kept as three parallel lists of row
+    indices, column indices and values, in insertion order. Setting an element is O(1), which makes this format
+    convenient to build a matrix; duplicated coordinates are summed when the matrix is converted to the compressed
+    formats (`CSRMatrix` and `CSCMatrix`), which are used for the arithmetic.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int) -> None:
+        """Creates an empty (all zeros) sparse matrix.
+
+        Args:
+            num_rows (int): Number of rows.
+            num_cols (int): Number of columns.
+        """
+        assert num_rows > 0 and num_cols > 0, \
+            f"Number of rows and cols must be greater than zero but was rows:{num_rows}, cols:{num_cols}!"
+        self._num_rows = num_rows
+        self._num_cols = num_cols
+        self._rows: list[int] = []
+        self._cols: list[int] = []
+        self._values: list[T] = []
+
+    @property
+    def num_rows(self) -> int:
+        return self._num_rows
+
+    @property
+    def num_cols(self) -> int:
+        return self._num_cols
+
+    @property
+    def nnz(self) -> int:
+        """Returns the number of stored entries, duplicates included.
+
+        Returns:
+            The number of stored entries.
+        """
+        return len(self._values)
+
+    def __setitem__(self, ndx_tuple: tuple[int, int], value: T) -> None:
+        """Adds `value` to the element (i, j).
+
+        Args:
+            ndx_tuple (tuple[int, int]): The row and the column of the element.
+            value: The value added to the element.
+        """
+        row, col = ndx_tuple
+        assert 0 <= row < self._num_rows and 0 <= col < self._num_cols, f"Index out of range!"
+        self._rows.append(row)
+        self._cols.append(col)
+        self._values.append(value)
+
+    def __getitem__(self, ndx_tuple: tuple[int, int]) -> T:
+        """Returns the element (i, j), i.e. the sum of the values stored for its coordinates. It takes O(nnz) time.
+
+        Args:
+            ndx_tuple (tuple[int, int]): The row and the column of the element.
+
+        Returns:
+            The value of the element.
+        """
+        row, col = ndx_tuple
+        assert 0 <= row < self._num_rows and 0 <= col < self._num_cols, f"Index out of range!"
+        value = 0
+        for i, j, v in zip(self._rows, self._cols, self._values):
+            if i == row and j == col:
+                value += v
+        return value
+
+    @staticmethod
+    def from_dense(matrix: Matrix[T]) -> COOMatrix[T]:
+        """Creates a sparse matrix containing the non-zero elements of a dense matrix.
+
+        Args:
+            matrix (Matrix): The dense matrix.
+
+        Returns:
+            The sparse matrix.
+        """
+        result = COOMatrix(matrix.num_rows, matrix.num_cols)
+        num_cols = matrix.num_cols
+        for index, value in enumerate(matrix._to_flat()):
+            if value != 0:
+                result._rows.append(index // num_cols)
+                result._cols.append(index % num_cols)
+                result._values.append(value)
+        return result
+
+    def to_csr(self) -> CSRMatrix[T]:
+        return CSRMatrix(self._num_rows, self._num_cols,
+                         *_compress(self._rows, self._cols, self._values, self._num_rows))
+
+    def to_csc(self) -> CSCMatrix[T]:
+        return CSCMatrix(self._num_rows, self._num_cols,
+                         *_compress(self._cols, self._rows, self._values, self._num_cols))
+
+    def to_dense(self) -> Matrix[T]:
+        result = Matrix(self._num_rows, self._num_cols)
+        for i, j, v in zip(self._rows, self._cols, self._values):
+            result[i, j] += v
+        return result
+
+    def scale_by(self, scalar: T) -> COOMatrix[T]:
+        result = COOMatrix(self._num_rows, self._num_cols)
+        result._rows = self._rows[:]
+        result._cols = self._cols[:]
+        result._values = [scalar * v for v in self._values]
+        return result
+
+    def transpose(self) -> COOMatrix[T]:
+        result = COOMatrix(self._num_cols, self._num_rows)
+        result._rows = self._cols[:]
+        result._cols = self._rows[:]
+        result._values = self._values[:]
+        return result
+
+    def __add__(self, other: SparseMatrix) -> CSRMatrix[T]:
+        return self.to_csr() + other
+
+    def __sub__(self, other: SparseMatrix) -> CSRMatrix[T]:
+        return self.to_csr() - other
+
+    def __mul__(self, other: Union[SparseMatrix, Matrix[T]]) -> Union[CSRMatrix[T], Matrix[T]]:
+        return self.to_csr() * other
+
+    def __rmul__(self, other: Matrix[T]) -> Matrix[T]:
+        return other * self.to_csr()
+
+    def __eq__(self, other: SparseMatrix) -> bool:
+        return self.to_csr() == other
+
+
+class _CompressedMatrix(Generic[T]):
+    """Helper base class of the compressed sparse formats. The matrix is seen as a sequence of *major* lines (rows for
+    CSR, columns for CSC): the positions along the line (the *minor* indices) and the values of the non-zero elements
+    of the line k are `indices[indptr[k]:indptr[k+1]]` and `data[indptr[k]:indptr[k+1]]`, sorted by minor index.
+
+    The CSC arrays of a matrix are the CSR arrays of its transpose, so every algorithm is written once for the CSR
+    layout and reused for CSC by swapping the roles of rows and columns.
+    """
+
+    _ROW_MAJOR: bool
+
+    def __init__(self, num_rows: int, num_cols: int, indptr: list[int], indices: list[int], data: list[T]) -> None:
+        """Creates a sparse matrix from its compressed arrays, which must be in canonical form: indices sorted within
+        each line, no duplicates and no explicit zeros.
+
+        Args:
+            num_rows (int): Number of rows.
+            num_cols (int): Number of columns.
+            indptr (list[int]): The offsets of the lines in `indices` and `data`, one more than the number of lines.
+            indices (list[int]): The minor index of every non-zero element.
+            data (list): The value of every non-zero element.
+        """
+        assert len(indptr) == (num_rows if self._ROW_MAJOR else num_cols) + 1, "Wrong length of `indptr`!"
+        assert len(indices) == len(data) == indptr[-1], "Wrong length of `indices` or `data`!"
+        self._num_rows = num_rows
+        self._num_cols = num_cols
+        self._indptr = indptr
+        self._indices = indices
+        self._data = data
+
+    @property
+    def num_rows(self) -> int:
+        return self._num_rows
+
+    @property
+    def num_cols(self) -> int:
+        return self._num_cols
+
+    @property
+    def nnz(self) -> int:
+        """Returns the number of non-zero elements.
+
+        Returns:
+            The number of non-zero elements.
+        """
+        return len(self._data)
+
+    @property
+    def _num_major(self) -> int:
+        return self._num_rows if self._ROW_MAJOR else self._num_cols
+
+    @property
+    def _num_minor(self) -> int:
+        return self._num_cols if self._ROW_MAJOR else self._num_rows
+
+    def _arrays(self) -> tuple[list[int], list[int], list[T]]:
+        return self._indptr, self._indices, self._data
+
+    def _same_format(self, other: SparseMatrix) -> _CompressedMatrix[T]:
+        """Helper method that converts `other` to the format of this matrix."""
+        return other.to_csr() if self._ROW_MAJOR else other.to_csc()
+
+    def _new(self, num_rows: int, num_cols: int, arrays: tuple) -> _CompressedMatrix[T]:
+        """Helper method that creates a matrix of the same format of this one."""
+        return type(self)(num_rows, num_cols, *arrays)
+
+    def __getitem__(self, ndx_tuple: tuple[int, int]) -> T:
+        """Returns the element (i, j), found by binary search within its line.
+
+        Args:
+            ndx_tuple (tuple[int, int]): The row and the column of the element.
+
+        Returns:
+            The value of the element.
+        """
+        row, col = ndx_tuple
+        assert 0 <= row < self._num_rows and 0 <= col < self._num_cols, f"Index out of range!"
+        major, minor = (row, col) if self._ROW_MAJOR else (col, row)
+        low, high = self._indptr[major], self._indptr[major + 1] - 1
+        while high >= low:
+            middle = (high + low) // 2
+            if self._indices[middle] < minor:
+                low = middle + 1
+            elif self._indices[middle] > minor:
+                high = middle - 1
+            else:
+                return self._data[middle]
+        return 0
+
+    @classmethod
+    def from_dense(cls, matrix: Matrix[T]) -> _CompressedMatrix[T]:
+        """Creates a sparse matrix containing the non-zero elements of a dense matrix.
+
+        Args:
+            matrix (Matrix): The dense matrix.
+
+        Returns:
+            The sparse matrix.
+        """
+        coo = COOMatrix.from_dense(matrix)
+        return coo.to_csr() if cls._ROW_MAJOR else coo.to_csc()
+
+    def to_coo(self) -> COOMatrix[T]:
+        result = COOMatrix(self._num_rows, self._num_cols)
+        majors = []
+        for k in range(self._num_major):
+            majors.extend([k] * (self._indptr[k + 1] - self._indptr[k]))
+        result._rows, result._cols = (majors, self._indices[:]) if self._ROW_MAJOR else (self._indices[:], majors)
+        result._values = self._data[:]
+        return result
+
+    def to_dense(self) -> Matrix[T]:
+        flat = [0] * (self._num_rows * self._num_cols)
+        row_stride, col_stride = (self._num_cols, 1) if self._ROW_MAJOR else (1, self._num_cols)
+        for k in range(self._num_major):
+            for p in range(self._indptr[k], self._indptr[k + 1]):
+                flat[k * row_stride + self._indices[p] * col_stride] = self._data[p]
+        return Matrix._from_flat(self._num_rows, self._num_cols, flat)
+
+    def scale_by(self, scalar: T) -> _CompressedMatrix[T]:
+        """Implements the product between the matrix and a scalar value in O(nnz)."""
+        if scalar == 0:
+            return self._new(self._num_rows, self._num_cols, ([0] * (self._num_major + 1), [], []))
+        return self._new(self._num_rows, self._num_cols,
+                         (self._indptr[:], self._indices[:], [scalar * v for v in self._data]))
+
+    def __add__(self, other: SparseMatrix) -> _CompressedMatrix[T]:
+        """Implements the sum of two sparse matrices in O(nnz), the result has the format of the left operand."""
+        assert self._num_rows == other.num_rows and self._num_cols == other.num_cols, \
+            "The matrices must have same dimensions!"
+        other = self._same_format(other)
+        return self._new(self._num_rows, self._num_cols, _merge(self._arrays(), other._arrays(), 1))
+
+    def __sub__(self, other: SparseMatrix) -> _CompressedMatrix[T]:
+        """Implements the subtraction of two sparse matrices in O(nnz), the result has the format of the left operand.
+        """
+        assert self._num_rows == other.num_rows and self._num_cols == other.num_cols, \
+            "The matrices must have same dimensions!"
+        other = self._same_format(other)
+        return self._new(self._num_rows, self._num_cols, _merge(self._arrays(), other._arrays(), -1))
+
+    def __mul__(self, other: Union[SparseMatrix, Matrix[T]]) -> Union[_CompressedMatrix[T], Matrix[T]]:
+        """Implements the matrix product. The product of two sparse matrices is a sparse matrix with the format of the
+        left operand, the product with a dense `Matrix` is a dense `Matrix`.
+        """
+        assert self._num_cols == other.num_rows, \
+            f"Number of columns in A and number rows in B must be equal but "\
+            f"they are {self._num_cols} cols and {other.num_rows} rows!"
+        if isinstance(other, Matrix):
+            return _dense_product(self.to_csr()._arrays(), self._num_rows, other)
+        if self._ROW_MAJOR:
+            arrays = _product(self._arrays(), other.to_csr()._arrays(), other.num_cols)
+        else:
+            # CSC(A*B) has the same arrays of CSR(B^T * A^T)
+            arrays = _product(other.to_csc()._arrays(), self._arrays(), self._num_rows)
+        return self._new(self._num_rows, other.num_cols, arrays)
+
+    def __rmul__(self, other: Matrix[T]) -> Matrix[T]:
+        """Implements the product between a dense `Matrix` and the sparse matrix as (S^T * D^T)^T."""
+        return (self.transpose() * other.transpose()).transpose()
+
+    def __eq__(self, other: SparseMatrix) -> bool:
+        if self._num_rows != other.num_rows or self._num_cols != other.num_cols:
+            return False
+        return self._arrays() == self._same_format(other)._arrays()
+
+    def __str__(self) -> str:
+        return self.to_dense().__str__()
+
+
+class CSRMatrix(_CompressedMatrix[T]):
+    """Implements a sparse matrix in Compressed Sparse Row format: the non-zero elements are stored row by row, so
+    the rows can be traversed in O(nnz of the row). Memory and time of the arithmetic scale with the number of non-zero
+    elements rather than rows*cols.
+    """
+
+    _ROW_MAJOR = True
+
+    def to_csr(self) -> CSRMatrix[T]:
+        return self
+
+    def to_csc(self) -> CSCMatrix[T]:
+        return CSCMatrix(self._num_rows, self._num_cols, *_transpose(self._arrays(), self._num_cols))
+
+    def transpose(self) -> CSCMatrix[T]:
+        """Computes the transpose without moving any element: the CSR arrays of a matrix are the CSC arrays of its
+        transpose.
+        """
+        return CSCMatrix(self._num_cols, self._num_rows, *self._arrays())
+
+
+class CSCMatrix(_CompressedMatrix[T]):
+    """Implements a sparse matrix in Compressed Sparse Column format: the non-zero elements are stored column by
+    column, so the columns can be traversed in O(nnz of the column).
+    """
+
+    _ROW_MAJOR = False
+
+    def to_csr(self) -> CSRMatrix[T]:
+        return CSRMatrix(self._num_rows, self._num_cols, *_transpose(self._arrays(), self._num_rows))
+
+    def to_csc(self) -> CSCMatrix[T]:
+        return self
+
+    def transpose(self) -> CSRMatrix[T]:
+        """Computes the transpose without moving any element: the CSC arrays of a matrix are the CSR arrays of its
+        transpose.
+        """
+        return CSRMatrix(self._num_cols, self._num_rows, *self._arrays())
+
+
+SparseMatrix = Union[COOMatrix, CSRMatrix, CSCMatrix]
+
+
+def _compress(majors: list[int], minors: list[int], values: list, num_major: int) -> tuple[list, list, list]:
+    """Helper function that builds canonical compressed arrays from coordinate lists, summing the duplicates and
+    dropping the zeros.
+    """
+    order = sorted(range(len(values)), key=lambda p: (majors[p], minors[p]))
+    indptr = [0] * (num_major + 1)
+    indices = []
+    data = []
+    p = 0
+    while p < len(order):
+        major, minor = majors[order[p]], minors[order[p]]
+        value = 0
+        while p < len(order) and majors[order[p]] == major and minors[order[p]] == minor:
+            value += values[order[p]]
+            p += 1
+        if value != 0:
+            indices.append(minor)
+            data.append(value)
+            indptr[major + 1] += 1
+    for k in range(num_major):
+        indptr[k + 1] += indptr[k]
+    return indptr, indices, data
+
+
+def _transpose(arrays: tuple[list, list, list], num_minor: int) -> tuple[list, list, list]:
+    """Helper function that converts compressed arrays between CSR and CSC (i.e. computes the arrays of the transpose)
+    with a counting sort on the minor indices, in O(nnz + number of lines).
+    """
+    indptr, indices, data = arrays
+    new_indptr = [0] * (num_minor + 1)
+    for minor in indices:
+        new_indptr[minor + 1] += 1
+    for k in range(num_minor):
+        new_indptr[k + 1] += new_indptr[k]
+    next_pos = new_indptr[:-1]
+    new_indices = [0] * len(indices)
+    new_data = [0] * len(data)
+    for major in range(len(indptr) - 1):
+        for p in range(indptr[major], indptr[major + 1]):
+            q = next_pos[indices[p]]
+            new_indices[q] = major
+            new_data[q] = data[p]
+            next_pos[indices[p]] = q + 1
+    return new_indptr, new_indices, new_data
+
+
+def _merge(a: tuple[list, list, list], b: tuple[list, list, list], sign: int) -> tuple[list, list, list]:
+    """Helper function that computes the compressed arrays of A + sign*B merging the sorted lines of the operands."""
+    a_ptr, a_ind, a_dat = a
+    b_ptr, b_ind, b_dat = b
+    indptr = [0]
+    indices = []
+    data = []
+    for k in range(len(a_ptr) - 1):
+        p, p_end = a_ptr[k], a_ptr[k + 1]
+        r, r_end = b_ptr[k], b_ptr[k + 1]
+        while p < p_end or r < r_end:
+            if r == r_end or (p < p_end and a_ind[p] < b_ind[r]):
+                minor, value = a_ind[p], a_dat[p]
+                p += 1
+            elif p == p_end or b_ind[r] < a_ind[p]:
+                minor, value = b_ind[r], sign * b_dat[r]
+                r += 1
+            else:
+                minor, value = a_ind[p], a_dat[p] + sign * b_dat[r]
+                p += 1
+                r += 1
+            if value != 0:
+                indices.append(minor)
+                data.append(value)
+        indptr.append(len(indices))
+    return indptr, indices, data
+
+
+def _product(a: tuple[list, list, list], b: tuple[list, list, list], num_cols: int) -> tuple[list, list, list]:
+    """Helper function that computes the CSR arrays of A*B from the CSR arrays of A and B (Gustavson's algorithm):
+    every row of the result is accumulated from the rows of B selected by the non-zero elements of the row of A.
+    """
+    a_ptr, a_ind, a_dat = a
+    b_ptr, b_ind, b_dat = b
+    indptr = [0]
+    indices = []
+    data = []
+    for i in range(len(a_ptr) - 1):
+        accumulator = {}
+        for p in range(a_ptr[i], a_ptr[i + 1]):
+            k, value = a_ind[p], a_dat[p]
+            for r in range(b_ptr[k], b_ptr[k + 1]):
+                j = b_ind[r]
+                accumulator[j] = accumulator.get(j, 0) + value * b_dat[r]
+        for j in sorted(accumulator):
+            if accumulator[j] != 0:
+                indices.append(j)
+                data.append(accumulator[j])
+        indptr.append(len(indices))
+    return indptr, indices, data
+
+
+def _dense_product(a: tuple[list, list, list], num_rows: int, other: Matrix[T]) -> Matrix[T]:
+    """Helper function that computes the dense product between a sparse matrix, given as CSR arrays, and a dense
+    matrix: every row of the result is a combination of the rows of `other` selected by the non-zero elements.
+    """
+    a_ptr, a_ind, a_dat = a
+    q = other.num_cols
+    b = other._to_flat()
+    flat = []
+    for i in range(num_rows):
+        row = [0] * q
+        for p in range(a_ptr[i], a_ptr[i + 1]):
+            k, value = a_ind[p], a_dat[p]
+            row = [x + value * y for x, y in zip(row, b[k * q:(k + 1) * q])]
+        flat.extend(row)
+    return Matrix._from_flat(num_rows, q, flat)
@@ -0,0 +1,302 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Optional, Iterator
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class TreeMap(Generic[K, V]):
+    """Implements the Map Abstract Data Type as an AVL tree, a binary search tree that keeps itself balanced so that its
+    height is always O(log n). The keys must be comparable with each other.
+
+    Besides the usual map operations, which run in O(log n), the keys can be traversed in sorted order and queried by
+    order (minimum, maximum, floor, ceiling and ranges).
+    """
+
+    def __init__(self) -> None:
+        """Creates a new empty map."""
+        self._root: Optional[_TreeMapNode] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Computes the number of key/value pairs in the map.
+
+        Returns:
+            The number of entries.
+        """
+        return self._size
+
+    def _find_node(self, key: K) -> Optional[_TreeMapNode]:
+        """Helper method that finds the node containing the given key.
+
+        Returns:
+            The node or None if the key is not in the map.
+        """
+        node = self._root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def __contains__(self, key: K) -> bool:
+        """Determines if the given key is in the map.
+
+        Args:
+            key: The given key.
+
+        Returns:
+            True if the key is found and False otherwise.
+        """
+        return self._find_node(key) is not None
+
+    def add(self, key: K, value: V) -> bool:
+        """Adds a new key/value pair to the map if the key is not already in the map or replaces the data associated
+        with the key if the key is in the map.
+
+        Args:
+            key: The given key.
+            value: The given value.
+
+        Returns:
+            True if this is a new key and False if the data associated with the existing key is replaced.
+        """
+        node = self._find_node(key)
+        if node is not None:
+            node.value = value
+            return False
+        self._root = self._insert(self._root, key, value)
+        self._size += 1
+        return True
+
+    def remove(self, key: K) -> None:
+        """Removes the key/value pair for the given key if it is in the map and raises an exception otherwise.
+
+        Args:
+            key: The given key.
+        """
+        assert key in self, f"Not available key '{key}'"
+        self._root = self._delete(self._root, key)
+        self._size -= 1
+
+    def value_of(self, key: K) -> V:
+        """Returns the data record associated with the given key. The key must exist in the map or an exception is
+        raised.
+
+        Args:
+            key: The given key.
+
+        Returns:
+            The value associated to the given key.
+        """
+        node = self._find_node(key)
+        assert node is not None, f"Not available key '{key}'"
+        return node.value
+
+    def min(self) -> K:
+        """Returns the smallest key in the map, which must not be empty.
+
+        Returns:
+            The smallest key.
+        """
+        assert self._root is not None, "The map is empty!"
+        node = self._root
+        while node.left is not None:
+            node = node.left
+        return node.key
+
+    def max(self) -> K:
+        """Returns the largest key in the map, which must not be empty.
+
+        Returns:
+            The largest key.
+        """
+        assert self._root is not None, "The map is empty!"
+        node = self._root
+        while node.right is not None:
+            node = node.right
+        return node.key
+
+    def floor(self, key: K) -> Optional[K]:
+        """Finds the largest key in the map that is less than or equal to the given key.
+
+        Args:
+            key: The given key.
+
+        Returns:
+            The floor key or None if every key is greater than the given one.
+        """
+        result = None
+        node = self._root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                result = node.key
+                node = node.right
+            else:
+                return node.key
+        return result
+
+    def ceiling(self, key: K) -> Optional[K]:
+        """Finds the smallest key in the map that is greater than or equal to the given key.
+
+        Args:
+            key: The given key.
+
+        Returns:
+            The ceiling key or None if every key is less than the given one.
+        """
+        result = None
+        node = self._root
+        while node is not None:
+            if key > node.key:
+                node = node.right
+            elif key < node.key:
+                result = node.key
+                node = node.left
+            else:
+                return node.key
+        return result
+
+    def range(self, low: K, high: K) -> Iterator[K]:
+        """Iterates in sorted order over the keys k such that low <= k < high. Only the subtrees that may contain such
+        keys are visited, so the traversal costs O(log n + k) where k is the number of returned keys.
+
+        Args:
+            low: The lower bound (included).
+            high: The upper bound (excluded).
+
+        Returns:
+            An iterator over the keys in the range.
+        """
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                if node.key < low:
+                    # the left subtree contains only smaller keys
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if not node.key < high:
+                    return
+                yield node.key
+                node = node.right
+
+    def __iter__(self) -> Iterator[K]:
+        """Creates and returns an iterator that can be used to iterate over the keys in the map in sorted order.
+
+        Returns:
+            An iterator over the keys.
+        """
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.key
+                node = node.right
+
+    @staticmethod
+    def _height(node: Optional[_TreeMapNode]) -> int:
+        return node.height if node is not None else 0
+
+    @staticmethod
+    def _update_height(node: _TreeMapNode) -> None:
+        node.height = 1 + max(TreeMap._height(node.left), TreeMap._height(node.right))
+
+    @staticmethod
+    def _rotate_right(node: _TreeMapNode) -> _TreeMapNode:
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        TreeMap._update_height(node)
+        TreeMap._update_height(pivot)
+        return pivot
+
+    @staticmethod
+    def _rotate_left(node: _TreeMapNode) -> _TreeMapNode:
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        TreeMap._update_height(node)
+        TreeMap._update_height(pivot)
+        return pivot
+
+    @staticmethod
+    def _rebalance(node: _TreeMapNode) -> _TreeMapNode:
+        """Helper method that restores the AVL property of a node whose subtrees heights differ by at most two.
+
+        Returns:
+            The new root of the subtree.
+        """
+        TreeMap._update_height(node)
+        balance = TreeMap._height(node.left) - TreeMap._height(node.right)
+        if balance > 1:
+            if TreeMap._height(node.left.left) < TreeMap._height(node.left.right):
+                node.left = TreeMap._rotate_left(node.left)
+            return TreeMap._rotate_right(node)
+        if balance < -1:
+            if TreeMap._height(node.right.right) < TreeMap._height(node.right.left):
+                node.right = TreeMap._rotate_right(node.right)
+            return TreeMap._rotate_left(node)
+        return node
+
+    def _insert(self, node: Optional[_TreeMapNode], key: K, value: V) -> _TreeMapNode:
+        """Helper method that inserts a key, known not to be in the map, in the subtree rooted at `node`.
+
+        Returns:
+            The new root of the subtree.
+        """
+        if node is None:
+            return _TreeMapNode(key, value)
+        if key < node.key:
+            node.left = self._insert(node.left, key, value)
+        else:
+            node.right = self._insert(node.right, key, value)
+        return self._rebalance(node)
+
+    def _delete(self, node: _TreeMapNode, key: K) -> Optional[_TreeMapNode]:
+        """Helper method that deletes a key, known to be in the map, from the subtree rooted at `node`.
+
+        Returns:
+            The new root of the subtree.
+        """
+        if key < node.key:
+            node.left = self._delete(node.left, key)
+        elif key > node.key:
+            node.right = self._delete(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # replace the entry with its successor and delete the successor from the right subtree
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.key, node.value = successor.key, successor.value
+            node.right = self._delete(node.right, successor.key)
+        return self._rebalance(node)
+
+
+class _TreeMapNode(Generic[K, V]):
+    """Helper class that implements a node of the TreeMap."""
+
+    __slots__ = ('key', 'value', 'left', 'right', 'height')
+
+    def __init__(self, key: K, value: V) -> None:
+        self.key = key
+        self.value = value
+        self.left: Optional[_TreeMapNode] = None
+        self.right: Optional[_TreeMapNode] = None
+        self.height = 1
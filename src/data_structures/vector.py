@@ -1,6 +1,8 @@
 from __future__ import annotations
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterator
+from itertools import islice
 from . import Array
+from .array import _iterate, _fail_fast
 T = TypeVar('T')
 
 
@@ -9,72 +11,112 @@ class Vector(Generic[T]):
     Implements the functionalities of a python list, except it can only contain the same data type items.
     """
 
-    def __init__(self):
+    def __init__(self, growth_factor: float = 2.0):
+        """
+        Creates an empty vector.
+
+        Args:
+            growth_factor: the factor by which the capacity of the underlying array is multiplied when it is full.
+        """
+        assert growth_factor > 1, f"The growth factor must be greater than 1, but it was {growth_factor}!"
         self._array: Array[T] = Array(2)
         self._abstract_size: int = 0
         self._physical_size: int = len(self._array)
+        self._growth_factor: float = growth_factor
+        # the capacity requested with reserve(), below which the vector never shrinks
+        self._reserved: int = 0
+        # incremented by every change of the size or of the underlying array, to detect changes during iteration
+        self._modifications: int = 0
 
     def __len__(self) -> int:
         return self._abstract_size
 
+    @property
+    def capacity(self) -> int:
+        return self._physical_size
+
     def __getitem__(self, index: int) -> T:
         assert 0 <= index < len(self), f"The index must be between 0 and {len(self)-1}, but it was {index}!"
-        return self._array[index]
+        return self._array._elements[index]
 
     def __contains__(self, item: T) -> bool:
-        for i in range(len(self)):
-            if self[i] == item:
+        for element in self:
+            if element == item:
                 return True
         return False
 
     def __setitem__(self, index: int, item: T):
         assert 0 <= index < len(self), f"The index must be between 0 and {len(self) - 1}, but it was {index}!"
-        self._array[index] = item
+        self._array._elements[index] = item
 
-    def append(self, item: T) -> None:
+    def _reallocate(self, capacity: int) -> None:
         """
-        Appends a new item at the end of the vector. If there is no room for other items in the underlying array, a
-        new array with doubled size is created, the current items are copied, the new item is appended and the old array
-        is deleted.
-
-        Args:
-            item: the new item that is appended at the end of the vector.
+        Helper method that moves the items into a new underlying array with the given capacity, copying them as a
+        single block.
         """
-        insertion_index = len(self)
-
-        # THERE IS ROOM FOR NEW ITEMS
-        if len(self) < self._physical_size:
-            # insert the new item
-            self._array[insertion_index] = item
+        new_array = Array(capacity)
+        new_array.copy_from(self._array, slice(0, len(self)), 0)
+        del self._array
+        self._array = new_array
+        self._physical_size = capacity
+        self._modifications += 1
+
+    def _grow(self) -> None:
+        """
+        Helper method that enlarges the underlying array by the growth factor (by at least one item).
+        """
+        self._reallocate(max(self._physical_size + 1, int(self._physical_size * self._growth_factor)))
 
-            # update the abstract size
-            self._abstract_size += 1
+    def _shrink_if_sparse(self) -> None:
+        """
+        Helper method that halves the underlying array when less than a quarter of it is used. Waiting for a quarter
+        instead of a half leaves the vector half full after shrinking, so alternating appends and removals at the
+        boundary do not reallocate every time.
+        """
+        if len(self) < self._physical_size // 4 and self._physical_size // 2 >= max(2, self._reserved):
+            self._reallocate(self._physical_size // 2)
 
-        else:
-            # THERE IS NO ROOM FOR NEW ITEMS (new array with doubled size)
-            # create the new vector
-            new_vector = Array(self._physical_size*2)
+    def reserve(self, capacity: int) -> None:
+        """
+        Makes room for at least `capacity` items, so that they can be appended without reallocations. The vector
+        does not shrink below this capacity until shrink_to_fit() is called.
 
-            # copy the current items
-            for i in range(len(self)):
-                new_vector[i] = self[i]
+        Args:
+            capacity: the number of items the vector must be able to contain.
+        """
+        self._reserved = capacity
+        if capacity > self._physical_size:
+            self._reallocate(capacity)
 
-            # insert the new item
-            new_vector[insertion_index] = item
+    def shrink_to_fit(self) -> None:
+        """
+        Reduces the capacity of the underlying array to the number of items (at least one), and cancels the capacity
+        requested with reserve().
+        """
+        self._reserved = 0
+        capacity = max(1, len(self))
+        if capacity != self._physical_size:
+            self._reallocate(capacity)
 
-            # delete the current vector
-            del self._array
-            self._array = new_vector
+    def append(self, item: T) -> None:
+        """
+        Appends a new item at the end of the vector. If there is no room for other items in the underlying array, a
+        new array `growth_factor` times larger is created and the current items are copied into it as a block, so
+        appending takes amortized O(1) time.
 
-            # update both abstract and physical sizes
-            self._abstract_size += 1
-            self._physical_size *= 2
+        Args:
+            item: the new item that is appended at the end of the vector.
+        """
+        if len(self) == self._physical_size:
+            self._grow()
+        self._array._elements[len(self)] = item
+        self._abstract_size += 1
+        self._modifications += 1
 
     def insert(self, index: int, item: T) -> None:
         """
         Given a positional index and a new item, inserts the new item at the provided index and slide to the right all
-        the other elements (if any). If there is no room for a new item, a new underlying array with doubled size is
-        created.
+        the other elements (if any). If there is no room for a new item, the underlying array is enlarged first.
 
         Args:
             index: an integer representing the positional index where we want to insert the new item.
@@ -83,47 +125,19 @@ class Vector(Generic[T]):
         """
         assert 0 <= index < len(self), f"The index must be between 0 and {len(self) - 1}, but it was {index}!"
 
-        # THERE IS ROOM FOR NEW ITEMS
-        if len(self) < self._physical_size:
-            # slides the elements on te right and insert the new item
-            temp_in = item
-            for i in range(index, len(self)+1):
-                temp_out = self[index]
-                self[index] = temp_in
-                temp_in = temp_out
-
-            # update the abstract size
-            self._abstract_size += 1
+        if len(self) == self._physical_size:
+            self._grow()
 
-        else:
-            # THERE IS NO ROOM FOR NEW ITEMS (new array with doubled size)
-            # create a new array
-            new_array = Array(self._physical_size*2)
-
-            # copy the elements up to index-1
-            for i in range(index):
-                new_array[i] = self[i]
-
-            # insert the new item
-            new_array[index] = item
-
-            # copy the remaining items
-            for i in range(index, len(self)):
-                new_array[i+1] = self[i]
-
-            # update the vector
-            del self._array
-            self._array = new_array
-
-            # update both abstract and physical sizes
-            self._abstract_size += 1
-            self._physical_size *= 2
+        # slide the elements on the right by one position with a single block copy and insert the new item
+        self._array.copy_from(self._array, slice(index, len(self)), index + 1)
+        self._array._elements[index] = item
+        self._abstract_size += 1
+        self._modifications += 1
 
     def remove(self, index: int) -> T:
         """
         Removes the item at the provided positional index. If the items contained in the underlying array are less than
-        half the available space, a new array is created with halved size, the current items are copied into the new
-        array and the old array is deleted.
+        a quarter of the available space, the underlying array is halved.
 
         Args:
             index: an integer representing the positional index of the item we want to remove.
@@ -134,33 +148,30 @@ class Vector(Generic[T]):
         assert len(self) > 0, f"There are no items in the vector!"
         assert 0 <= index < len(self), f"The index must be between 0 and {len(self) - 1}, but it was {index}!"
 
-        removed_item = self._array[index]
-
-        # slide left the items after the index position and set the last item as None
-        for i in range(index+1, len(self)):
-            self._array[i-1] = self._array[i]
-        self[len(self)-1] = None
+        removed_item = self._array._elements[index]
 
-        # update the abstract size
+        # slide left the items after the index position with a single block copy and set the last item as None
+        self._array.copy_from(self._array, slice(index + 1, len(self)), index)
+        self._array._elements[len(self) - 1] = None
         self._abstract_size -= 1
+        self._modifications += 1
 
-        # update the physical size if necessary
-        if len(self) < self._physical_size//2:
-
-            # create a new array
-            new_array = Array(self._physical_size//2)
-
-            # copy the elements
-            for i in range(len(self)):
-                new_array[i] = self[i]
-
-            # update the array
-            del self._array
-            self._array = new_array
+        self._shrink_if_sparse()
+        return removed_item
 
-            # update the physical size
-            self._physical_size //= 2
+    def pop(self) -> T:
+        """
+        Removes the last item in O(1) amortized time.
 
+        Returns:
+            the removed item.
+        """
+        assert len(self) > 0, f"There are no items in the vector!"
+        self._abstract_size -= 1
+        self._modifications += 1
+        removed_item = self._array._elements[len(self)]
+        self._array._elements[len(self)] = None
+        self._shrink_if_sparse()
         return removed_item
 
     def index_of(self, item: T) -> int:
@@ -173,10 +184,10 @@ class Vector(Generic[T]):
         Returns:
             the positional integer index of the given item.
         """
-        assert item in self, f"The item {item} is not in the vector!"
-        for i in range(len(self)):
-            if self[i] == item:
+        for i, element in enumerate(self):
+            if element == item:
                 return i
+        assert False, f"The item {item} is not in the vector!"
 
     def extend(self, other: Vector[T]) -> None:
         """
@@ -203,14 +214,16 @@ class Vector(Generic[T]):
             f"The start index must be between 0 and {len(self) - 1}, but it was {index_from}!"
         assert 0 <= index_to < len(self), \
             f"The end index must be between 0 and {len(self) - 1}, but it was {index_to}!"
-        vector = Vector()
-        for i in range(index_from, index_to+1):
-            vector.append(self[i])
+        vector = type(self)()
+        for item in islice(self, index_from, index_to + 1):
+            vector.append(item)
         return vector
 
     def __eq__(self, other: Vector[T]) -> bool:
-        for i in range(len(self)):
-            if self[i] != other[i]:
+        if len(self) != len(other):
+            return False
+        for item, other_item in zip(self, other):
+            if item != other_item:
                 return False
         return True
 
@@ -218,26 +231,17 @@ class Vector(Generic[T]):
         string = "[" + ', '.join([str(el) for el in self]) + "]"
         return string
 
-    def __iter__(self) -> _VectorIterator:
-        return _VectorIterator(self)
-
-
-class _VectorIterator:
-    """
-    Helper class that implements the iterator for the Vector ADT
-    """
-
-    def __init__(self, vector: Vector[T]):
-        self._vector_ref = vector
-        self._cur_ndx = 0
-
-    def __iter__(self) -> _VectorIterator:
-        return self
+    def __iter__(self) -> Iterator[T]:
+        """
+        Creates an iterator over the items, which raises a RuntimeError if the vector changes size while it is used.
+        The items are read in blocks of 1024, so an item assigned during the iteration after its block is read is
+        yielded with its old value.
+        """
+        return _fail_fast(self, _iterate(self._array._elements, 0, len(self)))
 
-    def __next__(self) -> T:
-        if self._cur_ndx < len(self._vector_ref):
-            entry = self._vector_ref[self._cur_ndx]
-            self._cur_ndx += 1
-            return entry
-        else:
-            raise StopIteration
+    def __reversed__(self) -> Iterator[T]:
+        """
+        Creates an iterator over the items from the last one, which raises a RuntimeError if the vector changes size
+        while it is used.
+        """
+        return _fail_fast(self, _iterate(self._array._elements, 0, len(self), reverse=True))
@@ -1,3 +1,4 @@
+import sys
 from unittest import TestCase
 from src.data_structures import Array
 
@@ -21,3 +22,84 @@ class TestArray(TestCase):
         self.array.clear(4)
         for item in self.array:
             self.assertEqual(item, 4, "Wrong cleared value!")
+
+    def test_typed_initialization(self):
+        typed_array = Array(5, dtype='i4')
+        self.assertEqual(typed_array.dtype, 'i4')
+        self.assertEqual(typed_array.itemsize, 4)
+        for item in typed_array:
+            self.assertEqual(item, 0, "Wrong initialization value!")
+
+    def test_typed_set_get(self):
+        typed_array = Array(3, dtype='f8')
+        typed_array[1] = 2.5
+        self.assertEqual(typed_array[1], 2.5)
+        self.assertRaises(AssertionError, Array, 3, 'x4')
+
+    def test_typed_memoryview(self):
+        typed_array = Array(4, dtype='u2')
+        view = typed_array.memoryview()
+        self.assertEqual(view.nbytes, 8)
+        view[2] = 7
+        self.assertEqual(typed_array[2], 7)
+        self.assertRaises(AssertionError, self.array.memoryview)
+
+    def test_iteration(self):
+        array = Array.from_iterable(range(2500), dtype='i4')
+        self.assertEqual(list(array), list(range(2500)))
+        self.assertEqual(list(reversed(array)), list(range(2499, -1, -1)))
+
+    def test_str(self):
+        self.assertEqual(str(Array.from_iterable([1, 2, 3])), "[1, 2, 3]")
+
+    def test_from_iterable(self):
+        array = Array.from_iterable(range(4), dtype='i8')
+        self.assertEqual(len(array), 4)
+        self.assertEqual(list(array), [0, 1, 2, 3])
+
+    def test_fill(self):
+        self.array.fill(7, 2, 5)
+        self.assertEqual(list(self.array)[1:6], [None, 7, 7, 7, None])
+        typed_array = Array.from_iterable([1, 2, 3, 4], dtype='f8')
+        typed_array.fill(0, 1)
+        self.assertEqual(list(typed_array), [1.0, 0.0, 0.0, 0.0])
+        for size in (1, 2, 7, 64, 100):
+            typed_array = Array(size + 2, dtype='i2')
+            typed_array.fill(-3, 1, size + 1)
+            self.assertEqual(list(typed_array), [0] + [-3] * size + [0])
+
+    def test_get_slice(self):
+        for dtype in [None, 'i4']:
+            array = Array.from_iterable(range(6), dtype)
+            self.assertEqual(list(array[1:4]), [1, 2, 3])
+            self.assertEqual(list(array[::2]), [0, 2, 4])
+            self.assertEqual(array[1:4].dtype, dtype)
+            empty = array[3:3]
+            self.assertEqual((len(empty), list(empty), empty.dtype), (0, [], dtype))
+            self.assertEqual(list(array[5:1]), [])
+
+    def test_set_slice(self):
+        for dtype in [None, 'i4']:
+            array = Array.from_iterable(range(6), dtype)
+            array[1:3] = [9, 8]
+            array[4:] = Array.from_iterable([7, 6], dtype)
+            array[::5] = (-1, -2)
+            self.assertEqual(list(array), [-1, 9, 8, 3, 7, -2])
+            self.assertRaises(AssertionError, array.__setitem__, slice(0, 2), [1])
+
+    def test_copy_from(self):
+        for dtype in [None, 'u1']:
+            array = Array.from_iterable(range(6), dtype)
+            array.copy_from(array, slice(0, 4), 2)
+            self.assertEqual(list(array), [0, 1, 0, 1, 2, 3])
+            other = Array.from_iterable([5, 6, 7], dtype)
+            array.copy_from(other, slice(1, None))
+            self.assertEqual(list(array), [6, 7, 0, 1, 2, 3])
+            self.assertRaises(AssertionError, array.copy_from, other, None, 4)
+
+    def test_from_buffer(self):
+        buffer = bytearray(12)
+        array = Array.from_buffer(buffer, 2, 'i4', offset=4)
+        array[1] = 258
+        self.assertEqual(buffer[8:12], (258).to_bytes(4, sys.byteorder))
+        self.assertEqual(list(array), [0, 258])
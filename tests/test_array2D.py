@@ -21,3 +21,31 @@ class TestArray2D(TestCase):
     def test_get_set(self):
         self.array2D[2, 1] = 4
         self.assertEqual(self.array2D[2, 1], 4)
+
+    def test_row_view(self):
+        self.array2D.clear(0)
+        row = self.array2D.row(1)
+        self.assertEqual(len(row), 3)
+        row[2] = 5
+        self.assertEqual(self.array2D[1, 2], 5)
+        self.assertEqual(list(row), [0, 0, 5])
+        self.assertRaises(AssertionError, self.array2D.row, 4)
+
+    def test_col_view(self):
+        for i in range(self.array2D.num_rows):
+            for j in range(self.array2D.num_cols):
+                self.array2D[i, j] = i * 10 + j
+        col = self.array2D.col(1)
+        self.assertEqual(len(col), 4)
+        self.assertEqual(list(col), [1, 11, 21, 31])
+        col[3] = -1
+        self.assertEqual(self.array2D[3, 1], -1)
+
+    def test_typed(self):
+        array2D = Array2D(2, 2, dtype='f8')
+        array2D[1, 0] = 1.5
+        self.assertEqual(array2D[1, 0], 1.5)
+        self.assertEqual(array2D[0, 0], 0.0)
+
+    def test_str(self):
+        self.assertEqual(str(Array2D(2, 2, dtype='i1')), "[[0, 0]\n [0, 0]]")
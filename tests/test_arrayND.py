@@ -1,4 +1,184 @@
-from unittest import TestCase
+import os
+import pickle
+import tempfile
+from unittest import TestCase, skipIf
 from src.data_structures import MultiArray
+from src.data_structures.arrayND import numpy
 
-# TODO: implements  tests for  multidimensional array
+
+class TestMultiArray(TestCase):
+    def setUp(self):
+        self.multi_array: MultiArray[int] = MultiArray(2, 3, 4)
+
+    def test_dims(self):
+        self.assertEqual(self.multi_array.num_dims, 3)
+        self.assertEqual(self.multi_array.size, 24)
+        self.assertEqual(self.multi_array.length(2), 4)
+
+    def test_get_set(self):
+        self.multi_array[1, 2, 3] = 5
+        self.assertEqual(self.multi_array[1, 2, 3], 5)
+        self.assertIsNone(self.multi_array[0, 0, 0])
+
+    def test_typed(self):
+        multi_array = MultiArray(2, 2, dtype='f4')
+        self.assertEqual(multi_array.dtype, 'f4')
+        self.assertEqual(multi_array[1, 1], 0.0)
+        self.assertRaises(TypeError, multi_array.__setitem__, (1, 1), "x")
+
+    @staticmethod
+    def arange(*dims, dtype=None):
+        multi_array = MultiArray(*dims, dtype=dtype)
+        multi_array._store_flat(list(range(multi_array.size)))
+        return multi_array
+
+    def test_slice_view(self):
+        multi_array = self.arange(2, 3, 4)
+        view = multi_array[1, :, 1::2]
+        self.assertEqual(view.num_dims, 2)
+        self.assertEqual((view.length(0), view.length(1)), (3, 2))
+        self.assertEqual(view._to_flat(), [13, 15, 17, 19, 21, 23])
+        self.assertFalse(view.is_contiguous)
+        view[2, 1] = -1
+        self.assertEqual(multi_array[1, 2, 3], -1)
+        self.assertEqual(multi_array[..., 0]._to_flat(), [0, 4, 8, 12, 16, 20])
+        self.assertEqual(multi_array[0, ::-1, 0]._to_flat(), [8, 4, 0])
+        self.assertEqual(multi_array[1, 1, 2], multi_array[1][1, 2])
+
+    def test_slice_assignment(self):
+        multi_array = self.arange(3, 3, dtype='i4')
+        multi_array[:, 1] = 0
+        self.assertEqual(multi_array._to_flat(), [0, 0, 2, 3, 0, 5, 6, 0, 8])
+        row = self.arange(1, 3)
+        multi_array[1:, :] = row
+        self.assertEqual(multi_array._to_flat(), [0, 0, 2, 0, 1, 2, 0, 1, 2])
+
+    def test_reshape_transpose(self):
+        multi_array = self.arange(2, 3, 4)
+        reshaped = multi_array.reshape(6, 4)
+        reshaped[5, 3] = 100
+        self.assertEqual(multi_array[1, 2, 3], 100)
+        transposed = multi_array.transpose()
+        self.assertEqual((transposed.length(0), transposed.length(2)), (4, 2))
+        self.assertEqual(transposed[3, 1, 0], multi_array[0, 1, 3])
+        permuted = multi_array.transpose(1, 0, 2)
+        self.assertEqual(permuted[2, 1, 0], multi_array[1, 2, 0])
+        # a strided view is copied when reshaped
+        self.assertEqual(transposed.reshape(24)._to_flat()[:3], [0, 12, 4])
+
+    def test_broadcasting(self):
+        matrix = self.arange(2, 3)
+        row = self.arange(1, 3)
+        column = self.arange(2, 1)
+        self.assertEqual((matrix + row)._to_flat(), [0, 2, 4, 3, 5, 7])
+        self.assertEqual((matrix * column)._to_flat(), [0, 0, 0, 3, 4, 5])
+        self.assertEqual((row - column)._to_flat(), [0, 1, 2, -1, 0, 1])
+        self.assertEqual((10 - matrix)._to_flat(), [10, 9, 8, 7, 6, 5])
+        broadcast = row.broadcast_to(4, 3)
+        self.assertTrue(broadcast.read_only)
+        self.assertEqual(broadcast[3, 2], 2)
+        with self.assertRaises(AssertionError):
+            matrix + self.arange(2, 2)
+
+    def test_reductions(self):
+        multi_array = self.arange(2, 3, 4)
+        self.assertEqual(multi_array.sum(), 276)
+        self.assertEqual(multi_array.mean(), 11.5)
+        self.assertEqual(multi_array.sum(axis=0)._to_flat(), [12 + 2 * i for i in range(12)])
+        self.assertEqual(multi_array.sum(axis=2)._to_flat(), [6, 22, 38, 54, 70, 86])
+        self.assertEqual(multi_array.max(axis=1)._to_flat(), [8, 9, 10, 11, 20, 21, 22, 23])
+        self.assertEqual(multi_array.min(axis=1)._to_flat(), [0, 1, 2, 3, 12, 13, 14, 15])
+        self.assertEqual(multi_array.mean(axis=2)[1, 2], 21.5)
+        # reductions of views
+        self.assertEqual(multi_array[1, :, 1:3].sum(), 13 + 14 + 17 + 18 + 21 + 22)
+        self.assertEqual(multi_array[0, 1].sum(axis=0), 4 + 5 + 6 + 7)
+
+    def test_arg_reductions(self):
+        multi_array = self.arange(3, 3)
+        multi_array[1, 1] = -5
+        multi_array[0, 2] = 50
+        self.assertEqual(multi_array.argmin(), (1, 1))
+        self.assertEqual(multi_array.argmax(), (0, 2))
+        self.assertEqual(multi_array.argmax(axis=0)._to_flat(), [2, 2, 0])
+        self.assertEqual(multi_array.argmin(axis=1)._to_flat(), [0, 1, 0])
+
+    def test_cumsum_map(self):
+        multi_array = self.arange(2, 3)
+        self.assertEqual(multi_array.cumsum()._to_flat(), [0, 1, 3, 6, 10, 15])
+        self.assertEqual(multi_array.cumsum(axis=0)._to_flat(), [0, 1, 2, 3, 5, 7])
+        self.assertEqual(multi_array.cumsum(axis=1)._to_flat(), [0, 1, 3, 3, 7, 12])
+        self.assertEqual(multi_array.transpose().map(lambda x: x * x)._to_flat(), [0, 9, 1, 16, 4, 25])
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_backend(self):
+        typed = self.arange(2, 3, 4, dtype='i8')
+        untyped = self.arange(2, 3, 4)
+        for name in ('sum', 'mean', 'min', 'max', 'argmin', 'argmax'):
+            self.assertEqual(getattr(typed, name)(), getattr(untyped, name)())
+            for axis in range(3):
+                result = getattr(typed, name)(axis)
+                self.assertIsNotNone(result.dtype)
+                self.assertEqual(result._to_flat(), getattr(untyped, name)(axis)._to_flat())
+        self.assertEqual(typed[:, ::-1, 1:].cumsum(1)._to_flat(), untyped[:, ::-1, 1:].cumsum(1)._to_flat())
+        self.assertEqual((typed[0] * typed[1, :1]).dtype, 'i8')
+        self.assertEqual((typed[0] * typed[1, :1])._to_flat(), (untyped[0] * untyped[1, :1])._to_flat())
+        self.assertEqual((1 - typed)._to_flat(), (1 - untyped)._to_flat())
+
+
+class TestMultiArrayFile(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cube.marr")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_create_and_open(self):
+        with MultiArray.create(self.path, 3, 4, 5, dtype='i4') as multi_array:
+            self.assertEqual(multi_array[2, 3, 4], 0)
+            multi_array[2, 3, 4] = 7
+            multi_array[0, 1, 0] = -1
+        with MultiArray.open(self.path) as multi_array:
+            self.assertEqual(multi_array.dtype, 'i4')
+            self.assertEqual(multi_array.length(1), 4)
+            self.assertEqual(multi_array[2, 3, 4], 7)
+            self.assertEqual(multi_array[0, 1, 0], -1)
+            self.assertTrue(multi_array.read_only)
+            self.assertRaises(AssertionError, multi_array.__setitem__, (0, 0, 0), 1)
+
+    def test_raw_layout(self):
+        with MultiArray.create(self.path, 2, 2, dtype='u1') as multi_array:
+            multi_array[1, 0] = 9
+        with open(self.path, 'rb') as file:
+            content = file.read()
+        self.assertEqual(content[:8], b'MULTIARR')
+        self.assertEqual(len(content), 64 + 4)
+        self.assertEqual(content[64:], bytes([0, 0, 9, 0]))
+
+    def test_pickle_reopens_file(self):
+        with MultiArray.create(self.path, 2, 2, dtype='f8') as multi_array:
+            multi_array[0, 1] = 1.5
+            with pickle.loads(pickle.dumps(multi_array)) as copy:
+                self.assertEqual(copy[0, 1], 1.5)
+                multi_array[1, 1] = 2.5
+                self.assertEqual(copy[1, 1], 2.5)
+
+    def test_close_with_views(self):
+        multi_array = MultiArray.create(self.path, 4, 4, dtype='i2')
+        row = multi_array[1]
+        column = row.reshape(2, 2)[:, 0]
+        multi_array.close()
+        self.assertIsNone(row._array)
+        self.assertIsNone(column._array)
+        # memory exported outside of the views keeps the mapping open until it is released
+        multi_array = MultiArray.open(self.path)
+        exported = multi_array._array.memoryview()
+        with self.assertWarns(ResourceWarning):
+            multi_array.close()
+        self.assertIsNone(multi_array._mmap)
+        exported.release()
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'\0' * 64)
+        self.assertRaises(AssertionError, MultiArray.open, self.path)
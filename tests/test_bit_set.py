@@ -0,0 +1,57 @@
+from unittest import TestCase
+from src.data_structures import BitSet
+
+
+class TestBitSet(TestCase):
+    @staticmethod
+    def make_set(items: list[int]) -> BitSet:
+        s = BitSet()
+        for item in items:
+            s.add(item)
+        return s
+
+    def setUp(self) -> None:
+        self.s1 = TestBitSet.make_set([0, 3, 64, 200])
+        self.s2 = TestBitSet.make_set([3, 64, 65])
+
+    def test_add_contains(self):
+        self.s1.add(3)
+        self.s1.add(1000)
+        self.assertEqual(len(self.s1), 5)
+        self.assertIn(1000, self.s1)
+        self.assertNotIn(999, self.s1)
+        self.assertNotIn(100000, self.s1)
+        self.assertNotIn(-1, self.s1)
+        self.assertNotIn("3", self.s1)
+        self.assertNotIn(3.5, self.s1)
+        self.assertRaises(AssertionError, self.s1.add, -1)
+
+    def test_remove(self):
+        self.s1.remove(64)
+        self.assertNotIn(64, self.s1)
+        self.assertEqual(len(self.s1), 3)
+        self.assertRaises(AssertionError, self.s1.remove, 64)
+
+    def test_iter(self):
+        self.assertEqual(list(self.s1), [0, 3, 64, 200])
+
+    def test_union(self):
+        union = self.s1.union(self.s2)
+        self.assertEqual(list(union), [0, 3, 64, 65, 200])
+        self.assertEqual(len(union), 5)
+
+    def test_intersect(self):
+        self.assertEqual(list(self.s1.intersect(self.s2)), [3, 64])
+        self.assertEqual(list(self.s2.intersect(self.s1)), [3, 64])
+
+    def test_difference(self):
+        self.assertEqual(list(self.s1.difference(self.s2)), [0, 200])
+        self.assertEqual(list(self.s2.difference(self.s1)), [65])
+
+    def test_is_subset_of(self):
+        self.assertTrue(TestBitSet.make_set([3, 65]).is_subset_of(self.s2))
+        self.assertFalse(self.s2.is_subset_of(self.s1))
+
+    def test_eq(self):
+        self.assertEqual(self.s1, TestBitSet.make_set([200, 64, 3, 0]))
+        self.assertNotEqual(self.s1, self.s2)
@@ -0,0 +1,65 @@
+from unittest import TestCase
+from src.data_structures import ChunkedMultiArray
+
+
+class TestChunkedMultiArray(TestCase):
+    def setUp(self):
+        self.chunked: ChunkedMultiArray[int] = ChunkedMultiArray(10, 10, 10, chunk_shape=(4, 4, 4), dtype='i4')
+
+    def test_allocation_on_write(self):
+        self.assertEqual(self.chunked.num_chunks, 0)
+        self.assertEqual(self.chunked[9, 9, 9], 0)
+        self.chunked[9, 9, 9] = 3
+        self.chunked[8, 8, 8] = 4
+        self.chunked[0, 0, 0] = 0
+        self.assertEqual(self.chunked.num_chunks, 1)
+        self.assertEqual(self.chunked[9, 9, 9], 3)
+        self.assertEqual(self.chunked[8, 8, 8], 4)
+        self.assertEqual(self.chunked.nbytes, 4 * 64)
+        with self.assertRaises(AssertionError):
+            self.chunked[10, 0, 0] = 1
+
+    def test_untyped(self):
+        chunked = ChunkedMultiArray(5, 5, chunk_shape=(2, 3))
+        self.assertIsNone(chunked[4, 4])
+        chunked[4, 4] = "x"
+        self.assertEqual(chunked[4, 4], "x")
+        with self.assertRaises(AssertionError):
+            ChunkedMultiArray(5, 5, chunk_shape=(2, 3), compression='zlib')
+
+    def test_compression(self):
+        for compression in ('zlib', 'lzma'):
+            chunked = ChunkedMultiArray(16, 16, chunk_shape=(4, 4), dtype='f8', compression=compression,
+                                        cache_size=2)
+            for i in range(16):
+                chunked[i, i] = i + 0.5
+            # only the two most recently used chunks are decompressed
+            self.assertEqual(len(chunked._cache), 2)
+            self.assertEqual(chunked.num_chunks, 4)
+            for i in range(16):
+                self.assertEqual(chunked[i, i], i + 0.5)
+                self.assertEqual(chunked[i, 15 - i], 0)
+            chunked.flush()
+            self.assertFalse(chunked._dirty)
+            self.assertLess(chunked.nbytes, 4 * 16 * 8 + 2 * 16 * 8)
+
+    def test_chunks(self):
+        self.chunked[1, 2, 3] = 1
+        self.chunked[9, 0, 5] = 2
+        chunks = list(self.chunked.chunks())
+        self.assertEqual([origin for origin, _ in chunks], [(0, 0, 0), (8, 0, 4)])
+        self.assertEqual(chunks[0][1][1, 2, 3], 1)
+        last = chunks[1][1]
+        self.assertEqual((last.length(0), last.length(1), last.length(2)), (2, 4, 4))
+        self.assertEqual(last[1, 0, 1], 2)
+        self.assertEqual(last.sum(), 2)
+
+    def test_to_multi_array(self):
+        chunked = ChunkedMultiArray(5, 7, chunk_shape=(2, 2), dtype='i8', compression='zlib', cache_size=1)
+        for i in range(5):
+            chunked[i, i + 2] = i + 1
+        multi_array = chunked.to_multi_array()
+        self.assertEqual(multi_array.dtype, 'i8')
+        self.assertEqual(multi_array.sum(), 15)
+        self.assertEqual(multi_array[4, 6], 5)
+        self.assertEqual(multi_array[0, 0], 0)
@@ -0,0 +1,74 @@
+from unittest import TestCase
+from src.data_structures import Deque
+
+
+class TestDeque(TestCase):
+    def setUp(self):
+        self.deque: Deque[int] = Deque(capacity=4)
+
+    def test_both_ends(self):
+        for i in range(3):
+            self.deque.append(i)
+            self.deque.appendleft(-i - 1)
+        self.assertEqual(list(self.deque), [-3, -2, -1, 0, 1, 2])
+        self.assertEqual(self.deque.capacity, 8)
+        self.assertEqual(self.deque[0], -3)
+        self.assertEqual(self.deque[5], 2)
+        self.deque[1] = 20
+        self.assertEqual(self.deque.popleft(), -3)
+        self.assertEqual(self.deque.pop(), 2)
+        self.assertEqual(self.deque.popleft(), 20)
+        self.assertEqual(len(self.deque), 3)
+        self.assertRaises(AssertionError, self.deque.__getitem__, 3)
+        self.assertRaises(AssertionError, Deque().pop)
+
+    def test_fifo_wraps_around(self):
+        # a queue that never holds more than 3 items never grows the buffer
+        for i in range(100):
+            self.deque.append(i)
+            if i >= 2:
+                self.assertEqual(self.deque.popleft(), i - 2)
+        self.assertEqual(self.deque.capacity, 4)
+        self.assertEqual(list(self.deque), [98, 99])
+
+    def test_maxlen(self):
+        window = Deque(maxlen=3)
+        for i in range(5):
+            window.append(i)
+        self.assertEqual(list(window), [2, 3, 4])
+        window.appendleft(10)
+        self.assertEqual(list(window), [10, 2, 3])
+        window.extend(range(20, 22))
+        self.assertEqual(list(window), [3, 20, 21])
+        window.extend(range(100))
+        self.assertEqual(list(window), [97, 98, 99])
+        self.assertEqual(window.capacity, 3)
+
+    def test_extend_drain(self):
+        self.deque.extend([1, 2, 3])
+        self.assertEqual(self.deque.drain(2), [1, 2])
+        self.deque.extend(range(4, 10))
+        self.assertEqual(str(self.deque), "[3, 4, 5, 6, 7, 8, 9]")
+        self.assertEqual(self.deque.drain(3), [3, 4, 5])
+        self.deque.extend([10, 11, 12])
+        self.assertEqual(self.deque.drain(), [6, 7, 8, 9, 10, 11, 12])
+        self.assertEqual(len(self.deque), 0)
+        self.assertEqual(self.deque.drain(), [])
+        self.assertTrue(all(x is None for x in self.deque._array))
+        self.assertRaises(AssertionError, self.deque.drain, -1)
+
+    def test_reversed_and_concurrent_modification(self):
+        deque = Deque(capacity=4)
+        for i in range(3):
+            deque.append(i)
+        deque.popleft()
+        deque.extend([3, 4, 5])
+        self.assertEqual(list(reversed(deque)), [5, 4, 3, 2, 1])
+        iterator = iter(deque)
+        next(iterator)
+        deque.appendleft(0)
+        self.assertRaises(RuntimeError, next, iterator)
+        iterator = reversed(deque)
+        next(iterator)
+        deque.pop()
+        self.assertRaises(RuntimeError, next, iterator)
@@ -0,0 +1,65 @@
+from unittest import TestCase
+from src.data_structures import HashMap
+
+
+class TestHashMap(TestCase):
+    def setUp(self) -> None:
+        self.map: HashMap[int, str] = HashMap()
+
+    def test_initial_len(self):
+        self.assertEqual(len(self.map), 0)
+
+    def test_add(self):
+        self.assertTrue(self.map.add(1, "a"))
+        self.assertFalse(self.map.add(1, "b"))
+        self.assertEqual(len(self.map), 1)
+        self.assertEqual(self.map.value_of(1), "b")
+
+    def test_contains(self):
+        self.map.add(3, "c")
+        self.assertIn(3, self.map)
+        self.assertNotIn(4, self.map)
+
+    def test_remove(self):
+        self.map.add(1, "a")
+        self.map.add(2, "b")
+        self.map.remove(1)
+        self.assertNotIn(1, self.map)
+        self.assertEqual(self.map.value_of(2), "b")
+        self.assertEqual(len(self.map), 1)
+        self.assertRaises(AssertionError, self.map.remove, 1)
+        self.assertRaises(AssertionError, self.map.value_of, 1)
+
+    def test_growth(self):
+        for i in range(1000):
+            self.map.add(i, str(i))
+        self.assertEqual(len(self.map), 1000)
+        self.assertLessEqual(self.map.load_factor, 0.75)
+        for i in range(1000):
+            self.assertEqual(self.map.value_of(i), str(i))
+
+    def test_operations_during_rehash(self):
+        hash_map = HashMap(capacity=64)
+        for i in range(48):
+            hash_map.add(i, i)
+        hash_map.add(48, 48)
+        self.assertTrue(hash_map.is_rehashing)
+        self.assertFalse(hash_map.add(0, -1))
+        self.assertEqual(hash_map.value_of(0), -1)
+        hash_map.remove(47)
+        self.assertNotIn(47, hash_map)
+        self.assertEqual(sorted(hash_map), [i for i in range(49) if i != 47])
+
+    def test_reuse_of_deleted_slots(self):
+        hash_map = HashMap(capacity=16)
+        for i in range(10000):
+            hash_map.add(i, i)
+            hash_map.remove(i)
+        self.assertEqual(len(hash_map), 0)
+        self.assertLessEqual(hash_map._capacity, 32)
+
+    def test_iter(self):
+        keys = ["x", "y", "z"]
+        for key in keys:
+            self.map.add(key, key.upper())
+        self.assertEqual(sorted(self.map), keys)
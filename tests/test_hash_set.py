@@ -0,0 +1,50 @@
+from unittest import TestCase
+from src.data_structures import HashSet, Set
+
+
+class TestHashSet(TestCase):
+    @staticmethod
+    def make_set(items: list) -> HashSet:
+        s = HashSet()
+        for item in items:
+            s.add(item)
+        return s
+
+    def setUp(self) -> None:
+        self.s1: HashSet[int] = TestHashSet.make_set([1, 2, 3, 4])
+        self.s2: HashSet[int] = TestHashSet.make_set([3, 4, 5])
+
+    def test_add(self):
+        self.s1.add(2)
+        self.s1.add(7)
+        self.assertEqual(len(self.s1), 5)
+        self.assertIn(7, self.s1)
+
+    def test_remove(self):
+        self.s1.remove(1)
+        self.assertNotIn(1, self.s1)
+        self.assertRaises(AssertionError, self.s1.remove, 1)
+
+    def test_union(self):
+        self.assertEqual(self.s1.union(self.s2), TestHashSet.make_set([1, 2, 3, 4, 5]))
+
+    def test_intersect(self):
+        self.assertEqual(self.s1.intersect(self.s2), TestHashSet.make_set([3, 4]))
+        self.assertEqual(self.s2.intersect(self.s1), TestHashSet.make_set([3, 4]))
+
+    def test_difference(self):
+        self.assertEqual(self.s1.difference(self.s2), TestHashSet.make_set([1, 2]))
+
+    def test_is_subset_of(self):
+        self.assertTrue(TestHashSet.make_set([3, 5]).is_subset_of(self.s2))
+        self.assertFalse(self.s1.is_subset_of(self.s2))
+
+    def test_eq(self):
+        self.assertEqual(self.s1, TestHashSet.make_set([4, 3, 2, 1]))
+        self.assertNotEqual(self.s1, self.s2)
+
+    def test_interoperability_with_set(self):
+        other = Set()
+        other.add(4)
+        other.add(9)
+        self.assertEqual(self.s1.intersect(other), TestHashSet.make_set([4]))
@@ -0,0 +1,16 @@
+from unittest import TestCase
+from src.data_structures import Map
+
+
+class TestMap(TestCase):
+    def test_iteration(self):
+        map_ = Map()
+        for key in "abc":
+            map_.add(key, key.upper())
+        self.assertEqual(list(map_), ["a", "b", "c"])
+        self.assertEqual(list(reversed(map_)), ["c", "b", "a"])
+        iterator = iter(map_)
+        map_.add("a", "A2")
+        self.assertEqual(next(iterator), "a")
+        map_.remove("b")
+        self.assertRaises(RuntimeError, next, iterator)
@@ -1,5 +1,6 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from src.data_structures import Matrix
+from src.data_structures.matrix import numpy
 
 
 class TestMatrix(TestCase):
@@ -11,6 +12,12 @@ class TestMatrix(TestCase):
             for j in range(m.num_cols):
                 m[i, j] = content[i][j]
 
+    @staticmethod
+    def make(content: list[list]) -> Matrix:
+        m = Matrix(len(content), len(content[0]))
+        TestMatrix.fill_matrix(m, content)
+        return m
+
     def setUp(self):
         m1: Matrix[int] = Matrix(2, 3)
         m2: Matrix[int] = Matrix(2, 3)
@@ -79,4 +86,116 @@ class TestMatrix(TestCase):
         expected = self.m1 * self.m3
         self.assertEqual(actual, expected)
 
+    def test_prod_strassen(self):
+        a = Matrix(9, 7)
+        b = Matrix(7, 5)
+        TestMatrix.fill_matrix(a, [[(i * 7 + j) % 5 - 2 for j in range(7)] for i in range(9)])
+        TestMatrix.fill_matrix(b, [[(i * 3 + j) % 4 - 1 for j in range(5)] for i in range(7)])
+        expected = a * b
+        a.strassen_threshold = 2
+        a.block_size = 2
+        self.assertEqual(a * b, expected)
+
+    def test_typed(self):
+        m = Matrix(2, 3, dtype='f8')
+        TestMatrix.fill_matrix(m, [[1, 2, 3], [2, 6, 3]])
+        self.assertEqual(m.dtype, 'f8')
+        self.assertEqual(m, self.m1)
+        self.assertEqual(m + self.m2, self.m1 + self.m2)
+        self.assertEqual(m * self.m3, self.m1 * self.m3)
+
+    def test_typed_pure_python(self):
+        Matrix.use_numpy = False
+        try:
+            a = Matrix(2, 3, dtype='i4')
+            b = Matrix(3, 2, dtype='i4')
+            TestMatrix.fill_matrix(a, [[1, 2, 3], [2, 6, 3]])
+            TestMatrix.fill_matrix(b, [[1, 2], [3, 4], [5, 6]])
+            self.assertEqual((a + a).dtype, 'i4')
+            self.assertEqual((a - a).dtype, 'i4')
+            self.assertEqual((a * b).dtype, 'i4')
+            self.assertEqual(a * b, self.m1 * TestMatrix.make([[1, 2], [3, 4], [5, 6]]))
+            self.assertEqual(a.transpose().dtype, 'i4')
+            self.assertEqual(a.scale_by(3).dtype, 'i4')
+            self.assertEqual(a.scale_by(0.5).dtype, 'f8')
+            self.assertEqual(Matrix.gemm(a, b, alpha=2).dtype, 'i4')
+            self.assertEqual((a + Matrix(2, 3, dtype='i8')).dtype, 'i8')
+            self.assertEqual((a + Matrix(2, 3, dtype='f4')).dtype, 'f8')
+            self.assertIsNone((a + self.m2).dtype)
+        finally:
+            Matrix.use_numpy = True
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_backend(self):
+        a = Matrix(2, 3, dtype='i8')
+        b = Matrix(2, 3, dtype='i8')
+        c = Matrix(3, 5, dtype='i8')
+        TestMatrix.fill_matrix(a, [[1, 2, 3], [2, 6, 3]])
+        TestMatrix.fill_matrix(b, [[1, 1, 1], [1, 1, 1]])
+        TestMatrix.fill_matrix(c, [[1, 4, 5, 2, 6], [1, 2, 7, 3, 5], [2, 6, 4, 8, 1]])
+        self.assertEqual((a + b).dtype, 'i8')
+        self.assertEqual(a + b, self.m1 + self.m2)
+        self.assertEqual(a - b, self.m1 - self.m2)
+        self.assertEqual(a * c, self.m1 * self.m3)
+        self.assertEqual(a.scale_by(2), self.m1.scale_by(2))
+        self.assertEqual(a.transpose(), self.m1.transpose())
+        self.assertEqual(a.scale_by(0.5).dtype, 'f8')
+
+    def test_in_place_operators(self):
+        m = self.m1
+        m += self.m2
+        self.assertIs(m, self.m1)
+        self.assertEqual(m, TestMatrix.make([[2, 3, 4], [3, 7, 4]]))
+        m -= self.m2
+        m *= 3
+        self.assertIs(m, self.m1)
+        self.assertEqual(m, TestMatrix.make([[3, 6, 9], [6, 18, 9]]))
+
+    def test_transpose_in_place(self):
+        m = TestMatrix.make([[1, 2], [3, 4]])
+        m.transpose_in_place()
+        self.assertEqual(m, TestMatrix.make([[1, 3], [2, 4]]))
+        self.assertRaises(AssertionError, self.m1.transpose_in_place)
+
+    def test_out(self):
+        out = Matrix(3, 2)
+        self.assertIs(self.m1.transpose(out=out), out)
+        self.assertEqual(out, self.m1.transpose())
+        out = Matrix(2, 3)
+        self.assertIs(self.m1.scale_by(2, out=out), out)
+        self.assertEqual(out, TestMatrix.make([[2, 4, 6], [4, 12, 6]]))
+        self.assertRaises(AssertionError, self.m1.scale_by, 2, Matrix(3, 2))
+
+    def test_axpy(self):
+        self.m2.axpy(2, self.m1)
+        self.assertEqual(self.m2, TestMatrix.make([[3, 5, 7], [5, 13, 7]]))
+
+    def test_gemm(self):
+        product = self.m1 * self.m3
+        self.assertEqual(Matrix.gemm(self.m1, self.m3), product)
+        c = TestMatrix.make([[1] * 5, [2] * 5])
+        expected = product.scale_by(2) + c.scale_by(3)
+        self.assertIs(Matrix.gemm(self.m1, self.m3, alpha=2, beta=3, c=c, out=c), c)
+        self.assertEqual(c, expected)
+
+    def test_gemm_float_alpha(self):
+        a = Matrix(2, 3, dtype='i4')
+        b = Matrix(3, 2, dtype='i4')
+        TestMatrix.fill_matrix(a, [[1, 2, 3], [2, 6, 3]])
+        TestMatrix.fill_matrix(b, [[1, 2], [3, 4], [5, 6]])
+        expected = (self.m1 * TestMatrix.make([[1, 2], [3, 4], [5, 6]])).scale_by(0.5)
+        for use_numpy in (True, False):
+            Matrix.use_numpy = use_numpy
+            try:
+                result = Matrix.gemm(a, b, alpha=0.5)
+                self.assertEqual(result.dtype, 'f8')
+                self.assertEqual(result._to_flat(), expected._to_flat())
+            finally:
+                Matrix.use_numpy = True
 
+    def test_in_place_non_matrix(self):
+        m = self.m1
+        with self.assertRaises(TypeError):
+            m += 1
+        with self.assertRaises(TypeError):
+            m -= 1
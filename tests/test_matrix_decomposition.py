@@ -0,0 +1,76 @@
+from unittest import TestCase
+from src.data_structures import Matrix, LUDecomposition, CholeskyDecomposition, QRDecomposition
+
+
+class TestMatrixDecomposition(TestCase):
+
+    @staticmethod
+    def make(content: list[list]) -> Matrix:
+        m = Matrix(len(content), len(content[0]))
+        for i in range(m.num_rows):
+            for j in range(m.num_cols):
+                m[i, j] = content[i][j]
+        return m
+
+    def assertMatrixAlmostEqual(self, first: Matrix, second: Matrix) -> None:
+        self.assertEqual((first.num_rows, first.num_cols), (second.num_rows, second.num_cols))
+        for i in range(first.num_rows):
+            for j in range(first.num_cols):
+                self.assertAlmostEqual(first[i, j], second[i, j])
+
+    def setUp(self):
+        self.a = TestMatrixDecomposition.make([[0, 2, 1],
+                                               [4, 1, -1],
+                                               [2, 3, 5]])
+        self.spd = TestMatrixDecomposition.make([[4, 2, 2],
+                                                 [2, 5, 3],
+                                                 [2, 3, 6]])
+        self.b = TestMatrixDecomposition.make([[1, 0],
+                                               [2, 1],
+                                               [3, -1]])
+        self.identity = TestMatrixDecomposition.make([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+    def test_lu(self):
+        lu = LUDecomposition(self.a)
+        permuted = TestMatrixDecomposition.make([[self.a[p, j] for j in range(3)] for p in lu.permutation()])
+        self.assertMatrixAlmostEqual(lu.lower() * lu.upper(), permuted)
+        self.assertFalse(lu.is_singular)
+
+    def test_solve(self):
+        x = self.a.solve(self.b)
+        self.assertMatrixAlmostEqual(self.a * x, self.b)
+
+    def test_solve_reuses_factorization(self):
+        lu = self.a.lu()
+        self.a.solve(self.b)
+        self.assertIs(self.a.lu(), lu)
+        self.a[0, 0] = 1
+        self.assertIsNot(self.a.lu(), lu)
+        self.assertMatrixAlmostEqual(self.a * self.a.solve(self.b), self.b)
+
+    def test_det(self):
+        self.assertAlmostEqual(self.a.det(), -34)
+        self.assertEqual(TestMatrixDecomposition.make([[1, 2], [2, 4]]).det(), 0)
+
+    def test_inverse(self):
+        self.assertMatrixAlmostEqual(self.a * self.a.inverse(), self.identity)
+        self.assertRaises(AssertionError, TestMatrixDecomposition.make([[1, 2], [2, 4]]).inverse)
+
+    def test_cholesky(self):
+        cholesky = self.spd.cholesky()
+        self.assertMatrixAlmostEqual(cholesky.lower() * cholesky.lower().transpose(), self.spd)
+        self.assertMatrixAlmostEqual(self.spd * cholesky.solve(self.b), self.b)
+        self.assertAlmostEqual(cholesky.det(), self.spd.det())
+        self.assertRaises(AssertionError, CholeskyDecomposition, self.a)
+
+    def test_qr(self):
+        qr = self.a.qr()
+        self.assertMatrixAlmostEqual(qr.q() * qr.r(), self.a)
+        self.assertMatrixAlmostEqual(qr.q().transpose() * qr.q(), self.identity)
+        self.assertMatrixAlmostEqual(self.a * qr.solve(self.b), self.b)
+
+    def test_qr_least_squares(self):
+        # fit y = c0 + c1 x to points on the line y = 1 + 2x
+        a = TestMatrixDecomposition.make([[1, 0], [1, 1], [1, 2], [1, 3]])
+        y = TestMatrixDecomposition.make([[1], [3], [5], [7]])
+        self.assertMatrixAlmostEqual(QRDecomposition(a).solve(y), TestMatrixDecomposition.make([[1], [2]]))
@@ -0,0 +1,75 @@
+from unittest import TestCase
+from src.data_structures import Matrix, MatrixExpression
+from src.data_structures.matrix_expression import _chain_order
+
+
+class TestMatrixExpression(TestCase):
+
+    @staticmethod
+    def make(content: list[list]) -> Matrix:
+        m = Matrix(len(content), len(content[0]))
+        for i in range(m.num_rows):
+            for j in range(m.num_cols):
+                m[i, j] = content[i][j]
+        return m
+
+    def setUp(self):
+        self.a = TestMatrixExpression.make([[1, 2, 3], [2, 6, 3]])
+        self.b = TestMatrixExpression.make([[1, 1, 1], [1, 1, 1]])
+        self.c = TestMatrixExpression.make([[1, 4, 5], [1, 2, 7], [2, 6, 4], [3, 0, 1], [5, 5, 2]])
+
+    def test_lazy(self):
+        expression = self.a.lazy() + self.b
+        self.assertIsInstance(expression, MatrixExpression)
+        self.assertIsNone(expression._value)
+        self.assertEqual(expression[1, 1], 7)
+        self.assertIsNotNone(expression._value)
+
+    def test_evaluate_copies(self):
+        result = self.a.lazy().evaluate()
+        self.assertEqual(result, self.a)
+        result[0, 0] = 100
+        self.assertEqual(self.a[0, 0], 1)
+
+    def test_cache_invalidation(self):
+        expression = self.a.lazy() + self.b
+        self.assertEqual(expression[0, 0], 2)
+        self.b[0, 0] = 10
+        self.assertEqual(expression[0, 0], 11)
+        self.a += self.b
+        self.assertEqual(expression.evaluate(), self.a + self.b)
+
+    def test_matrix_on_the_left(self):
+        self.assertEqual(self.a + self.b.lazy(), self.a + self.b)
+        self.assertEqual(self.a - self.b.lazy().scale_by(2), self.a - self.b.scale_by(2))
+        self.assertEqual(self.c * self.a.lazy().transpose(), self.c * self.a.transpose())
+        self.assertIsInstance(self.a + self.b.lazy(), MatrixExpression)
+        self.assertTrue(self.a + self.b == self.a.lazy() + self.b)
+
+    def test_abstract(self):
+        self.assertRaises(TypeError, MatrixExpression, 2, 2)
+
+    def test_elementwise(self):
+        expression = (self.a.lazy() + self.b).scale_by(2) - self.a
+        self.assertEqual(expression.evaluate(), (self.a + self.b).scale_by(2) - self.a)
+
+    def test_transpose(self):
+        self.assertEqual(self.a.lazy().transpose().evaluate(), self.a.transpose())
+        self.assertEqual(self.a.lazy().transpose().transpose().evaluate(), self.a)
+        expression = (self.a.lazy().transpose() + self.b.transpose()).transpose()
+        self.assertEqual(expression.evaluate(), self.a + self.b)
+
+    def test_product(self):
+        expression = (self.a.lazy() + self.b).scale_by(2) * self.c.transpose()
+        self.assertEqual(expression.evaluate(), (self.a + self.b).scale_by(2) * self.c.transpose())
+        expression = (self.a.lazy() * self.c.transpose()).transpose()
+        self.assertEqual(expression.evaluate(), (self.a * self.c.transpose()).transpose())
+
+    def test_chain(self):
+        expression = self.c.lazy() * self.a.transpose() * self.b * self.c.transpose()
+        self.assertEqual(expression.evaluate(), self.c * self.a.transpose() * self.b * self.c.transpose())
+
+    def test_chain_order(self):
+        # (10x100) (100x5) (5x50): ((A1 A2) A3) costs 7500, (A1 (A2 A3)) costs 75000
+        self.assertEqual(_chain_order([10, 100, 5, 50])[0][2], 1)
+        self.assertEqual(_chain_order([50, 5, 100, 10])[0][2], 0)
@@ -0,0 +1,45 @@
+from unittest import TestCase
+from src.data_structures import Matrix
+from src.data_structures.parallel_product import parallel_product
+
+
+class TestParallelProduct(TestCase):
+
+    @staticmethod
+    def make(num_rows: int, num_cols: int, seed: int, dtype: str = None) -> Matrix:
+        m = Matrix(num_rows, num_cols, dtype)
+        for i in range(num_rows):
+            for j in range(num_cols):
+                m[i, j] = (i * seed + j * 7) % 11 - 5
+        return m
+
+    def setUp(self):
+        self.a = TestParallelProduct.make(13, 6, 3)
+        self.b = TestParallelProduct.make(6, 9, 5)
+
+    def test_int_product(self):
+        self.assertEqual(parallel_product(self.a, self.b, num_workers=2, threshold=0), self.a * self.b)
+
+    def test_float_and_typed_product(self):
+        a = self.a.scale_by(0.5)
+        b = TestParallelProduct.make(6, 9, 5, dtype='i4')
+        self.assertEqual(parallel_product(a, b, num_workers=2, threshold=0), a * b)
+
+    def test_serial_fallback(self):
+        self.assertEqual(parallel_product(self.a, self.b, num_workers=2), self.a * self.b)
+
+    def test_exact_large_ints(self):
+        for large in (2 ** 70 + 1, -2 ** 63 - 1):
+            a = Matrix(2, 2)
+            a._store_flat([large] * 4)
+            self.assertEqual(parallel_product(a, a, num_workers=2, threshold=0)._to_flat(), [2 * large * large] * 4)
+        # ints above 2^53 would be rounded if shared as doubles together with the floats
+        a = Matrix(2, 2)
+        a._store_flat([2 ** 53 + 1, 0.5, 1, 2])
+        self.assertEqual(parallel_product(a, a, num_workers=2, threshold=0), a * a)
+
+    def test_matrix_mul(self):
+        a = TestParallelProduct.make(13, 6, 3)
+        a.parallel_workers = 2
+        a.parallel_threshold = 0
+        self.assertEqual(a * self.b, self.a * self.b)
@@ -0,0 +1,14 @@
+from unittest import TestCase
+from src.data_structures import Set
+
+
+class TestSet(TestCase):
+    def test_iteration(self):
+        set_ = Set()
+        for item in (3, 1, 2):
+            set_.add(item)
+        self.assertEqual(list(set_), [3, 1, 2])
+        self.assertEqual(list(reversed(set_)), [2, 1, 3])
+        with self.assertRaises(RuntimeError):
+            for item in set_:
+                set_.add(item + 10)
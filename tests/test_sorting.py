@@ -0,0 +1,146 @@
+import random
+from unittest import TestCase, skipIf
+from src.algorithms import intro_sort, merge_sort, counting_sort, lsd_radix_sort, msd_radix_sort, bucket_sort, sort
+from src.algorithms import sorting
+from src.algorithms.sorting import numpy
+from src.data_structures import Array, Vector, GapVector
+
+
+class TestSorting(TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.inputs = [[], [1], [2, 1], list(range(100)), list(range(100, 0, -1)), [3] * 50,
+                       [random.randrange(10) for _ in range(500)], [random.random() for _ in range(1000)],
+                       list(range(50)) + list(range(50, 0, -1)) + list(range(30))]
+
+    def test_list(self):
+        for sort in (intro_sort, merge_sort):
+            for items in self.inputs:
+                collection = list(items)
+                sort(collection)
+                self.assertEqual(collection, sorted(items))
+                sort(collection, reverse=True)
+                self.assertEqual(collection, sorted(items, reverse=True))
+
+    def test_key(self):
+        for sort in (intro_sort, merge_sort):
+            words = ["pear", "fig", "banana", "kiwi", "apple", "plum"]
+            sort(words, key=len)
+            self.assertEqual([len(word) for word in words], [3, 4, 4, 4, 5, 6])
+            # the items are never compared, only their keys
+            items = [{"id": i % 7} for i in range(100)]
+            sort(items, key=lambda item: item["id"], reverse=True)
+            self.assertEqual([item["id"] for item in items], sorted([i % 7 for i in range(100)], reverse=True))
+
+    def test_stability(self):
+        pairs = [(random.randrange(5), i) for i in range(300)]
+        for reverse in (False, True):
+            collection = list(pairs)
+            merge_sort(collection, key=lambda pair: pair[0], reverse=reverse)
+            self.assertEqual(collection, sorted(pairs, key=lambda pair: pair[0], reverse=reverse))
+
+    def test_containers(self):
+        items = [random.randrange(-1000, 1000) for _ in range(300)]
+        for sort in (intro_sort, merge_sort):
+            array = Array(len(items), dtype='i4')
+            array[:] = items
+            sort(array)
+            self.assertEqual(list(array), sorted(items))
+            for vector in (Vector(), GapVector()):
+                for item in items:
+                    vector.append(item)
+                sort(vector, reverse=True)
+                self.assertEqual(list(vector), sorted(items, reverse=True))
+
+    def test_integer_sorts(self):
+        items = [random.randrange(-2 ** 31, 2 ** 31) for _ in range(2000)] + [0, 0, -1]
+        for distribution_sort in (lsd_radix_sort, msd_radix_sort, sort):
+            for reverse in (False, True):
+                collection = list(items)
+                distribution_sort(collection, reverse=reverse)
+                self.assertEqual(collection, sorted(items, reverse=reverse))
+        dense = [random.randrange(-50, 50) for _ in range(1000)]
+        for distribution_sort in (counting_sort, lsd_radix_sort, msd_radix_sort, sort):
+            for bits in (3, 8):
+                vector = Vector()
+                for item in dense:
+                    vector.append(item)
+                if distribution_sort in (lsd_radix_sort, msd_radix_sort):
+                    distribution_sort(vector, reverse=True, bits=bits)
+                else:
+                    distribution_sort(vector, reverse=True)
+                self.assertEqual(list(vector), sorted(dense, reverse=True))
+        with self.assertRaises(AssertionError):
+            counting_sort([1, 2.5])
+
+    def test_distribution_stability(self):
+        pairs = [(random.randrange(-20, 20), i) for i in range(1000)]
+        for distribution_sort in (counting_sort, lsd_radix_sort, msd_radix_sort, bucket_sort, sort):
+            for reverse in (False, True):
+                collection = list(pairs)
+                distribution_sort(collection, key=lambda pair: pair[0], reverse=reverse)
+                self.assertEqual(collection, sorted(pairs, key=lambda pair: pair[0], reverse=reverse))
+
+    def test_float_sorts(self):
+        items = [random.uniform(-10, 10) for _ in range(1000)] + [3.0, 3.0]
+        for distribution_sort in (bucket_sort, sort):
+            collection = list(items)
+            distribution_sort(collection)
+            self.assertEqual(collection, sorted(items))
+        collection = list(items)
+        bucket_sort(collection, reverse=True, num_buckets=7)
+        self.assertEqual(collection, sorted(items, reverse=True))
+        infinite = items[:300] + [float('inf'), float('-inf'), 1e308, -1e308]
+        for distribution_sort in (bucket_sort, sort):
+            for reverse in (False, True):
+                collection = list(infinite)
+                distribution_sort(collection, reverse=reverse)
+                self.assertEqual(collection, sorted(infinite, reverse=reverse))
+            collection = [1.0] * 300 + [float('nan'), float('-inf')]
+            distribution_sort(collection, reverse=True)
+            self.assertEqual(collection[-1], float('-inf'))
+            self.assertEqual(sum(x != x for x in collection), 1)
+        collection = [10 ** 400, -10 ** 400, 0.5]
+        bucket_sort(collection)
+        self.assertEqual(collection, [-10 ** 400, 0.5, 10 ** 400])
+
+    def test_sort_fallback(self):
+        words = [random.choice(["pear", "fig", "kiwi"]) + str(i % 3) for i in range(500)]
+        for reverse in (False, True):
+            collection = list(words)
+            sort(collection, reverse=reverse)
+            self.assertEqual(collection, sorted(words, reverse=reverse))
+        collection = list(words)
+        sort(collection, key=len, reverse=True)
+        self.assertEqual(collection, sorted(words, key=len, reverse=True))
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_backend(self):
+        for dtype, items in (('i1', [random.randrange(-128, 128) for _ in range(500)]),
+                             ('u8', [random.randrange(2 ** 64) for _ in range(500)]),
+                             ('i8', [random.randrange(-2 ** 63, 2 ** 63) for _ in range(500)]),
+                             ('f4', [float(random.randrange(1000)) for _ in range(500)])):
+            for reverse in (False, True):
+                for use_numpy in (True, False):
+                    sorting.use_numpy = use_numpy
+                    array = Array.from_iterable(items, dtype)
+                    sort(array, reverse=reverse)
+                    self.assertEqual(list(array), sorted(items, reverse=reverse))
+        # the pure Python sort allocates 2^bits buckets, so only NumPy sorts by digits as wide as the keys
+        for bits, numpy_modes in ((3, (True, False)), (12, (True, False)), (16, (True, False)), (64, (True,)),
+                                  (100, (True,))):
+            for dtype, items in (('i2', [random.randrange(-2 ** 15, 2 ** 15) for _ in range(500)]),
+                                 ('u8', [random.randrange(2 ** 64) for _ in range(500)])):
+                for use_numpy in numpy_modes:
+                    sorting.use_numpy = use_numpy
+                    array = Array.from_iterable(items, dtype)
+                    lsd_radix_sort(array, bits=bits)
+                    self.assertEqual(list(array), sorted(items))
+        # 0.0 and -0.0 are equal, so sorting in descending order must keep them in their order
+        items = [0.0, -0.0, 1.0] * 100
+        for use_numpy in (True, False):
+            sorting.use_numpy = use_numpy
+            array = Array.from_iterable(items, 'f8')
+            sort(array, reverse=True)
+            self.assertEqual([str(x) for x in array], [str(x) for x in sorted(items, reverse=True)])
+        sorting.use_numpy = True
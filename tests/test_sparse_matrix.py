@@ -0,0 +1,78 @@
+from unittest import TestCase
+from src.data_structures import Matrix, COOMatrix, CSRMatrix, CSCMatrix
+
+
+class TestSparseMatrix(TestCase):
+
+    @staticmethod
+    def dense(content: list[list]) -> Matrix:
+        m = Matrix(len(content), len(content[0]))
+        for i in range(m.num_rows):
+            for j in range(m.num_cols):
+                m[i, j] = content[i][j]
+        return m
+
+    def setUp(self):
+        self.d1 = TestSparseMatrix.dense([[1, 0, 0, 2],
+                                          [0, 0, 3, 0],
+                                          [0, 4, 0, 0]])
+        self.d2 = TestSparseMatrix.dense([[0, 0, 0, -2],
+                                          [5, 0, 0, 0],
+                                          [0, 0, 1, 0]])
+        self.d3 = TestSparseMatrix.dense([[1, 0],
+                                          [0, 2],
+                                          [3, 0],
+                                          [0, 4]])
+
+    def test_coo_construction(self):
+        coo = COOMatrix(2, 3)
+        coo[0, 1] = 4
+        coo[1, 2] = 1
+        coo[0, 1] = 2
+        self.assertEqual(coo.nnz, 3)
+        self.assertEqual(coo[0, 1], 6)
+        csr = coo.to_csr()
+        self.assertEqual(csr.nnz, 2)
+        self.assertEqual(csr[0, 1], 6)
+        self.assertEqual(csr[1, 1], 0)
+        self.assertEqual(coo.to_dense(), TestSparseMatrix.dense([[0, 6, 0], [0, 0, 1]]))
+        self.assertRaises(AssertionError, coo.__setitem__, (2, 0), 1)
+
+    def test_conversions(self):
+        csr = CSRMatrix.from_dense(self.d1)
+        csc = CSCMatrix.from_dense(self.d1)
+        self.assertEqual(csr.nnz, 4)
+        self.assertEqual(csr.to_dense(), self.d1)
+        self.assertEqual(csc.to_dense(), self.d1)
+        self.assertEqual(csc.to_csr(), csr)
+        self.assertEqual(csr.to_csc(), csc)
+        self.assertEqual(csr.to_coo().to_dense(), self.d1)
+        self.assertEqual(csc[2, 1], 4)
+
+    def test_scale_by(self):
+        for fmt in [COOMatrix, CSRMatrix, CSCMatrix]:
+            self.assertEqual(fmt.from_dense(self.d1).scale_by(3).to_dense(), self.d1.scale_by(3))
+
+    def test_transpose(self):
+        for fmt in [COOMatrix, CSRMatrix, CSCMatrix]:
+            self.assertEqual(fmt.from_dense(self.d1).transpose().to_dense(), self.d1.transpose())
+
+    def test_add_sub(self):
+        for fmt1 in [COOMatrix, CSRMatrix, CSCMatrix]:
+            for fmt2 in [COOMatrix, CSRMatrix, CSCMatrix]:
+                s1, s2 = fmt1.from_dense(self.d1), fmt2.from_dense(self.d2)
+                self.assertEqual((s1 + s2).to_dense(), self.d1 + self.d2)
+                self.assertEqual((s1 - s2).to_dense(), self.d1 - self.d2)
+        self.assertEqual((CSRMatrix.from_dense(self.d1) - CSRMatrix.from_dense(self.d1)).nnz, 0)
+
+    def test_sparse_sparse_product(self):
+        for fmt1 in [COOMatrix, CSRMatrix, CSCMatrix]:
+            for fmt2 in [COOMatrix, CSRMatrix, CSCMatrix]:
+                product = fmt1.from_dense(self.d1) * fmt2.from_dense(self.d3)
+                self.assertEqual(product.to_dense(), self.d1 * self.d3)
+
+    def test_sparse_dense_product(self):
+        for fmt in [COOMatrix, CSRMatrix, CSCMatrix]:
+            self.assertEqual(fmt.from_dense(self.d1) * self.d3, self.d1 * self.d3)
+            dense = self.d2.transpose()
+            self.assertEqual(dense * fmt.from_dense(self.d1), dense * self.d1)
@@ -0,0 +1,56 @@
+from unittest import TestCase
+from src.data_structures import TreeMap
+
+
+class TestTreeMap(TestCase):
+    def setUp(self) -> None:
+        self.map: TreeMap[int, str] = TreeMap()
+        for key in [50, 20, 80, 10, 30, 70, 90, 60]:
+            self.map.add(key, str(key))
+
+    def test_len(self):
+        self.assertEqual(len(self.map), 8)
+
+    def test_add(self):
+        self.assertTrue(self.map.add(40, "40"))
+        self.assertFalse(self.map.add(40, "forty"))
+        self.assertEqual(self.map.value_of(40), "forty")
+        self.assertEqual(len(self.map), 9)
+
+    def test_remove(self):
+        self.map.remove(50)
+        self.map.remove(10)
+        self.assertNotIn(50, self.map)
+        self.assertEqual(len(self.map), 6)
+        self.assertEqual(list(self.map), [20, 30, 60, 70, 80, 90])
+        self.assertRaises(AssertionError, self.map.remove, 50)
+        self.assertRaises(AssertionError, self.map.value_of, 50)
+
+    def test_iter_sorted(self):
+        self.assertEqual(list(self.map), [10, 20, 30, 50, 60, 70, 80, 90])
+
+    def test_min_max(self):
+        self.assertEqual(self.map.min(), 10)
+        self.assertEqual(self.map.max(), 90)
+        self.assertRaises(AssertionError, TreeMap().min)
+
+    def test_floor_ceiling(self):
+        self.assertEqual(self.map.floor(55), 50)
+        self.assertEqual(self.map.floor(50), 50)
+        self.assertIsNone(self.map.floor(5))
+        self.assertEqual(self.map.ceiling(55), 60)
+        self.assertIsNone(self.map.ceiling(95))
+
+    def test_range(self):
+        self.assertEqual(list(self.map.range(20, 70)), [20, 30, 50, 60])
+        self.assertEqual(list(self.map.range(91, 100)), [])
+
+    def test_balance(self):
+        tree_map = TreeMap()
+        for i in range(1024):
+            tree_map.add(i, i)
+        self.assertLessEqual(tree_map._root.height, 15)
+        for i in range(0, 1024, 2):
+            tree_map.remove(i)
+        self.assertEqual(list(tree_map), list(range(1, 1024, 2)))
+        self.assertLessEqual(tree_map._root.height, 14)
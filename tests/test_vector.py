@@ -60,8 +60,76 @@ class TestVector(TestCase):
         self.assertEqual(rem1, 4)
         self.assertEqual(rem2, 3)
         self.assertEqual(len(self.vector), 3)
-        self.assertEqual(self.vector._physical_size, 4)
+        # the capacity is halved only when less than a quarter of it is used
+        self.assertEqual(self.vector._physical_size, 8)
         self.assertEqual(self.vector, actual_vector)
+        self.vector.remove(0)
+        self.vector.remove(0)
+        self.assertEqual(self.vector._physical_size, 4)
+        self.assertEqual(self.vector[0], 5)
+
+    def test_insert_shifts_items(self):
+        for i in range(4):
+            self.vector.append(i)
+        self.vector.insert(0, -1)
+        self.vector.insert(2, 10)
+        self.assertEqual([x for x in self.vector], [-1, 0, 10, 1, 2, 3])
+
+    def test_pop_hysteresis(self):
+        for i in range(8):
+            self.vector.append(i)
+        self.assertEqual(self.vector._physical_size, 8)
+        self.vector.append(8)
+        array = self.vector._array
+        self.assertEqual(self.vector.pop(), 8)
+        # appending and popping at the boundary does not reallocate
+        for i in range(10):
+            self.vector.append(8)
+            self.assertEqual(self.vector.pop(), 8)
+        self.assertIs(self.vector._array, array)
+        self.assertEqual(self.vector._physical_size, 16)
+        self.assertEqual([self.vector.pop() for _ in range(5)], [7, 6, 5, 4, 3])
+        self.assertEqual(self.vector._physical_size, 8)
+        self.assertRaises(AssertionError, Vector().pop)
+
+    def test_growth_factor(self):
+        vector = Vector(growth_factor=1.5)
+        for i in range(5):
+            vector.append(i)
+        self.assertEqual(vector._physical_size, 6)
+        self.assertRaises(AssertionError, Vector, 1)
+
+    def test_reserve_shrink_to_fit(self):
+        self.vector.reserve(100)
+        self.assertEqual(self.vector.capacity, 100)
+        for i in range(3):
+            self.vector.append(i)
+        self.vector.pop()
+        self.assertEqual(self.vector.capacity, 100)
+        self.vector.shrink_to_fit()
+        self.assertEqual(self.vector.capacity, 2)
+        self.assertEqual([x for x in self.vector], [0, 1])
+
+    def test_iteration(self):
+        for i in range(3000):
+            self.vector.append(i)
+        self.assertEqual(list(self.vector), list(range(3000)))
+        self.assertEqual(list(reversed(self.vector)), list(range(2999, -1, -1)))
+        with self.assertRaises(RuntimeError):
+            for item in self.vector:
+                if item == 10:
+                    self.vector.remove(0)
+        iterator = iter(self.vector)
+        self.vector.append(0)
+        self.assertRaises(RuntimeError, next, iterator)
+
+    def test_iteration_modified_at_last_item(self):
+        for i in range(3):
+            self.vector.append(i)
+        with self.assertRaises(RuntimeError):
+            for item in self.vector:
+                if item == 2:
+                    self.vector.append(3)
 
     def test_index_of(self):
         self.vector.append(1)
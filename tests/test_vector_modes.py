@@ -0,0 +1,88 @@
+import random
+from unittest import TestCase
+from src.data_structures import GapVector, RopeVector
+
+
+class TestVectorModes(TestCase):
+    """The gap buffer and the rope must behave like a list under any sequence of edits."""
+
+    def check_random_edits(self, vector, num_edits=2000):
+        rng = random.Random(7)
+        expected = []
+        for _ in range(num_edits):
+            operation = rng.random()
+            if operation < 0.4 or not expected:
+                vector.append(len(expected))
+                expected.append(len(expected))
+            elif operation < 0.7:
+                # clustered edits around a cursor, and a few far away
+                index = rng.randrange(len(expected)) if rng.random() < 0.2 else len(expected) // 2
+                vector.insert(index, -index)
+                expected.insert(index, -index)
+            elif operation < 0.95:
+                index = rng.randrange(len(expected))
+                self.assertEqual(vector.remove(index), expected.pop(index))
+            else:
+                self.assertEqual(vector.pop(), expected.pop())
+            self.assertEqual(len(vector), len(expected))
+        self.assertEqual(list(vector), expected)
+        self.assertEqual(list(reversed(vector)), expected[::-1])
+        self.assertEqual([vector[i] for i in range(len(vector))], expected)
+        if expected:
+            vector[0] = 'first'
+            self.assertEqual(vector[0], 'first')
+
+    def test_gap_vector(self):
+        self.check_random_edits(GapVector())
+
+    def test_rope_vector(self):
+        self.check_random_edits(RopeVector())
+
+    def test_gap_moves(self):
+        vector = GapVector()
+        for i in range(10):
+            vector.append(i)
+        vector.insert(2, 'a')
+        vector.insert(3, 'b')
+        self.assertEqual(vector._gap_start, 4)
+        vector.remove(9)
+        self.assertEqual(list(vector), [0, 1, 'a', 'b', 2, 3, 4, 5, 6, 8, 9])
+        self.assertEqual(vector.index_of(8), 9)
+        self.assertEqual(list(vector.sub_vector(1, 3)), [1, 'a', 'b'])
+
+    def test_rope_balance(self):
+        vector = RopeVector()
+        for i in range(5000):
+            vector.append(i)
+        for i in range(0, 5000, 2):
+            vector.insert(i, -i)
+        self.assertLessEqual(vector._root.height, 12)
+        self.assertEqual(vector[4], -4)
+        self.assertEqual(vector[5], 2)
+        for _ in range(len(vector)):
+            vector.remove(0)
+        self.assertIsNone(vector._root)
+        self.assertRaises(AssertionError, vector.pop)
+
+    def test_rope_capacity_after_removals(self):
+        vector = RopeVector()
+        for i in range(6400):
+            vector.append(i)
+        rng = random.Random(3)
+        expected = list(range(6400))
+        while len(expected) > 300:
+            index = rng.randrange(len(expected))
+            self.assertEqual(vector.remove(index), expected.pop(index))
+        self.assertEqual(list(vector), expected)
+        # every leaf keeps at least a quarter of its capacity
+        self.assertLessEqual(vector.capacity, 4 * len(vector))
+        self.assertEqual(vector._growth_factor, 2.0)
+
+    def test_concurrent_modification(self):
+        for vector in (GapVector(), RopeVector()):
+            vector.append(1)
+            vector.append(2)
+            iterator = iter(vector)
+            next(iterator)
+            vector.insert(0, 0)
+            self.assertRaises(RuntimeError, next, iterator)